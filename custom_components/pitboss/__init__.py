@@ -6,11 +6,14 @@ https://github.com/dknowles2/ha-pitboss
 """
 
 from asyncio import Condition, timeout
+from dataclasses import dataclass
+from functools import partial
+from time import monotonic
 
 from bleak.backends.device import BLEDevice
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth.match import LOCAL_NAME
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.bluetooth.match import CONNECTABLE, LOCAL_NAME
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import (
     CONF_DEVICE_ID,
     CONF_HOST,
@@ -19,26 +22,42 @@ from homeassistant.const import (
     CONF_PROTOCOL,
     Platform,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import ConfigType
-from pytboss import api, ble, grills, http, wss
+from pytboss import api, ble, grills, http
 from pytboss.exceptions import InvalidGrill
 from pytboss.transport import Transport
 
+from .advertisement import AdvertisementTracker
 from .const import (
+    CONF_FALLBACK_PROTOCOLS,
     DEFAULT_PROTOCOL,
     DOMAIN,
+    LOCAL_HTTP_CONNECTIONS,
     LOGGER,
     MANUFACTURER,
     PROTOCOL_BLE,
     PROTOCOL_LOCAL,
     PROTOCOL_WSS,
 )
-from .coordinator import PitBossDataUpdateCoordinator
-from .services import async_register_services
+from .coordinator import PitBossDataUpdateCoordinator, held_targets_store
+from .failover import FailoverTransport, Member
+from .fleet import fleet_for
+from .gate import PriorityGate
+from .local import create_local_session
+from .relay import SharedRelayConnection, relay_for
+from .services import (
+    async_index_entry,
+    async_register_services,
+    async_unindex_entry,
+)
+
+# Where the wake watchers of entries waiting for their grill live in
+# `hass.data`, by entry id. Beside the coordinators rather than among them.
+DATA_WAKE_WATCHERS = f"{DOMAIN}_wake_watchers"
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -53,13 +72,30 @@ PLATFORMS: list[Platform] = [
 
 
 async def _connect_ble(
-    hass: HomeAssistant, entry: ConfigEntry, device_id: str
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    device_id: str,
+    advertisements: AdvertisementTracker,
+    wait: bool = True,
 ) -> ble.BleConnection:
+    """A Bluetooth connection kept up by the grill's advertisements.
+
+    With `wait`, not returned until the grill has been connected to.
+    Without, returned at once -- for a grill with other transports to fall
+    back on, whose setup should not wait on this one.
+    """
     conn = ble.BleConnection(None, loop=hass.loop)  # type: ignore
     ready = Condition()
 
-    async def reset_device(ble_device: BLEDevice):
-        await conn.reset_device(ble_device)
+    async def reset_device(source: str, ble_device: BLEDevice, migrate: bool):
+        try:
+            if migrate:
+                # pytboss keeps a connection to the same address as it is,
+                # whichever source the new device came through.
+                await conn.disconnect()
+            await conn.reset_device(ble_device)
+        finally:
+            advertisements.reconnect_done(source, conn.is_connected())
         async with ready:
             ready.notify_all()
 
@@ -68,10 +104,28 @@ async def _connect_ble(
         service_info: bluetooth.BluetoothServiceInfoBleak,
         change: bluetooth.BluetoothChange,
     ):
-        LOGGER.debug("Bluetooth device detected: %s (%s)", service_info, change)
-        if conn.is_connected():
+        # Runs for every advertisement every proxy hears; see
+        # `AdvertisementTracker` for why it does next to nothing.
+        advertisements.record(service_info)
+        connected = conn.is_connected()
+        if (connected and not advertisements.degraded) or (
+            not advertisements.claim_reconnect()
+        ):
             return
-        entry.async_create_task(hass, reset_device(service_info.device))
+        if (choice := advertisements.choose(hass, connected)) is None:
+            if connected:
+                # Nowhere better to move the link to.
+                advertisements.withdraw_reconnect()
+                return
+            choice = (service_info.source, service_info.device)
+        source, ble_device = choice
+        LOGGER.debug(
+            "%s %s via %s",
+            "Moving the link to" if connected else "Reconnecting to",
+            device_id,
+            source,
+        )
+        entry.async_create_task(hass, reset_device(source, ble_device, connected))
 
     entry.async_on_unload(
         bluetooth.async_register_callback(
@@ -82,6 +136,8 @@ async def _connect_ble(
         )
     )
 
+    if not wait:
+        return conn
     try:
         async with timeout(30):
             async with ready:
@@ -92,6 +148,176 @@ async def _connect_ble(
     return conn
 
 
+async def _async_transport(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    protocol: str,
+    advertisements: AdvertisementTracker | None,
+    *,
+    wait: bool = True,
+) -> Transport:
+    """The transport for one protocol. See `_connect_ble` for `wait`."""
+    device_id = entry.data[CONF_DEVICE_ID]
+    if protocol == PROTOCOL_WSS:
+        # Every cloud grill opens its socket through the one relay manager,
+        # so that they learn of an outage -- and of its end -- together.
+        relay = relay_for(hass)
+        conn = SharedRelayConnection(
+            relay, device_id, session=async_get_clientsession(hass), loop=hass.loop
+        )
+        relay.add(entry.entry_id, conn)
+        entry.async_on_unload(partial(relay.remove, entry.entry_id, conn))
+        return conn
+    if protocol == PROTOCOL_LOCAL:
+        # An entry set up over another protocol keeps the address of its
+        # local fallback in its options.
+        host = entry.data.get(CONF_HOST) or entry.options[CONF_HOST]
+        session = create_local_session()
+        entry.async_on_unload(session.close)
+        return http.HttpConnection(host, session=session, loop=hass.loop)
+    if protocol == PROTOCOL_BLE:
+        assert advertisements is not None
+        return await _connect_ble(hass, entry, device_id, advertisements, wait=wait)
+    raise ValueError(f"Unknown protocol: {protocol}")
+
+
+def _call_limit(protocol: str) -> int | None:
+    """How many calls a transport may carry at once, if it is limited.
+
+    One GATT request at a time over Bluetooth, and a few over a local
+    board's web server; the relay takes whatever it is sent.
+    """
+    if protocol == PROTOCOL_BLE:
+        return 1
+    if protocol == PROTOCOL_LOCAL:
+        return LOCAL_HTTP_CONNECTIONS
+    return None
+
+
+@dataclass(slots=True)
+class _WakeWatch:
+    unsubs: list[CALLBACK_TYPE]
+    woke_at: float | None = None
+
+    def stop(self) -> None:
+        while self.unsubs:
+            self.unsubs.pop()()
+
+
+@callback
+def _watch_for_wake(hass: HomeAssistant, entry: ConfigEntry, device_id: str) -> None:
+    """Set the entry up again the moment its sleeping grill advertises.
+
+    A Bluetooth grill that is off does not advertise, so setup gives up
+    with `ConfigEntryNotReady` and Home Assistant retries on a backoff that
+    grows to minutes -- minutes of a lit grill with no entities. The
+    callback `_connect_ble` registered went with the failed setup, so this
+    one is registered outside it and kept until the grill is heard or the
+    entry's next setup starts. Same matcher and scanning mode as that one:
+    the name a grill advertises may only be in its scan response.
+
+    Not with `entry.async_on_unload`, which is what would normally tie it to
+    the entry: Home Assistant runs those callbacks as soon as a setup raises
+    `ConfigEntryNotReady`, which would drop the watcher the moment it was
+    made. It follows the entry's state instead, and goes as soon as the
+    entry leaves setup retry any other way than by setting up again --
+    unloaded, disabled, removed -- so no entry that is gone can be
+    reloaded by it.
+    """
+    watchers: dict[str, _WakeWatch] = hass.data.setdefault(DATA_WAKE_WATCHERS, {})
+
+    @callback
+    def _woke(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        if (watch := watchers.get(entry.entry_id)) is None or watch.woke_at:
+            return
+        watch.stop()
+        if entry.state is not ConfigEntryState.SETUP_RETRY:
+            watchers.pop(entry.entry_id, None)
+            return
+        LOGGER.debug("%s is advertising; setting it up now", device_id)
+        watch.woke_at = monotonic()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    @callback
+    def _state_changed() -> None:
+        if entry.state in (
+            ConfigEntryState.SETUP_RETRY,
+            ConfigEntryState.SETUP_IN_PROGRESS,
+        ):
+            return
+        # Not from in here: Home Assistant is iterating over the entry's
+        # state listeners, this one among them.
+        hass.loop.call_soon(_stop, watch)
+
+    @callback
+    def _stop(watch: _WakeWatch) -> None:
+        # This watcher, not one a later setup has made since.
+        if watchers.get(entry.entry_id) is watch:
+            _stop_watching(hass, entry)
+
+    _stop_watching(hass, entry)
+    watchers[entry.entry_id] = watch = _WakeWatch(
+        [
+            bluetooth.async_register_callback(
+                hass,
+                _woke,
+                bluetooth.BluetoothCallbackMatcher({LOCAL_NAME: device_id}),
+                bluetooth.BluetoothScanningMode.ACTIVE,
+            ),
+            entry.async_on_state_change(_state_changed),
+        ]
+    )
+
+
+@callback
+def _stop_watching(hass: HomeAssistant, entry: ConfigEntry) -> float | None:
+    """Drop the entry's wake watcher. When the grill woke, if it has."""
+    if (
+        watch := hass.data.get(DATA_WAKE_WATCHERS, {}).pop(entry.entry_id, None)
+    ) is None:
+        return None
+    watch.stop()
+    return watch.woke_at
+
+
+@callback
+def _watch_presence(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    device_id: str,
+    coordinator: PitBossDataUpdateCoordinator,
+) -> None:
+    """Tell the coordinator whenever the grill is heard over Bluetooth.
+
+    For a grill not connected to over Bluetooth: its advertisements say
+    whether it is powered without a round trip; see
+    `PitBossDataUpdateCoordinator.heard_nearby`. Passive, and from any
+    source, connectable or not -- nothing here connects, and the grill's
+    name is remembered from whichever scan first returned it.
+    """
+
+    @callback
+    def _heard(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        coordinator.heard_nearby()
+
+    entry.async_on_unload(
+        bluetooth.async_register_callback(
+            hass,
+            _heard,
+            bluetooth.BluetoothCallbackMatcher(
+                {LOCAL_NAME: device_id, CONNECTABLE: False}
+            ),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+    )
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the integration.
 
@@ -108,20 +334,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_id = entry.data[CONF_DEVICE_ID]
     model = entry.data[CONF_MODEL]
     password = entry.data.get(CONF_PASSWORD, "")
+    woke_at = _stop_watching(hass, entry)
     conn: Transport
+    advertisements: AdvertisementTracker | None = None
+    ble_conn: Transport | None = None
 
-    if (protocol := entry.data.get(CONF_PROTOCOL, DEFAULT_PROTOCOL)) == PROTOCOL_WSS:
-        conn = wss.WebSocketConnection(
-            device_id, session=async_get_clientsession(hass), loop=hass.loop
-        )
-    elif protocol == PROTOCOL_LOCAL:
-        conn = http.HttpConnection(
-            entry.data[CONF_HOST], session=async_get_clientsession(hass), loop=hass.loop
-        )
-    elif protocol == PROTOCOL_BLE:
-        conn = await _connect_ble(hass, entry, device_id)
+    # The protocol the entry was set up with first, then any the user has
+    # chosen to fall back on, in the order they chose them.
+    protocols = [entry.data.get(CONF_PROTOCOL, DEFAULT_PROTOCOL)]
+    protocols += [
+        fallback
+        for fallback in entry.options.get(CONF_FALLBACK_PROTOCOLS, [])
+        if fallback not in protocols
+    ]
+    if PROTOCOL_BLE in protocols:
+        advertisements = AdvertisementTracker()
+    if len(protocols) == 1:
+        try:
+            conn = await _async_transport(hass, entry, protocols[0], advertisements)
+        except ConfigEntryNotReady:
+            _watch_for_wake(hass, entry, device_id)
+            raise
+        if protocols[0] == PROTOCOL_BLE:
+            ble_conn = conn
     else:
-        raise ValueError(f"Unknown protocol: {protocol}")
+        # Nothing waits for Bluetooth here: the first poll goes over
+        # whichever transport connects, and the grill's advertisements bring
+        # Bluetooth up whenever it is in range.
+        members = []
+        for protocol in protocols:
+            transport = await _async_transport(
+                hass, entry, protocol, advertisements, wait=False
+            )
+            if protocol == PROTOCOL_BLE:
+                ble_conn = transport
+            members.append(
+                Member(
+                    protocol,
+                    transport,
+                    reconnect_on_use=protocol == PROTOCOL_LOCAL,
+                    gate=PriorityGate(_call_limit(protocol)),
+                )
+            )
+        conn = FailoverTransport(members, loop=hass.loop)
 
     # The prefix the grill advertises names its control board, and a few
     # models were sold on two board generations that do not parse alike.
@@ -165,29 +420,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         pitboss,
         # HTTP is request/response: no background reconnect exists, so the
         # poll loop has to be the one to re-establish a dropped grill.
-        reconnect_on_poll=protocol == PROTOCOL_LOCAL,
+        reconnect_on_poll=PROTOCOL_LOCAL in protocols,
+        # Commands queue ahead of the poll. With fallbacks, each member
+        # queues at its own limit instead; see `Member.gate`.
+        call_limit=_call_limit(protocols[0]) if len(protocols) == 1 else None,
+        advertisements=advertisements,
+        # Released while the grill is off, if the user chooses.
+        idle_link=ble_conn,
+        transports=conn if isinstance(conn, FailoverTransport) else None,
+        # Counted against the protocol it was set up with, fallbacks or not.
+        fleet=fleet_for(hass).join(entry.entry_id, protocols[0]),
     )
     try:
+        await coordinator.async_load_held_targets(
+            held_targets_store(hass, entry.entry_id)
+        )
         await coordinator.async_config_entry_first_refresh()
     except Exception:
         # Any failure here aborts the setup, so the transport has to be
         # released. Catching only ConfigEntryNotReady stranded the socket and
         # its receive task on every other error, and each retry added another.
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        fleet_for(hass).leave(entry.entry_id)
         await conn.disconnect()
         await pitboss.stop()
         raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # The device exists once the platforms have registered their entities.
+    async_index_entry(hass, entry)
+    # Not without the Bluetooth integration, which nothing else here needs
+    # for a grill reached over the network.
+    if PROTOCOL_BLE not in protocols and "bluetooth" in hass.config.components:
+        _watch_presence(hass, entry, device_id, coordinator)
+    if woke_at is not None:
+        coordinator.wake_to_ready = monotonic() - woke_at
+        LOGGER.debug("Ready %.1fs after the grill woke", coordinator.wake_to_ready)
+    loaded_with = _reload_options(entry)
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload when an option that needs a reload changes."""
+        if _reload_options(entry) != loaded_with:
+            await hass.config_entries.async_reload(entry.entry_id)
+
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
 
-RELOAD_OPTIONS: frozenset[str] = frozenset()
+RELOAD_OPTIONS: frozenset[str] = frozenset({CONF_FALLBACK_PROTOCOLS, CONF_HOST})
 """Options whose change requires reloading the entry.
 
-Empty because every option that exists today -- the remote-start toggle --
-is read live where it is used. An option that fixes something at entity
+The transports an entry talks to its grill over are built once, at setup,
+so the fallback protocols and the local address are in here. Every other
+option -- the remote-start toggle, releasing an idle Bluetooth link -- is
+read live where it is used. An option that fixes something at entity
 registration (a display unit, a polling interval baked into the
 coordinator) belongs in this set when it is added.
 
@@ -196,19 +482,19 @@ Bluetooth a reload waits for the grill to advertise again, so flipping a
 toggle while the grill was asleep took the whole integration down --
 entities and all -- until the grill next woke up. The listener stays
 registered so a future option cannot forget to think about this; it just
-reloads only when the option asks for it.
+reloads only when one of these has actually changed.
 """
 
 
-async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload when an option that needs a reload changes."""
-    if RELOAD_OPTIONS:
-        await hass.config_entries.async_reload(entry.entry_id)
+def _reload_options(entry: ConfigEntry) -> dict:
+    return {key: entry.options.get(key) for key in RELOAD_OPTIONS}
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        async_unindex_entry(hass, entry)
+        fleet_for(hass).leave(entry.entry_id)
         coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN].pop(
             entry.entry_id
         )
@@ -217,3 +503,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_shutdown()
         await coordinator.api.stop()
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the probe targets held for a grill that is being removed."""
+    # An entry removed while waiting for its grill is never unloaded.
+    _stop_watching(hass, entry)
+    await held_targets_store(hass, entry.entry_id).async_remove()
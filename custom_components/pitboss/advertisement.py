@@ -0,0 +1,230 @@
+"""What a Bluetooth grill's advertisements say about the link to it."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from statistics import fmean
+from time import monotonic
+
+from bleak.backends.device import BLEDevice
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ADVERTISEMENT_RSSI_WINDOW,
+    MIGRATE_MARGIN_DB,
+    RECONNECT_DEBOUNCE_SECONDS,
+)
+from .metrics import RateCounter
+
+
+@dataclass(slots=True)
+class _Source:
+    """One adapter or proxy that hears the grill."""
+
+    rssi: deque[int] = field(
+        default_factory=lambda: deque(maxlen=ADVERTISEMENT_RSSI_WINDOW)
+    )
+    last_seen: float = 0.0
+    count: int = 0
+    connects: int = 0
+    connected: int = 0
+
+    def signal(self) -> float | None:
+        return fmean(self.rssi) if self.rssi else None
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "rssi": self.rssi[-1] if self.rssi else None,
+            "rssi_mean": round(fmean(self.rssi), 1) if self.rssi else None,
+            "seconds_since_seen": round(now - self.last_seen, 1),
+            "advertisements": self.count,
+            "connects": self.connects,
+            "connect_success_rate": (
+                round(self.connected / self.connects, 2) if self.connects else None
+            ),
+        }
+
+
+class AdvertisementTracker:
+    """Every advertisement noted, at most one reconnect started from them.
+
+    A grill advertises several times a second, and every proxy in range
+    reports each one, so the detection callback runs far more often than
+    there is anything to do. It used to log the whole service info and, while
+    disconnected, start a reconnect for every advertisement -- a burst of
+    them racing each other for the one connection slot. Here each
+    advertisement costs a few counter updates. A reconnect is started only
+    when none is in flight and `RECONNECT_DEBOUNCE_SECONDS` have passed since
+    the last one began, so a grill that takes a moment to accept a connection
+    is not asked again on every packet while it does.
+
+    What is counted -- the rate, and per source the recent signal strength
+    and when it last heard the grill -- is what the diagnostics download
+    shows, and what a "Bluetooth keeps dropping" report needs first.
+
+    While the coordinator has released the link on purpose (`park`), no
+    reconnect is started from here at all. An advertisement whose payload
+    differs from the one heard when the link was released calls `on_wake`
+    instead, once: the grill has something new to say.
+
+    Which source a connection goes through is chosen here too; see
+    `choose`.
+    """
+
+    def __init__(self) -> None:
+        self.rate = RateCounter()
+        self.sources: dict[str, _Source] = {}
+        self.reconnects = 0
+        self.migrations = 0
+        self.parked = False
+        # The grill's address, the source the link went up through, and
+        # whether the coordinator thinks that link has gone bad.
+        self.address: str | None = None
+        self.connected_via: str | None = None
+        self.degraded = False
+        self.on_wake: Callable[[], None] | None = None
+        self._reconnecting = False
+        self._last_attempt: float | None = None
+        self._payload: tuple | None = None
+        self._parked_payload: tuple | None = None
+
+    def record(self, service_info: BluetoothServiceInfoBleak) -> None:
+        """Note an advertisement heard by one of the sources."""
+        self.rate.mark()
+        if (source := self.sources.get(service_info.source)) is None:
+            source = self.sources[service_info.source] = _Source()
+        source.rssi.append(service_info.rssi)
+        source.last_seen = monotonic()
+        source.count += 1
+        self.address = service_info.address
+        self._payload = (
+            tuple(sorted(service_info.manufacturer_data.items())),
+            tuple(sorted(service_info.service_data.items())),
+        )
+        if (
+            self.parked
+            and self._payload != self._parked_payload
+            and self.on_wake is not None
+        ):
+            self._parked_payload = self._payload
+            self.on_wake()
+
+    def park(self) -> None:
+        """The link has been released; leave it released."""
+        self.parked = True
+        self._parked_payload = self._payload
+
+    def unpark(self) -> None:
+        self.parked = False
+
+    def claim_reconnect(self) -> bool:
+        """Whether to start a reconnect now. If so, one is now in flight.
+
+        The caller owes a `reconnect_done` once it has finished, however it
+        finished.
+        """
+        now = monotonic()
+        if (
+            self.parked
+            or self._reconnecting
+            or (
+                self._last_attempt is not None
+                and now - self._last_attempt < RECONNECT_DEBOUNCE_SECONDS
+            )
+        ):
+            return False
+        self._reconnecting = True
+        self._last_attempt = now
+        self.reconnects += 1
+        return True
+
+    def withdraw_reconnect(self) -> None:
+        """A claimed reconnect turned out to have nowhere better to go.
+
+        The debounce still runs from the claim, which is what keeps a
+        degraded link from looking for a better source on every packet.
+        """
+        self._reconnecting = False
+        self.reconnects -= 1
+
+    def reconnect_done(self, source: str, connected: bool) -> None:
+        """A reconnect through `source` has finished, one way or the other."""
+        self._reconnecting = False
+        if (counts := self.sources.get(source)) is not None:
+            counts.connects += 1
+            counts.connected += connected
+        if connected:
+            if self.connected_via is not None and self.connected_via != source:
+                self.migrations += 1
+            self.connected_via = source
+            self.degraded = False
+
+    def choose(
+        self, hass: HomeAssistant, connected: bool
+    ) -> tuple[str, BLEDevice] | None:
+        """The source to connect through, and the device as that source sees it.
+
+        Whichever advertisement happened to arrive first used to decide,
+        so a grill heard faintly by a proxy across the house was as likely
+        to be connected through it as through the adapter beside it -- and
+        connection setup and every round trip after it pay for that. Here
+        the candidates are every connectable source that currently hears the
+        grill, ranked by whether they have a connection slot free and then
+        by their recent signal strength, averaged rather than taken from one
+        packet.
+
+        While `connected`, the answer is a better place to move the link to,
+        if there is one: only once the coordinator has marked it `degraded`,
+        and only to a source at least `MIGRATE_MARGIN_DB` stronger, so two
+        sources of about the same strength do not trade the link back and
+        forth.
+        """
+        if self.address is None or (connected and not self.degraded):
+            return None
+        ranked: list[tuple[tuple[bool, float], str, BLEDevice]] = []
+        for candidate in bluetooth.async_scanner_devices_by_address(
+            hass, self.address, connectable=True
+        ):
+            source = candidate.scanner.source
+            known = self.sources.get(source)
+            rssi = (known.signal() if known is not None else None) or float(
+                candidate.advertisement.rssi
+            )
+            allocations = candidate.scanner.get_allocations()
+            has_slot = allocations is None or allocations.free > 0
+            ranked.append(((has_slot, rssi), source, candidate.ble_device))
+        if not ranked:
+            return None
+        (has_slot, rssi), source, device = max(ranked, key=lambda item: item[0])
+        if connected:
+            current = self.sources.get(self.connected_via or "")
+            current_rssi = current.signal() if current is not None else None
+            if (
+                source == self.connected_via
+                or not has_slot
+                or (
+                    current_rssi is not None and rssi - current_rssi < MIGRATE_MARGIN_DB
+                )
+            ):
+                return None
+        return source, device
+
+    def as_dict(self) -> dict:
+        now = monotonic()
+        return {
+            "advertisements_total": self.rate.total,
+            "advertisements_per_minute": self.rate.per_minute(),
+            "reconnects_started": self.reconnects,
+            "reconnecting": self._reconnecting,
+            "released": self.parked,
+            "connected_via": self.connected_via,
+            "degraded": self.degraded,
+            "migrations": self.migrations,
+            "sources": {
+                address: source.as_dict(now) for address, source in self.sources.items()
+            },
+        }
@@ -215,7 +215,7 @@ class ConnectivitySensor(BaseEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         return (
             bool(self.coordinator.api)
-            and self.coordinator.api.is_connected()
+            and self.coordinator.is_connected()
             and self.coordinator.last_update_success
         )
 
@@ -0,0 +1,121 @@
+"""When to try reconnecting to a local grill that has stopped answering."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+from random import random
+from time import monotonic
+
+from .const import (
+    RECONNECT_BACKOFF_BASE_SECONDS,
+    RECONNECT_BACKOFF_MAX_SECONDS,
+    RECONNECT_RETRY_FLOOR_SECONDS,
+)
+
+
+class BreakerState(StrEnum):
+    """Where the breaker stands."""
+
+    # Reconnects are attempted whenever the poll finds the grill gone.
+    CLOSED = "closed"
+    # The last attempt failed; none until `retry_at`.
+    OPEN = "open"
+    # The wait is over; the next attempt decides which way it goes.
+    HALF_OPEN = "half_open"
+
+
+class ReconnectBreaker:
+    """A circuit breaker over the local transport's reconnects.
+
+    The local HTTP transport is reconnected by the poll, since nothing else
+    would (see `reconnect_on_poll` on the coordinator). So a grill that was
+    unplugged, or whose Wi-Fi had dropped, cost a connection attempt -- and
+    a wait for it to time out -- every standby interval, for as long as it
+    stayed away. Here every failed attempt opens the breaker for longer:
+    `RECONNECT_BACKOFF_BASE_SECONDS`, doubling up to
+    `RECONNECT_BACKOFF_MAX_SECONDS`, each wait drawn from its upper half so
+    grills that went away together do not all come back to check at once.
+    A poll while it is open fails without touching the network. Once the
+    wait is over it is half open: the next poll attempts, and either closes
+    it or opens it again for longer.
+
+    Waiting out the backoff would make a grill that came back slow to show,
+    so `retry_now` ends the wait early -- for a command, which is somebody
+    wanting the grill now, and for the grill being heard advertising over
+    Bluetooth, which it does only while powered.
+
+    The relay's health, shared by every cloud grill, is kept in one of
+    these too, on timings of its own. See `RelayManager`.
+    """
+
+    def __init__(
+        self,
+        jitter: Callable[[], float] = random,
+        base: float = RECONNECT_BACKOFF_BASE_SECONDS,
+        ceiling: float = RECONNECT_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        self._jitter = jitter
+        self._base = base
+        self._ceiling = ceiling
+        self.failures = 0
+        self.retry_at: float | None = None
+        self._attempted_at: float | None = None
+        self.opened = 0
+        self.early_retries = 0
+
+    @property
+    def state(self) -> BreakerState:
+        if self.retry_at is None:
+            return BreakerState.CLOSED
+        if monotonic() < self.retry_at:
+            return BreakerState.OPEN
+        return BreakerState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Whether a reconnect may be attempted now."""
+        return self.state is not BreakerState.OPEN
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.retry_at = None
+
+    def record_failure(self) -> None:
+        now = monotonic()
+        self.failures += 1
+        self.opened += 1
+        self._attempted_at = now
+        wait = min(self._ceiling, self._base * 2 ** (self.failures - 1))
+        self.retry_at = now + wait / 2 * (1 + self._jitter())
+
+    def retry_now(self) -> bool:
+        """End the wait early, if there is one. Whether it was ended.
+
+        Not within `RECONNECT_RETRY_FLOOR_SECONDS` of the last attempt: the
+        grill advertises several times a second, and a grill that is on but
+        off the network would otherwise be asked again on every one.
+        """
+        if self.state is not BreakerState.OPEN:
+            return False
+        now = monotonic()
+        if (
+            self._attempted_at is not None
+            and now - self._attempted_at < RECONNECT_RETRY_FLOOR_SECONDS
+        ):
+            return False
+        self.retry_at = now
+        self.early_retries += 1
+        return True
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "seconds_to_retry": (
+                round(max(0.0, self.retry_at - monotonic()), 1)
+                if self.retry_at is not None
+                else None
+            ),
+            "times_opened": self.opened,
+            "early_retries": self.early_retries,
+        }
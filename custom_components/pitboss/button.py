@@ -51,7 +51,7 @@ class RestartControllerButton(BaseEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Reboot the module."""
-        await self.coordinator.api.reboot()
+        await self.coordinator.async_rpc("reboot", self.coordinator.api.reboot)
 
 
 class FastUpdatesButton(BaseEntity, ButtonEntity):
@@ -78,4 +78,6 @@ class FastUpdatesButton(BaseEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Request the faster push cadence."""
-        await self.coordinator.api.request_fast_updates()
+        await self.coordinator.async_rpc(
+            "request_fast_updates", self.coordinator.api.request_fast_updates
+        )
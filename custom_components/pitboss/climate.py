@@ -129,7 +129,9 @@ class GrillClimate(BaseEntity, ClimateEntity):
         # Deliberately does not touch the setpoint. It is the user's
         # setting, it has no effect while the grill is off, and it is what
         # the grill will use next time it is lit.
-        await self.coordinator.api.turn_grill_off()
+        await self.coordinator.async_write(
+            "moduleIsOn", False, "turn_grill_off", self.coordinator.api.turn_grill_off
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
@@ -143,8 +145,10 @@ class GrillClimate(BaseEntity, ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode | None:
-        if data := self.coordinator.data:
-            if data.get("moduleIsOn", False):
+        # The power flag as the power switch reads it, pending turn-off
+        # included, so the two agree from the moment either is used.
+        if self.coordinator.data:
+            if self.coordinator.value("moduleIsOn"):
                 return HVACMode.HEAT
             else:
                 return HVACMode.OFF
@@ -27,9 +27,12 @@ from pytboss.exceptions import NotConnectedError, RPCError, Unauthorized
 from .const import (
     ALL_PROTOCOLS,
     CONF_ENABLE_REMOTE_START,
+    CONF_FALLBACK_PROTOCOLS,
+    CONF_RELEASE_IDLE_LINK,
     DEFAULT_PROTOCOL,
     DOMAIN,
     LOGGER,
+    PROTOCOL_BLE,
     PROTOCOL_LOCAL,
 )
 
@@ -322,18 +325,51 @@ class PitBossOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        data = self.config_entry.data
+        protocol = data.get(CONF_PROTOCOL, DEFAULT_PROTOCOL)
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # A local fallback needs an address; an entry set up over local
+            # already has one.
+            if PROTOCOL_LOCAL in user_input.get(
+                CONF_FALLBACK_PROTOCOLS, []
+            ) and not user_input.get(CONF_HOST):
+                errors[CONF_HOST] = "host_required"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+        options = user_input or self.config_entry.options
+        schema: dict[vol.Marker, Any] = {
+            vol.Required(
+                CONF_ENABLE_REMOTE_START,
+                default=options.get(CONF_ENABLE_REMOTE_START, False),
+            ): bool,
+        }
+        # Only Bluetooth holds a connection slot worth giving back.
+        if protocol == PROTOCOL_BLE:
+            schema[
+                vol.Required(
+                    CONF_RELEASE_IDLE_LINK,
+                    default=options.get(CONF_RELEASE_IDLE_LINK, False),
+                )
+            ] = bool
+        schema[
+            vol.Optional(
+                CONF_FALLBACK_PROTOCOLS,
+                default=options.get(CONF_FALLBACK_PROTOCOLS, []),
+            )
+        ] = SelectSelector(
+            SelectSelectorConfig(
+                options=[other for other in ALL_PROTOCOLS if other != protocol],
+                multiple=True,
+                translation_key="protocol",
+            )
+        )
+        if protocol != PROTOCOL_LOCAL:
+            schema[
+                vol.Optional(
+                    CONF_HOST, description={"suggested_value": options.get(CONF_HOST)}
+                )
+            ] = str
         return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_ENABLE_REMOTE_START,
-                        default=self.config_entry.options.get(
-                            CONF_ENABLE_REMOTE_START, False
-                        ),
-                    ): bool,
-                }
-            ),
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
         )
@@ -27,6 +27,26 @@ STANDBY_SCAN_INTERVAL = timedelta(seconds=60)
 FAILURES_BEFORE_BACKOFF = 2
 # Diagnostics change slowly; no need to read them at the poll rate.
 SYS_INFO_INTERVAL = 60.0
+# How often the poll re-reads the probe targets a board keeps out of its
+# frames. They change when someone sets one, and a set from here invalidates
+# the read; what this bounds is how long a target set from the vendor's app
+# takes to show. Probes whose target rides in the frame are never read.
+PROBE_TARGETS_INTERVAL = 60.0
+# How long a poll waits for the grill, learned per method from how long it
+# has been taking. A fixed ten seconds is right for nothing: a local grill
+# answering in 50 ms took ten seconds to be declared gone, and a slow
+# Bluetooth proxy timed out on a bad day. The wait is a high percentile of
+# recent round trips times a margin, clamped between the floor -- jitter on
+# a healthy LAN must not read as an outage -- and the ceiling, which is what
+# was used everywhere before. Until a method has enough samples to go on it
+# keeps the old behaviour: the ceiling for the ping, the transport's own
+# default for everything else.
+RPC_TIMEOUT_FLOOR = 0.5
+RPC_TIMEOUT_CEILING = 10.0
+RPC_TIMEOUT_FACTOR = 4.0
+RPC_TIMEOUT_QUANTILE = 0.95
+RPC_TIMEOUT_MIN_SAMPLES = 10
+RPC_TIMEOUT_WINDOW = 50
 PROTOCOL_WSS = "wss"
 PROTOCOL_BLE = "ble"
 PROTOCOL_LOCAL = "local"
@@ -68,7 +88,144 @@ MCU_SETTLE_SECONDS = 6
 
 The board wipes its cached status the moment it forwards a command to the
 MCU, so the next poll still carries the old value and an entity that read it
-straight back would appear to snap to the previous setting."""
+straight back would appear to snap to the previous setting.
+
+The longest a held value waits, not the usual: a frame reporting the value
+ends the wait there and then, and once a grill has confirmed enough commands
+the window is sized from how long it has been taking -- see below. Until
+then, and on a grill that stops confirming, it is this."""
+
+# How the settle window is learned: the same arithmetic as the RPC timeouts,
+# over how long the grill took to report a command's value in a frame. The
+# floor is the MCU's own cycle -- a board cannot report the change before it
+# has made it -- and the ceiling is the fixed window above, so a slow or
+# silent grill is never held longer than it was before this was learned.
+MCU_SETTLE_FLOOR = 1.5
+MCU_SETTLE_FACTOR = 2.0
+MCU_SETTLE_MIN_SAMPLES = 5
+
+# Writing held probe targets to a grill that has just come on. Off the poll,
+# so the first lit cycle is not one round trip longer per probe, and two at a
+# time: the board answers overlapping calls, but it is one small controller
+# behind the relay and there is no prize for flooding it. A failed write is
+# tried again on a schedule rather than on the next power cycle, which on a
+# long cook may be the next day.
+PROBE_SEED_CONCURRENCY = 2
+PROBE_SEED_ATTEMPTS = 3
+PROBE_SEED_RETRY_SECONDS = 15
+
+COMMAND_COALESCE_SECONDS = 0.3
+"""The least time between two sends of the same setting.
+
+Dragging a slider asks for every value it passes through, and over Bluetooth
+each of those is a round trip of its own. Within this window -- or while the
+previous send is still in flight, whichever is longer -- only the latest
+value asked for is sent; the ones it replaced are dropped unsent. Short
+enough that a single tap goes out at once and the end of a drag follows it
+closely."""
+
+POLL_CYCLE_HISTORY = 20
+"""How many poll cycles the diagnostics download shows, most recent last.
+
+At the active interval that is the last few minutes of a cook, which is the
+window a "it went unavailable" report is usually about."""
+
+# How often a Bluetooth grill's advertisements may start a reconnect: at
+# most one in flight, and this long between the starts of two. A grill
+# advertises several times a second, through every proxy in range.
+RECONNECT_DEBOUNCE_SECONDS = 5.0
+# How many recent signal strengths are averaged per source, for choosing
+# which one to connect through and for the diagnostics.
+ADVERTISEMENT_RSSI_WINDOW = 20
+# When a Bluetooth link counts as gone bad -- two failed polls in a row, or
+# a median round trip slower than this -- and how much stronger another
+# source has to be heard for the link to be moved to it.
+LINK_DEGRADED_MS = 1500
+MIGRATE_MARGIN_DB = 6
+
+SERVICE_CONCURRENCY = 10
+"""How many grills one action talks to at once.
+
+An action aimed at a list of grills sends to them side by side, so turning
+a row of them down for the night takes about one round trip rather than one
+each. Bounded because the grills are rarely as independent as they look:
+relay grills share one upstream, and Bluetooth grills share the connection
+slots of whichever proxies can hear them. Ten covers any setup this has
+been asked about in a single wave."""
+
+# How much of a cook the coordinator keeps in memory for the history action:
+# a reading every ten seconds, for sixteen hours -- a long brisket, start to
+# finish. Readings arriving faster than that are not kept.
+HISTORY_RESOLUTION_SECONDS = 10
+HISTORY_SAMPLES = 16 * 60 * 6
+# Bounds on how many points a history request may ask for per series.
+HISTORY_MIN_POINTS = 3
+HISTORY_MAX_POINTS = 2000
+HISTORY_DEFAULT_POINTS = 300
+
+# Where the probe targets we hold for a grill are kept between runs: one
+# file per entry, in Fahrenheit like the grill's own store. Saved a little
+# after each change rather than on it, so a slider dragged across its range
+# is one write to disk.
+HELD_TARGETS_STORAGE_VERSION = 1
+HELD_TARGETS_SAVE_DELAY = 10
 
 # Remote start is off unless the user turns it on in the integration options.
 CONF_ENABLE_REMOTE_START = "enable_remote_start"
+# Bluetooth only: let go of the connection while the grill is off. See
+# `PitBossDataUpdateCoordinator._async_release_link`.
+CONF_RELEASE_IDLE_LINK = "release_idle_link"
+# How long the grill has to have been off before the link is released, and
+# how often a released link is reconnected to check on it regardless -- a
+# grill lit at its own panel may not advertise any differently.
+IDLE_RELEASE_SECONDS = 120
+IDLE_RECHECK_SECONDS = 600
+# How long a grill reached some other way, but heard advertising over
+# Bluetooth before, has to go unheard before it counts as asleep. See
+# `PitBossDataUpdateCoordinator.heard_nearby`.
+PRESENCE_SILENCE_SECONDS = 120
+
+# Further protocols an entry may reach its grill over, should the one it was
+# set up with stop answering. See `FailoverTransport`.
+CONF_FALLBACK_PROTOCOLS = "fallback_protocols"
+# How many calls in a row a transport may fail before the others are all
+# tried ahead of it, for how long before it is given another chance, and how
+# much weight each new round trip gets in its running latency and success
+# rate.
+FAILOVER_FAILURES = 2
+FAILOVER_RETRY_SECONDS = 60.0
+FAILOVER_LATENCY_WEIGHT = 0.2
+
+# The connection pool each local grill gets: how many requests may be open
+# to its board at once, and how long an idle connection is kept for the
+# next one. See `create_local_session`.
+LOCAL_HTTP_CONNECTIONS = 2
+LOCAL_HTTP_KEEPALIVE_SECONDS = 75.0
+
+# How long a local grill that could not be reconnected to is left before the
+# next attempt: this long after the first failure, doubling with each one
+# after it up to the ceiling, and jittered. A command, or the grill being
+# heard over Bluetooth, brings the next attempt forward -- though not to
+# within the floor of the last one. See `ReconnectBreaker`.
+RECONNECT_BACKOFF_BASE_SECONDS = 30.0
+RECONNECT_BACKOFF_MAX_SECONDS = 900.0
+RECONNECT_RETRY_FLOOR_SECONDS = 10.0
+
+# Polls across every grill this instance runs: how far apart their phases
+# are spread, and how many may be in flight at once over each transport --
+# the relay is one upstream for all of them, and Bluetooth grills share the
+# few connection slots of the proxies that hear them. See `PollFleet`.
+FLEET_STAGGER_SECONDS = 10.0
+FLEET_POLL_CONCURRENCY = {PROTOCOL_BLE: 2, PROTOCOL_LOCAL: 4, PROTOCOL_WSS: 4}
+
+# How long every cloud grill waits before trying the relay again, once one of
+# them has found it unreachable: from the first failure, doubling to the
+# ceiling. pytboss's own backoff for a single socket, so the relay hears from
+# the whole fleet no more often than it did from one grill, and a grill comes
+# back no later. See `RelayManager`.
+RELAY_BACKOFF_BASE_SECONDS = 1.0
+RELAY_BACKOFF_MAX_SECONDS = 30.0
+# How many grills the relay must turn away at once -- answering, but
+# refusing the handshake -- before that counts against the relay rather
+# than against each grill. See `RelayManager.open_socket`.
+RELAY_REFUSED_GRILLS = 2
@@ -1,7 +1,14 @@
 """DataUpdateCoordinator for PitBoss."""
 
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
 from math import floor
 from time import monotonic
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
@@ -9,8 +16,9 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_conversion import TemperatureConverter
 from pytboss.api import PitBoss
 from pytboss.exceptions import (
@@ -21,17 +29,81 @@ from pytboss.exceptions import (
     UnsupportedOperation,
 )
 from pytboss.grills import StateDict
+from pytboss.transport import Transport
 
+from .advertisement import AdvertisementTracker
+from .breaker import ReconnectBreaker
 from .const import (
     ACTIVE_SCAN_INTERVAL,
+    COMMAND_COALESCE_SECONDS,
+    CONF_RELEASE_IDLE_LINK,
+    DEFAULT_PROBE_MAX_TEMP,
     DEFAULT_PROBE_MIN_TEMP,
     DOMAIN,
     FAILURES_BEFORE_BACKOFF,
+    HELD_TARGETS_SAVE_DELAY,
+    HELD_TARGETS_STORAGE_VERSION,
+    IDLE_RECHECK_SECONDS,
+    IDLE_RELEASE_SECONDS,
+    LINK_DEGRADED_MS,
     LOGGER,
+    MCU_SETTLE_FACTOR,
+    MCU_SETTLE_FLOOR,
+    MCU_SETTLE_MIN_SAMPLES,
     MCU_SETTLE_SECONDS,
+    POLL_CYCLE_HISTORY,
+    PRESENCE_SILENCE_SECONDS,
+    PROBE_SEED_ATTEMPTS,
+    PROBE_SEED_CONCURRENCY,
+    PROBE_SEED_RETRY_SECONDS,
+    PROBE_TARGETS_INTERVAL,
+    RPC_TIMEOUT_CEILING,
     STANDBY_SCAN_INTERVAL,
     SYS_INFO_INTERVAL,
 )
+from .failover import FailoverTransport
+from .fleet import FleetMember
+from .gate import Priority, PriorityGate
+from .history import CookHistory
+from .metrics import AdaptiveTimeouts, PollCycle, RateCounter, RpcLatency
+from .scheduler import DeadlineScheduler
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """A value we sent the grill, shown until the grill reports it."""
+
+    value: Any
+    # The grill's unit when the value was sent, for temperatures; `None` for
+    # everything else. A unit flip invalidates a held temperature outright.
+    unit: str | None
+    cancel: CALLBACK_TYPE
+    # When it was sent, for learning how long the grill takes to report a
+    # command. `None` when there is nothing to learn from it: the grill was
+    # already reporting the value, so seeing it again confirms nothing.
+    sent_at: float | None
+    # Set once the window has run out and the fallback refresh is asking
+    # for it. Whatever that refresh says is our poll's timing rather than
+    # the grill's, and learning from it would feed the window back into
+    # itself.
+    settling: bool = False
+
+
+# The settle window is one distribution per grill rather than per key: the
+# MCU is one loop, and a grill sees too few commands of any one kind to
+# learn from them separately.
+_SETTLE = "mcu"
+
+
+def held_targets_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Where an entry's held probe targets are kept between runs."""
+    return Store(
+        hass, HELD_TARGETS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.held_targets"
+    )
+
+
+# The state keys probe targets are reported under, by probe.
+_PROBE_TARGET_KEYS = {f"p{probe}Target": probe for probe in range(1, 5)}
 
 
 class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
@@ -48,9 +120,26 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         device_info: DeviceInfo,
         api: PitBoss,
         reconnect_on_poll: bool = False,
+        call_limit: int | None = None,
+        advertisements: AdvertisementTracker | None = None,
+        idle_link: Transport | None = None,
+        transports: FailoverTransport | None = None,
+        fleet: FleetMember | None = None,
     ) -> None:
         """Initialize the coordinator.
 
+        `call_limit` is for transports that carry few calls at once --
+        Bluetooth one, a local board `LOCAL_HTTP_CONNECTIONS`. Calls beyond
+        it queue at the coordinator instead, commands ahead of the poll; see
+        `PriorityGate`. Not over several transports, where each member's
+        calls queue at its own limit (`Member.gate`), in the order the
+        coordinator's gate gives them. `advertisements` is theirs
+        too, kept here for the diagnostics. `idle_link` is the transport to
+        release while the grill is off, when the user has asked for that;
+        see `_async_release_link`. `transports` is the grill's transports,
+        when there is more than one of them, for the diagnostics. `fleet`
+        is this entry's place among every grill's polls; see `PollFleet`.
+
         `reconnect_on_poll` is for transports with no reconnect of their own.
         Bluetooth is reconnected by the discovery callback and the websocket
         transport by its internal loop, so for those a disconnected transport
@@ -70,6 +159,33 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         self.device_info = device_info
         self.api = api
         self._reconnect_on_poll = reconnect_on_poll
+        # Only consulted where the poll reconnects; see `ReconnectBreaker`.
+        self.reconnect_breaker = ReconnectBreaker()
+        # Held for a reconnect, so a command and the poll make one between
+        # them rather than one each.
+        self._reconnecting = asyncio.Lock()
+        self.advertisements = advertisements
+        self._idle_link = idle_link
+        self.transports = transports
+        self.fleet = fleet
+        # Added to the first timed refresh only; see `_schedule_refresh`.
+        self._phase = fleet.offset if fleet is not None else None
+        # Seconds from a sleeping grill's first advertisement to this entry
+        # being set up, when that is how it came to be set up.
+        self.wake_to_ready: float | None = None
+        # Whether `_idle_link` has been let go on purpose, and since when.
+        self.link_released = False
+        self.links_released = 0
+        self._released_at: float | None = None
+        self._cancel_release: CALLBACK_TYPE | None = None
+        if advertisements is not None and idle_link is not None:
+            advertisements.on_wake = self._on_advertisement_changed
+        # When the grill was last heard advertising, for one reached some
+        # other way; since when polling it has been suspended for not being
+        # heard; and how many polls that has saved. See `heard_nearby`.
+        self.heard_at: float | None = None
+        self._unheard_since: float | None = None
+        self.polls_skipped = 0
         self._api_started = False
         # Latest Sys.GetInfo payload from the control board.
         self.sys_info: dict = {}
@@ -87,23 +203,170 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         self.probe_targets: dict[int, int] = {}
         self.restored_targets: dict[int, int] = {}
         self._targets_seeded = False
+        # Where `restored_targets` outlives a restart. See
+        # `async_load_held_targets`.
+        self._targets_store: Store[dict[str, Any]] | None = None
+        self._targets_unsaved = False
+        # Probes whose target this board puts in its frames, learned from
+        # the frames themselves, and when the rest were last read. `None`
+        # means the next poll reads them. See `_async_refresh_probe_targets`.
+        self.frame_targets: set[int] = set()
+        self._targets_read_at: float | None = None
+        # The seeding in progress, its retry, and how each probe's last
+        # attempt went -- for the diagnostics download. See `_start_seeding`.
+        self._seeding: asyncio.Task[None] | None = None
+        self._cancel_seed_retry: CALLBACK_TYPE | None = None
+        self.seed_results: dict[int, str] = {}
         # The unit `probe_targets` was last known to be in, so a unit change
         # can convert the held values instead of serving them mislabeled.
         # `None` until the first update: the unit read before any data is
         # the Fahrenheit default, not something the grill said.
         self._targets_unit: str | None = None
-        # The grill setpoint we asked for, held until the grill confirms it.
-        # Kept here rather than on the climate entity because the setpoint has
-        # more than one reader -- the climate entity and the grill setpoint
-        # number are two controls over one setting, and a value held by
-        # whichever one was used would leave the other showing the old
-        # setpoint for the length of the settle window. `probe_targets` lives
-        # here for the same reason.
-        self._pending_setpoint: float | None = None
-        self._pending_setpoint_unit: str | None = None
-        self._cancel_setpoint_settle: CALLBACK_TYPE | None = None
+        # What we asked the grill for, by state key, held until the grill
+        # reports it. Kept here rather than on each control because a
+        # setting can have more than one reader -- the climate entity and
+        # the grill setpoint number are two controls over one setting, the
+        # power switch and the climate entity's mode two views of one flag
+        # -- and a value held by whichever one was used would leave the
+        # other showing the old setting for the length of the settle
+        # window. `probe_targets` lives here for the same reason.
+        self._pending: dict[str, PendingWrite] = {}
+        # Every timer the coordinator keeps, on one loop handle. See
+        # `DeadlineScheduler`.
+        self.scheduler = DeadlineScheduler(hass)
         # Consecutive failed cycles, for the backoff decision below.
         self._failed_polls = 0
+        # How long the grill takes to answer, by method. See `async_rpc`.
+        self.rpc_latency = RpcLatency()
+        # How long the poll waits for each of its reads. See `_async_read`.
+        self.rpc_timeouts = AdaptiveTimeouts()
+        # Which call goes next when the transport takes them one at a time.
+        self.gate = PriorityGate(call_limit)
+        # How long a held value waits for the grill to report it. See
+        # `_hold`. Counted both ways, so the diagnostics show how often a
+        # frame confirmed a command and how often a poll had to.
+        self.settle_windows = AdaptiveTimeouts(
+            floor=MCU_SETTLE_FLOOR,
+            ceiling=MCU_SETTLE_SECONDS,
+            factor=MCU_SETTLE_FACTOR,
+            min_samples=MCU_SETTLE_MIN_SAMPLES,
+        )
+        self.settle_confirmed = 0
+        self.settle_fell_back = 0
+        # Per setting, for collapsing a burst of writes to it into the first
+        # and the latest. See `_async_coalesce`.
+        self._command_locks: dict[str, asyncio.Lock] = {}
+        self._command_seq: Counter[str] = Counter()
+        self._command_sent_at: dict[str, float] = {}
+        self.commands_collapsed = 0
+        # The rest of what the diagnostics download reports. Kept as plain
+        # counters updated in passing, so having them costs nothing on a
+        # grill nobody is debugging.
+        self.poll_cycles: deque[PollCycle] = deque(maxlen=POLL_CYCLE_HISTORY)
+        # What the grill has reported, for `pitboss.get_cook_history`.
+        self.history = CookHistory()
+        self.polls_total = 0
+        self.polls_failed = 0
+        self.push_frames = RateCounter()
+
+    async def async_rpc[T](
+        self,
+        method: str,
+        call: Callable[..., Awaitable[T]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Make one call to the grill, and time it.
+
+        Everything that talks to the grill comes through here -- the poll's
+        reads and the entities' commands alike -- so a link going bad shows
+        in one place, before it shows as a failed cook. `method` names the
+        call in the histograms; it is the pytboss method's name rather than
+        the RPC's, because every command goes out as the same
+        `PB.SendMCUCommand` and would be indistinguishable by that.
+
+        For commands. Queued ahead of the poll on a limited transport, so
+        how long a command takes no longer depends on where the poll cycle
+        happens to be; the poll's own reads go through `_async_read`.
+
+        A local grill that has dropped is reconnected first, the command
+        being reason enough not to sit out the rest of the wait; sent
+        regardless, it would fail on the dropped link. While the wait
+        cannot be cut short -- the last attempt was too recent -- this
+        fails at once with `GrillUnavailable` instead.
+        """
+        if self.link_released:
+            await self._async_reclaim_link()
+        if self._reconnect_on_poll and not self.api.is_connected():
+            self.reconnect_breaker.retry_now()
+            try:
+                await self._async_reconnect()
+            except UpdateFailed as ex:
+                raise GrillUnavailable(str(ex)) from ex
+            # The entities catch up with the grill now, not at the next poll.
+            self.hass.async_create_task(self.async_request_refresh())
+        async with self.gate.slot(Priority.COMMAND):
+            return await self._async_timed(method, call, *args, **kwargs)
+
+    async def _async_timed[T](
+        self,
+        method: str,
+        call: Callable[..., Awaitable[T]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        # Timed from when the call goes out, not from when it was asked for:
+        # time spent queued at the gate is the gate's to report.
+        started = monotonic()
+        try:
+            result = await call(*args, **kwargs)
+        except Exception:
+            self.rpc_latency.record_failure(method)
+            raise
+        elapsed = monotonic() - started
+        self.rpc_latency.record(method, elapsed)
+        self.rpc_timeouts.record(method, elapsed)
+        return result
+
+    async def _async_read[T](
+        self,
+        method: str,
+        call: Callable[..., Awaitable[T]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """One of the poll's reads, bounded by the wait learned for it.
+
+        Reads only. A command that outlives a learned wait may still have
+        reached the grill, and failing it would tell the user it did not;
+        commands keep the transport's own timeout. A read that times out is
+        simply a failed cycle, and the next one will ask again.
+
+        Queued behind commands on a limited transport, and bounded only
+        once it is sent: waiting its turn is not the grill being slow.
+        """
+        async with self.gate.slot(Priority.BACKGROUND):
+            try:
+                async with asyncio.timeout(self._read_timeout(method)):
+                    return await self._async_timed(method, call, *args, **kwargs)
+            except TimeoutError:
+                self.rpc_timeouts.timed_out(method)
+                raise
+
+    def _read_timeout(self, method: str) -> float | None:
+        """The deadline for one of the poll's reads, if it is ours to set.
+
+        Not over several transports: `FailoverTransport` bounds each of its
+        attempts by what it has learned of that transport, and a deadline
+        here, around all of them, would expire with the first attempt and
+        leave the others untried.
+        """
+        if self.transports is not None:
+            return None
+        return self.rpc_timeouts.get(method)
 
     def accepted_setpoints(self, unit: str) -> list[float]:
         """Grill setpoints the control board honours, expressed in `unit`.
@@ -156,12 +419,111 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         poll still carries the old setpoint and a control reading it straight
         back would appear to snap to the previous setting.
         """
-        if self._pending_setpoint is not None:
-            return self._pending_setpoint
-        if (data := self.data) and (temp := data.get("grillSetTemp")) is not None:
+        if (temp := self.value("grillSetTemp")) is not None:
             return float(temp)
         return None
 
+    def pending(self, key: str) -> Any | None:
+        """The value sent for `key` that the grill has yet to report, if any."""
+        if (write := self._pending.get(key)) is not None:
+            return write.value
+        return None
+
+    def value(self, key: str) -> Any | None:
+        """What a control over `key` should show.
+
+        The value just asked for until the grill confirms it, then the
+        grill's own: the board wipes its cached status the moment it forwards
+        a command to the MCU, so the next read still carries the old value
+        and a control reading it straight back would appear to snap to the
+        previous setting.
+        """
+        if key in self._pending:
+            return self._pending[key].value
+        return (self.data or {}).get(key)
+
+    async def async_write[T](
+        self,
+        key: str,
+        value: Any,
+        method: str,
+        call: Callable[..., Awaitable[T]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Send a command, and hold the value it sets until the grill reports it.
+
+        `key` is the state key the command moves and `value` what it should
+        read once it has. Held only once the call succeeds: a command that
+        raised may not have reached the grill, and showing it as done would
+        be the one thing worse than the snap-back this exists to prevent.
+        """
+        result = await self.async_rpc(method, call, *args, **kwargs)
+        self._hold(key, value)
+        return result
+
+    @property
+    def settle_window(self) -> float:
+        """How long a held value waits before a poll is sent to confirm it.
+
+        A fallback, not a delay: any frame reporting the value ends the wait
+        at once, without a poll. Sized from how long this grill has taken to
+        report the commands it was sent, so a board that answers in a second
+        has a one-command mismatch of a couple of seconds rather than six --
+        and the fixed window until there is enough to go on.
+        """
+        return self.settle_windows.get(_SETTLE) or MCU_SETTLE_SECONDS
+
+    @callback
+    def _hold(self, key: str, value: Any, unit: str | None = None) -> None:
+        # A second write inside the window replaces the timer rather than
+        # queueing another -- and restarts it, so the new value gets a whole
+        # window of its own.
+        self._release(key)
+        self._pending[key] = PendingWrite(
+            value,
+            unit,
+            self.scheduler.schedule(
+                self.settle_window, partial(self._async_settle, key)
+            ),
+            None if self._reported(key) == value else monotonic(),
+        )
+        self.async_update_listeners()
+
+    @callback
+    def _release(self, key: str) -> bool:
+        """Stop holding `key`. Whether anything was held."""
+        if (write := self._pending.pop(key, None)) is None:
+            return False
+        write.cancel()
+        return True
+
+    async def _async_settle(self, key: str) -> None:
+        """The end of one settle window: ask the grill, then believe it.
+
+        The MCU reports back within a couple of seconds, so the refresh is
+        left until then rather than made immediately; an immediate one would
+        only read the cleared status. One window is all a held value is for.
+        If the refresh confirmed it, `_expire_pending` has already let it go;
+        if the grill did not take it, follow the grill rather than assert a
+        value it will never report.
+        """
+        if (write := self._pending.get(key)) is None:
+            return
+        write.settling = True
+        self.settle_fell_back += 1
+        # No frame reported the value in time, which is what a timeout is to
+        # the learned window: the next one backs off towards the fixed one.
+        # A grill whose frames do confirm brings it straight back.
+        self.settle_windows.timed_out(_SETTLE)
+        await self.async_request_refresh()
+        # Compared by identity: a second write made while the refresh was in
+        # flight has a window of its own, which this one must not close.
+        if self._pending.get(key) is write:
+            self._release(key)
+            self.async_update_listeners()
+
     def snap_setpoint(self, temp: float) -> float:
         """The nearest setpoint the control board will actually honour.
 
@@ -173,56 +535,91 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             return min(accepted, key=lambda value: abs(value - temp))
         return temp
 
+    async def _async_coalesce(
+        self, key: str, send: Callable[[], Awaitable[None]]
+    ) -> bool:
+        """Send a write to `key`, unless a later one replaces it first.
+
+        Whether it was sent. The first write of a burst goes out at once.
+        Those that follow wait for the one in flight and for
+        `COMMAND_COALESCE_SECONDS` after it, and only the latest of them is
+        sent -- the rest return unsent, so a ten-step drag over Bluetooth is
+        two writes, not ten. One already on the wire is let finish rather
+        than cancelled: cancelling the await cannot recall a command the
+        grill has received, and would leave the transport a reply with no
+        one waiting for it.
+
+        The lock queues waiters in order, so each replaced write wakes, sees
+        it is no longer the latest, and gives way without a round trip.
+        """
+        self._command_seq[key] += 1
+        seq = self._command_seq[key]
+        if (lock := self._command_locks.get(key)) is None:
+            lock = self._command_locks[key] = asyncio.Lock()
+        async with lock:
+            if seq != self._command_seq[key]:
+                self.commands_collapsed += 1
+                return False
+            wait = (
+                self._command_sent_at.get(key, float("-inf"))
+                + COMMAND_COALESCE_SECONDS
+                - monotonic()
+            )
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if seq != self._command_seq[key]:
+                    self.commands_collapsed += 1
+                    return False
+            self._command_sent_at[key] = monotonic()
+            await send()
+            return True
+
     async def async_set_grill_setpoint(self, temp: float) -> None:
         """Send a grill setpoint, and hold it until the grill confirms it."""
         wanted = self.snap_setpoint(temp)
-        await self.api.set_grill_temperature(int(wanted))
-        self._pending_setpoint = wanted
-        self._pending_setpoint_unit = self.grill_unit
-        self.async_update_listeners()
-        # The MCU reports back within a couple of seconds; an immediate
-        # refresh would only read the cleared status. A second set inside the
-        # window replaces the timer rather than queueing another.
-        self._cancel_pending_setpoint_settle()
-        self._cancel_setpoint_settle = async_call_later(
-            self.hass, MCU_SETTLE_SECONDS, self._async_confirm_setpoint
+        sent = await self._async_coalesce(
+            "grillSetTemp",
+            partial(
+                self.async_rpc,
+                "set_grill_temperature",
+                self.api.set_grill_temperature,
+                int(wanted),
+            ),
         )
+        if sent:
+            self._hold("grillSetTemp", wanted, self.grill_unit)
 
     @callback
-    def _cancel_pending_setpoint_settle(self) -> None:
-        if self._cancel_setpoint_settle is not None:
-            self._cancel_setpoint_settle()
-            self._cancel_setpoint_settle = None
+    def _expire_pending(self) -> None:
+        """Stop holding values once they stop meaning anything.
 
-    async def _async_confirm_setpoint(self, _now) -> None:
-        self._cancel_setpoint_settle = None
-        await self.async_request_refresh()
-        # One settle window is all the pending value is for. If the refresh
-        # confirmed it, `_expire_pending_setpoint` has already cleared it; if
-        # the grill did not take it, follow the grill rather than assert a
-        # value it will never report.
-        if self._pending_setpoint is not None:
-            self._pending_setpoint = None
-            self.async_update_listeners()
+        Either the grill has reported one -- from which point its own answer
+        is the source again, so a later change made at the panel is not
+        masked by a value we are still asserting -- or the grill's unit has
+        flipped, which invalidates a held temperature outright: 225 held from
+        a Fahrenheit set must not be presented as 225 C for the rest of the
+        window.
+        """
+        for key, write in list(self._pending.items()):
+            if write.unit is not None and write.unit != self.grill_unit:
+                self._release(key)
+            elif self._reported(key) == write.value:
+                # Confirmed, so the fallback poll is cancelled with the hold.
+                self._release(key)
+                if write.sent_at is not None and not write.settling:
+                    self.settle_confirmed += 1
+                    self.settle_windows.record(_SETTLE, monotonic() - write.sent_at)
 
-    @callback
-    def _expire_pending_setpoint(self) -> None:
-        """Stop holding the asked-for setpoint once it stops meaning anything.
+    def _reported(self, key: str) -> Any | None:
+        """What the grill says `key` is, by whatever route it says it.
 
-        Either the grill has reported it -- from which point its own answer is
-        the source again, so a later change made at the panel is not masked by
-        a value we are still asserting -- or the grill's unit has flipped,
-        which invalidates the held number outright: 225 held from a Fahrenheit
-        set must not be presented as 225 C for the rest of the window.
+        A probe target is resolved the way `probe_target` resolves it, so a
+        board that never puts `pNTarget` in its frames still confirms one --
+        through the store pytboss reads it from.
         """
-        if self._pending_setpoint is None:
-            return
-        if self.grill_unit != self._pending_setpoint_unit:
-            self._pending_setpoint = None
-            return
-        reported = (self.data or {}).get("grillSetTemp")
-        if reported is not None and float(reported) == self._pending_setpoint:
-            self._pending_setpoint = None
+        if (probe := _PROBE_TARGET_KEYS.get(key)) is not None:
+            return self._resolve_probe_target(probe)
+        return (self.data or {}).get(key)
 
     @callback
     def _follow_probe_targets_unit(self) -> None:
@@ -251,11 +648,178 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         prev, self._targets_unit = self._targets_unit, unit
         if unit == prev:
             return
+        # Converted for now; read again at the next poll to be sure.
+        self._targets_read_at = None
         self.probe_targets = {
             probe_number: round(TemperatureConverter.convert(float(target), prev, unit))
             for probe_number, target in self.probe_targets.items()
         }
 
+    def is_connected(self) -> bool:
+        """Whether the grill can be talked to.
+
+        A link released while the grill is off counts: it is reconnected
+        for the first command, so the controls stay usable rather than
+        going unavailable for as long as the grill sits in standby.
+        """
+        return self.link_released or self.api.is_connected()
+
+    def _release_wanted(self) -> bool:
+        return (
+            self._idle_link is not None
+            and self.config_entry is not None
+            and self.config_entry.options.get(CONF_RELEASE_IDLE_LINK, False)
+            and self.last_update_success
+            # Off as reported, not merely unknown.
+            and bool(self.data)
+            and self.data.get("moduleIsOn") is False
+            and not self._pending
+        )
+
+    @callback
+    def _schedule_release(self) -> None:
+        """Release the link once the grill has been off for a while."""
+        if not self._release_wanted():
+            if self._cancel_release is not None:
+                self._cancel_release()
+                self._cancel_release = None
+            return
+        if self.link_released or self._cancel_release is not None:
+            return
+        self._cancel_release = self.scheduler.schedule(
+            IDLE_RELEASE_SECONDS, self._async_release_link
+        )
+
+    def _polls_past_release(self) -> bool:
+        """Whether a released link leaves another transport to poll over.
+
+        Only with fallbacks, and only while one of them is up or is one a
+        poll brings back. Reporting the last state instead would leave a
+        grill lit at its panel looking off for the whole recheck interval,
+        when the relay or the local link could have said so at once.
+        """
+        return self.transports is not None and (
+            self.transports.is_connected() or self._reconnect_on_poll
+        )
+
+    async def _async_release_link(self) -> None:
+        """Disconnect from a grill that has been off for a while.
+
+        An ESPHome Bluetooth proxy has a handful of connection slots, and a
+        grill in standby held one for as long as it stayed in range -- for
+        nothing, since an idle grill has nothing to report. Released, the
+        slot serves other devices, and the link is taken back on demand: by
+        the first command (`async_rpc`), when the grill's advertisements
+        change, and every `IDLE_RECHECK_SECONDS` by the poll, since a grill
+        lit at its own panel may advertise exactly as it did in standby.
+        Until then the poll reports the last state without a round trip,
+        unless other transports are there to poll over instead.
+
+        Off unless the user chooses it: a released link costs the connect
+        time on the first command, and misses a panel start for up to the
+        recheck interval.
+        """
+        self._cancel_release = None
+        if not self._release_wanted() or self._idle_link is None:
+            return
+        self.logger.debug("Grill idle; releasing the Bluetooth connection")
+        self.link_released = True
+        self.links_released += 1
+        self._released_at = monotonic()
+        if self.advertisements is not None:
+            self.advertisements.park()
+        await self._idle_link.disconnect()
+
+    async def _async_reclaim_link(self) -> None:
+        """Reconnect a released link, timing the connect."""
+        if not self.link_released or self._idle_link is None:
+            return
+        self.logger.debug("Reconnecting the released Bluetooth connection")
+        started = monotonic()
+        try:
+            await self._idle_link.connect()
+        except Exception:
+            self.rpc_latency.record_failure("connect")
+            raise
+        self.rpc_latency.record("connect", monotonic() - started)
+        self.link_released = False
+        self._released_at = None
+        if self.advertisements is not None:
+            self.advertisements.unpark()
+
+    @callback
+    def _on_advertisement_changed(self) -> None:
+        # The grill has something new to say: check on it now rather than
+        # at the end of the recheck interval.
+        self._released_at = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def heard_nearby(self) -> None:
+        """The grill was heard advertising, without being connected to.
+
+        A grill on the cloud relay that is switched off still cost a ping
+        every cycle -- each one a round trip through the vendor's servers
+        that ends in a timeout -- and the only way to learn it had come back
+        was one of those pings succeeding. A grill in range of a Bluetooth
+        adapter or proxy says both for free: it advertises while it is
+        powered, and stops when it is not. So once it has been heard at all,
+        a grill unheard for `PRESENCE_SILENCE_SECONDS` that was also off, or
+        not answering, by its last poll is not polled (`_unheard`), and the
+        first advertisement after that polls it at once.
+
+        Only the poll is suspended. Commands go out as ever, and one poll is
+        let through every `IDLE_RECHECK_SECONDS` regardless, in case the
+        grill is lit and just out of range of whatever was hearing it.
+        """
+        self.heard_at = monotonic()
+        if self._unheard_since is not None:
+            self.logger.debug("Grill heard again; polling it now")
+            self._unheard_since = None
+            self.hass.async_create_task(self.async_request_refresh())
+        elif self._reconnect_on_poll and not self.api.is_connected():
+            self._retry_reconnect("advertisement")
+
+    @callback
+    def _retry_reconnect(self, why: str) -> None:
+        """Reconnect to a local grill now rather than when the wait is up."""
+        if self.reconnect_breaker.retry_now():
+            self.logger.debug("Reconnecting early, for a %s", why)
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _unheard(self) -> bool:
+        """Whether to skip this poll for the grill not being heard."""
+        now = monotonic()
+        if (
+            self.heard_at is None
+            or now - self.heard_at < PRESENCE_SILENCE_SECONDS
+            or self._pending
+            or (
+                self.last_update_success
+                and not (self.data and self.data.get("moduleIsOn") is False)
+            )
+        ):
+            self._unheard_since = None
+            return False
+        if self._unheard_since is None:
+            self.logger.debug("Grill not heard nearby; suspending the poll")
+            self._unheard_since = now
+        elif now - self._unheard_since >= IDLE_RECHECK_SECONDS:
+            # A poll to check on it, and the interval starts again.
+            self._unheard_since = now
+            return False
+        return True
+
+    @property
+    def reconnects_on_poll(self) -> bool:
+        """Whether the poll is what reconnects this grill's transport."""
+        return self._reconnect_on_poll
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Polls failed in a row, as counted for the backoff decision."""
+        return self._failed_polls
+
     @callback
     def async_update_listeners(self) -> None:
         """Reconcile what we hold with what arrived, before any entity reads.
@@ -264,21 +828,44 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         these decisions depend on arrives by three of them -- the poll, the
         push callback and `async_set_updated_data` -- and all three end here.
         """
-        self._expire_pending_setpoint()
+        self._expire_pending()
         self._follow_probe_targets_unit()
-        super().async_update_listeners()
+        self._schedule_release()
+        # The last stage of a poll happens here, after the base class has
+        # taken the result, so it is attributed to the cycle that produced
+        # it -- once, and only once that cycle has finished. Pushes and
+        # commands dispatch too, including mid-poll, and are not polls.
+        cycle = self.poll_cycles[-1] if self.poll_cycles else None
+        if (
+            cycle is None
+            or cycle.duration_ms is None
+            or cycle.error is not None
+            or "dispatch" in cycle.stages
+        ):
+            super().async_update_listeners()
+            return
+        with cycle.stage("dispatch"):
+            super().async_update_listeners()
 
     async def async_shutdown(self) -> None:
-        """Drop the settle timer along with the refresh one.
+        """Drop the scheduler's timer along with the refresh one.
 
-        Not for the refresh it would ask for -- the base class sets
+        Not for the refresh a settle would ask for -- the base class sets
         `_shutdown_requested`, and `_async_refresh` bails out on that, so a
-        late callback does nothing. It is the timer itself: an
-        `async_call_later` left scheduled outlives the entry by up to one
-        settle window, which is what Home Assistant's own tests fail on as a
-        lingering timer.
+        late callback does nothing. It is the timer itself: a loop timer
+        left scheduled outlives the entry by up to one settle window, which
+        is what Home Assistant's own tests fail on as a lingering timer.
+        Releasing the held values empties the scheduler already; shutting it
+        down as well covers whatever else comes to be scheduled on it.
         """
-        self._cancel_pending_setpoint_settle()
+        for key in list(self._pending):
+            self._release(key)
+        self._stop_seeding()
+        self.scheduler.shutdown()
+        # Written now rather than left to the delayed save, whose timer
+        # would otherwise outlive the entry.
+        if self._targets_store is not None and self._targets_unsaved:
+            await self._targets_store.async_save(self._held_targets_data())
         await super().async_shutdown()
 
     def probe_target(self, probe_number: int) -> int | None:
@@ -327,6 +914,18 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         """
         return self._from_fahrenheit(DEFAULT_PROBE_MIN_TEMP)
 
+    @property
+    def probe_target_ceiling(self) -> float:
+        """The highest probe target, in the grill's unit.
+
+        Here for the same reason as the floor: the probe number offers it as
+        its maximum, and the `set_probe_target` action refuses anything past
+        it, and the two must agree.
+        """
+        return TemperatureConverter.convert(
+            DEFAULT_PROBE_MAX_TEMP, UnitOfTemperature.FAHRENHEIT, self.grill_unit
+        )
+
     def _to_fahrenheit(self, temp: int) -> int:
         """A grill-unit value, in the unit `restored_targets` is kept in."""
         if self.grill_unit == UnitOfTemperature.FAHRENHEIT:
@@ -350,13 +949,30 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
     async def async_set_probe_target(self, probe_number: int, temp: int) -> None:
         """Set a probe's target, given in the grill's current unit."""
         self.restored_targets[probe_number] = self._to_fahrenheit(temp)
-        try:
-            await self.api.set_probe_target(probe_number, temp)
-        except UnsupportedOperation:
-            # The grill is off: its store rejects writes and is wiped anyway.
-            # Held here and written when it comes on.
+        self._save_held_targets()
+
+        async def send() -> None:
+            try:
+                await self.async_rpc(
+                    "set_probe_target", self.api.set_probe_target, probe_number, temp
+                )
+            except UnsupportedOperation:
+                # The grill is off: its store rejects writes and is wiped
+                # anyway. Held here and written when it comes on.
+                pass
+            else:
+                self.probe_targets[probe_number] = temp
+
+        key = f"p{probe_number}Target"
+        if not await self._async_coalesce(key, send):
             return
-        self.probe_targets[probe_number] = temp
+        # What the grill holds has just changed: read it back at the next
+        # poll rather than at the end of the slower cadence.
+        self._targets_read_at = None
+        # Held either way. On a cold grill it is still the value to show, and
+        # the board's `pNTarget` -- which `probe_target` puts first -- keeps
+        # the previous one until the board reports the new.
+        self._hold(key, temp, self.grill_unit)
 
     def note_restored_target(self, probe_number: int, temp: int) -> None:
         """Take a target restored from a previous run.
@@ -370,36 +986,125 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         for.
         """
         self.restored_targets[probe_number] = self._to_fahrenheit(temp)
+        self._save_held_targets()
         if probe_number not in self.probe_targets:
             self._targets_seeded = False
 
+    async def async_load_held_targets(self, store: Store[dict[str, Any]]) -> None:
+        """Load the targets held for this grill, before the first refresh.
+
+        So the first lit poll already knows what to seed. The number
+        entities used to be the only record, each restoring its own value
+        once it was added -- after the first refresh, so a grill already on
+        was seeded a poll late, by way of `note_restored_target` re-arming
+        it. They still restore for an entry that predates the store; with
+        the store loaded they find the probe held and leave it.
+        """
+        self._targets_store = store
+        if (data := await store.async_load()) is None:
+            return
+        for probe_number, held in data.get("targets", {}).items():
+            self.restored_targets.setdefault(int(probe_number), int(held))
+
+    @callback
+    def _save_held_targets(self) -> None:
+        if self._targets_store is None:
+            return
+        self._targets_unsaved = True
+        self._targets_store.async_delay_save(
+            self._held_targets_data, HELD_TARGETS_SAVE_DELAY
+        )
+
+    @callback
+    def _held_targets_data(self) -> dict[str, Any]:
+        self._targets_unsaved = False
+        return {
+            "targets": {
+                str(probe_number): held
+                for probe_number, held in sorted(self.restored_targets.items())
+            }
+        }
+
     async def _async_refresh_probe_targets(self, state: StateDict) -> None:
         """Track the targets the grill is holding. Never fatal."""
         if not state.get("moduleIsOn"):
             self.probe_targets = {}
             self._targets_seeded = False
+            self._targets_read_at = None
+            self._stop_seeding()
             return
-        try:
-            # Copied: we add to this below, and it is not ours to mutate.
-            self.probe_targets = dict(await self.api.get_probe_targets())
-            # Recorded at the point of the read rather than left for
-            # `_follow_probe_targets_unit` to infer: these values came back
-            # in the unit of the frame that carried them, and `self.data` is
-            # not updated until this poll returns -- so the inference would
-            # see a flip that has already been accounted for and convert
-            # them a second time. `state` is the merged frame, so a partial
-            # one that omits the flag still carries the previous value.
+        probes = range(1, (self.api.spec.meat_probes or 0) + 1)
+        for probe_number in probes:
+            if isinstance(state.get(f"p{probe_number}Target"), (int, float)):
+                self.frame_targets.add(probe_number)
+        if all(probe_number in self.frame_targets for probe_number in probes):
+            # Every target rides in the frame, which `probe_target` prefers
+            # anyway: the read would only fetch it a second time. Taken from
+            # the frame instead, so seeding still sees what the grill holds.
+            floor = self.probe_target_floor
+            self.probe_targets = {
+                probe_number: int(target)
+                for probe_number in probes
+                if isinstance(
+                    target := state.get(f"p{probe_number}Target"), (int, float)
+                )
+                and int(target) != floor
+            }
             self._targets_unit = self._unit_of(state)
-        except Exception as ex:  # noqa: BLE001
-            self.logger.debug("Could not fetch the probe targets: %s", ex)
+        elif (
+            self._targets_seeded
+            and self._targets_read_at is not None
+            and monotonic() - self._targets_read_at < PROBE_TARGETS_INTERVAL
+            and self._unit_of(state) == self._targets_unit
+        ):
+            # Read recently, and nothing since has given a reason to think
+            # it changed: no set from here, and no unit flip. Seeding is the
+            # exception -- it needs to know what the grill holds the moment
+            # it comes on, so that always reads.
             return
+        else:
+            try:
+                await self._async_read_probe_targets(state)
+            except Exception as ex:  # noqa: BLE001
+                self.logger.debug("Could not fetch the probe targets: %s", ex)
+                return
         if self._targets_seeded:
             return
         self._targets_seeded = True
-        # The grill has just come on, so anything we are holding that it does
-        # not know about goes over now. That is what makes setting a target on
-        # a cold grill mean anything. A target the grill already has was set
-        # elsewhere and wins.
+        self._start_seeding()
+
+    async def _async_read_probe_targets(self, state: StateDict) -> None:
+        """Read the targets the grill keeps outside its frames."""
+        # Copied: seeding adds to this, and it is not ours to mutate.
+        self.probe_targets = dict(
+            await self._async_read("get_probe_targets", self.api.get_probe_targets)
+        )
+        self._targets_read_at = monotonic()
+        # Recorded at the point of the read rather than left for
+        # `_follow_probe_targets_unit` to infer: these values came back in the
+        # unit of the frame that carried them, and `self.data` is not updated
+        # until this poll returns -- so the inference would see a flip that
+        # has already been accounted for and convert them a second time.
+        # `state` is the merged frame, so a partial one that omits the flag
+        # still carries the previous value.
+        self._targets_unit = self._unit_of(state)
+
+    @callback
+    def _start_seeding(self, attempt: int = 1) -> None:
+        """Write the targets we are holding to a grill that has just come on.
+
+        That is what makes setting a target on a cold grill mean anything. A
+        target the grill already has was set elsewhere and wins.
+
+        In a task of its own rather than in the poll: the poll only has to
+        notice the grill came on, and a four-probe grill behind the relay
+        made its first lit cycle four round trips longer by waiting here.
+        """
+        self._stop_seeding()
+        if not self._targets_seeded:
+            # The grill went off again before a retry came round.
+            return
+        wanted: dict[int, int] = {}
         for probe_number, held in self.restored_targets.items():
             if probe_number in self.probe_targets:
                 continue
@@ -410,12 +1115,63 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
                 # Not a target -- see `probe_target`. Restoring one would
                 # write the board's own placeholder back to it.
                 continue
-            try:
-                await self.api.set_probe_target(probe_number, temp)
-            except Exception as ex:  # noqa: BLE001
-                self.logger.debug("Could not seed a probe target: %s", ex)
-            else:
-                self.probe_targets[probe_number] = temp
+            wanted[probe_number] = temp
+        if wanted:
+            self._seeding = self.hass.async_create_task(
+                self._async_seed(wanted, attempt), "pitboss probe target seeding"
+            )
+
+    @callback
+    def _stop_seeding(self) -> None:
+        if self._cancel_seed_retry is not None:
+            self._cancel_seed_retry()
+            self._cancel_seed_retry = None
+        if self._seeding is not None:
+            self._seeding.cancel()
+            self._seeding = None
+
+    async def _async_seed(self, wanted: dict[int, int], attempt: int) -> None:
+        semaphore = asyncio.Semaphore(PROBE_SEED_CONCURRENCY)
+
+        async def seed(probe_number: int, temp: int) -> None:
+            async with semaphore:
+                try:
+                    # A write, but one nobody is waiting on: it queues with
+                    # the poll, not ahead of it.
+                    async with self.gate.slot(Priority.BACKGROUND):
+                        await self._async_timed(
+                            "set_probe_target",
+                            self.api.set_probe_target,
+                            probe_number,
+                            temp,
+                        )
+                except Exception as ex:  # noqa: BLE001
+                    self.logger.debug(
+                        "Could not seed probe %s's target (attempt %s): %s",
+                        probe_number,
+                        attempt,
+                        ex,
+                    )
+                    self.seed_results[probe_number] = f"{type(ex).__name__}: {ex}"
+                else:
+                    self.probe_targets[probe_number] = temp
+                    self.seed_results[probe_number] = "seeded"
+
+        await asyncio.gather(*(seed(n, temp) for n, temp in wanted.items()))
+        # The targets are the grill's now; entities showing them should say so.
+        self.async_update_listeners()
+        if (
+            any(self.seed_results[n] != "seeded" for n in wanted)
+            and attempt < PROBE_SEED_ATTEMPTS
+        ):
+            self._cancel_seed_retry = self.scheduler.schedule(
+                PROBE_SEED_RETRY_SECONDS, partial(self._retry_seeding, attempt + 1)
+            )
+
+    @callback
+    def _retry_seeding(self, attempt: int) -> None:
+        self._cancel_seed_retry = None
+        self._start_seeding(attempt)
 
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
@@ -446,7 +1202,9 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             return
         self._firmware_attempted_at = now
         try:
-            result = await self.api.get_firmware_version()
+            result = await self._async_read(
+                "get_firmware_version", self.api.get_firmware_version
+            )
             self.firmware_version = result.get("firmwareVersion")
         except Exception as ex:  # noqa: BLE001
             # Cosmetic; never worth failing a refresh over.
@@ -495,6 +1253,41 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         merged.update(state)
         return merged
 
+    def _record_reading(self, state: StateDict) -> None:
+        """Keep what the grill just reported, for the cook history.
+
+        Called where a reading arrives -- the poll's `get_state` and a pushed
+        frame -- rather than on every dispatch. A dispatch also follows a
+        failed poll, a poll skipped for the grill not being heard, and one
+        answered from a released link, each with the last state again, and
+        recording those put flat points into the history that the grill
+        never reported.
+        """
+        self.history.record(dt_util.utcnow().timestamp(), state, self._unit_of(state))
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule a timed refresh, the first one on this entry's phase.
+
+        The base class fires each refresh one interval after the last one
+        ended, a random fraction of a second past the whole second -- enough
+        to keep coordinators set up together from firing in the same
+        instant, not enough to keep grills apart by. The first refresh is
+        pushed back by the phase the fleet gave this entry, once; from
+        there the base class's own schedule carries it, each refresh an
+        interval after the last.
+        """
+        if self._phase is None:
+            super()._schedule_refresh()
+            return
+        fraction = self._microsecond
+        self._microsecond += self._phase
+        self._phase = None
+        try:
+            super()._schedule_refresh()
+        finally:
+            self._microsecond = fraction
+
     def _apply_poll_interval(self, state: StateDict) -> None:
         """Poll hard while the grill runs, back off in standby."""
         wanted = (
@@ -506,7 +1299,9 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
 
     async def _on_state_update(self, data: StateDict) -> None:
         self.logger.debug("Received data: %s", data)
+        self.push_frames.mark()
         merged = self._merge_state(data)
+        self._record_reading(merged)
         # Applied on the push path too: on Bluetooth a power change arrives
         # this way, and the poll interval should follow it without waiting
         # for the next poll to notice.
@@ -533,6 +1328,25 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             # lands.
             raise UpdateFailed(f"Grill refused the reconnect: {ex}") from ex
 
+    async def _async_reconnect(self) -> None:
+        """Reconnect a local grill, unless the breaker says to wait.
+
+        One at a time: whoever comes second finds the grill connected, or
+        the breaker open again, and does not try over the top.
+        """
+        async with self._reconnecting:
+            if self.api.is_connected():
+                return
+            if not self.reconnect_breaker.allow():
+                raise UpdateFailed("Grill not reachable; waiting to reconnect")
+            self.logger.debug("Reconnecting to the grill")
+            try:
+                await self._start_api()
+            except UpdateFailed:
+                self.reconnect_breaker.record_failure()
+                raise
+            self.reconnect_breaker.record_success()
+
     async def _async_refresh_sys_info(self) -> None:
         """Refresh the control board's system info. Never fatal.
 
@@ -543,15 +1357,32 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
         if self.sys_info and now - self._sys_info_at < SYS_INFO_INTERVAL:
             return
         try:
-            self.sys_info = await self.api.config.get_info()
+            self.sys_info = await self._async_read("get_info", self.api.config.get_info)
             self._sys_info_at = now
         except Exception as ex:  # noqa: BLE001
             self.logger.debug("Could not fetch the system info: %s", ex)
 
     async def _async_update_data(self) -> StateDict:
+        if self._unheard():
+            self.polls_skipped += 1
+            # Whatever the last poll made of the grill stands, entities
+            # unavailable included, without a round trip to confirm it.
+            if self.last_update_success:
+                return self.data
+            raise UpdateFailed("Grill not heard nearby; not polling it")
+        cycle = PollCycle()
+        self.poll_cycles.append(cycle)
+        self.polls_total += 1
         try:
-            state = await self._async_poll()
-        except UpdateFailed:
+            async with (
+                self.fleet.slot(cycle) if self.fleet is not None else nullcontext()
+            ):
+                state = await self._async_poll(cycle)
+        except Exception as ex:
+            cycle.finish(ex)
+            self.polls_failed += 1
+            if not isinstance(ex, UpdateFailed):
+                raise
             # Back off, but on a pattern rather than a single miss. The
             # interval is otherwise whatever the last *successful* read set,
             # so a grill that goes off while the connection stays up -- the
@@ -565,14 +1396,52 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             self._failed_polls += 1
             if self._failed_polls >= FAILURES_BEFORE_BACKOFF:
                 self._apply_poll_interval(StateDict())
+            self._judge_link()
             raise
+        cycle.finish()
         self._failed_polls = 0
+        # However it came back -- a command may have got through first.
+        self.reconnect_breaker.record_success()
+        self._judge_link()
         return state
 
-    async def _async_poll(self) -> StateDict:
+    def _judge_link(self) -> None:
+        """Tell the advertisement tracker whether the Bluetooth link has gone bad.
+
+        Judged here because this is where the evidence is: polls failing in
+        a row, or round trips slowing past `LINK_DEGRADED_MS`. The tracker
+        moves the link to a stronger source, if one hears the grill; see
+        `AdvertisementTracker.choose`.
+        """
+        if self.advertisements is None or self.link_released:
+            return
+        median = self.rpc_latency.recent().percentile(0.5)
+        if self._failed_polls >= FAILURES_BEFORE_BACKOFF or (
+            median is not None and median > LINK_DEGRADED_MS
+        ):
+            self.advertisements.degraded = True
+
+    async def _async_poll(self, cycle: PollCycle) -> StateDict:
+        # With fallbacks up, they answer for the grill instead; the failover
+        # passes over the released member, which it never reconnects.
+        if self.link_released and not self._polls_past_release():
+            if (
+                self._released_at is not None
+                and monotonic() - self._released_at < IDLE_RECHECK_SECONDS
+            ):
+                # Nothing to ask a grill in standby; see
+                # `_async_release_link`.
+                return self.data
+            with cycle.stage("start"):
+                try:
+                    await self._async_reclaim_link()
+                except Exception as ex:
+                    raise UpdateFailed(f"Could not reconnect: {ex}") from ex
+
         if not self._api_started:
             self.logger.debug("Starting API")
-            await self._start_api()
+            with cycle.stage("start"):
+                await self._start_api()
 
         if not self.api.is_connected():
             if not self._reconnect_on_poll:
@@ -589,11 +1458,16 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             # started a second receive loop -- which pytboss#572 fixed by
             # serializing the lifecycle, so this is now a question of who
             # owns reconnection rather than of corruption.
-            self.logger.debug("Reconnecting to the grill")
-            await self._start_api()
+            with cycle.stage("start"):
+                await self._async_reconnect()
 
         try:
-            await self.api.ping(timeout=10.0)
+            with cycle.stage("ping"):
+                await self._async_read(
+                    "ping",
+                    self.api.ping,
+                    timeout=self._read_timeout("ping") or RPC_TIMEOUT_CEILING,
+                )
         except NotConnectedError as ex:
             raise UpdateFailed("Grill not connected") from ex
         except TimeoutError as ex:
@@ -603,16 +1477,23 @@ class PitBossDataUpdateCoordinator(DataUpdateCoordinator[StateDict]):
             # handler, which reports "Timeout fetching pitboss data" instead.
             raise UpdateFailed("Grill did not answer") from ex
 
-        await self._async_refresh_sys_info()
-        await self._async_refresh_firmware_version()
+        with cycle.stage("sys_info"):
+            await self._async_refresh_sys_info()
+        with cycle.stage("firmware"):
+            await self._async_refresh_firmware_version()
 
         # Always fetch the current state to ensure sensors stay up-to-date.
         # Relying solely on push notifications means sensors can go stale after
         # a reconnect if push notifications stop being delivered.
         try:
-            state = self._merge_state(await self.api.get_state())
+            with cycle.stage("get_state"):
+                state = self._merge_state(
+                    await self._async_read("get_state", self.api.get_state)
+                )
+            self._record_reading(state)
             self._apply_poll_interval(state)
-            await self._async_refresh_probe_targets(state)
+            with cycle.stage("probe_targets"):
+                await self._async_refresh_probe_targets(state)
             return state
         except NotConnectedError as ex:
             raise UpdateFailed("Grill not connected") from ex
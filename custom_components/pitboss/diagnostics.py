@@ -0,0 +1,112 @@
+"""Diagnostics support for pitboss."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_DEVICE_ID, CONF_HOST, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import PitBossDataUpdateCoordinator
+from .fleet import fleet_for
+from .relay import DATA_RELAY
+
+# The device id is the grill's address on the relay: with the password it is
+# everything needed to drive the grill from anywhere. The host is somebody's
+# network layout. Neither tells a reader anything about a fault.
+TO_REDACT = {CONF_DEVICE_ID, CONF_HOST, CONF_PASSWORD, "psw"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    spec = coordinator.api.spec
+    interval = coordinator.update_interval
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "spec": {
+            "name": spec.name,
+            "control_board": spec.control_board.name,
+            "meat_probes": spec.meat_probes,
+            "has_lights": spec.has_lights,
+            "has_mpc": spec.has_mpc,
+            "min_temp": spec.min_temp,
+            "max_temp": spec.max_temp,
+            "temp_increments": spec.temp_increments,
+        },
+        "firmware_version": coordinator.firmware_version,
+        "sys_info": coordinator.sys_info,
+        "connected": coordinator.is_connected(),
+        "polling": {
+            "interval_seconds": (
+                interval.total_seconds() if interval is not None else None
+            ),
+            "last_update_success": coordinator.last_update_success,
+            "consecutive_failures": coordinator.consecutive_failures,
+            "polls_total": coordinator.polls_total,
+            "polls_failed": coordinator.polls_failed,
+            "cycles": [cycle.as_dict() for cycle in coordinator.poll_cycles],
+        },
+        "push": {
+            "frames_total": coordinator.push_frames.total,
+            "frames_per_minute": coordinator.push_frames.per_minute(),
+        },
+        "rpc_latency": coordinator.rpc_latency.as_dict(),
+        "rpc_timeouts": coordinator.rpc_timeouts.as_dict(),
+        "queue": coordinator.gate.as_dict(),
+        "bluetooth": (
+            coordinator.advertisements.as_dict()
+            if coordinator.advertisements is not None
+            else None
+        ),
+        "wake_to_ready_seconds": coordinator.wake_to_ready,
+        "transports": (
+            coordinator.transports.as_dict()
+            if coordinator.transports is not None
+            else None
+        ),
+        "reconnect_breaker": coordinator.reconnect_breaker.as_dict(),
+        "fleet": (
+            {**coordinator.fleet.as_dict(), **fleet_for(hass).as_dict()}
+            if coordinator.fleet is not None
+            else None
+        ),
+        # Shared by every cloud grill, so the same in each of their reports.
+        "relay": (
+            relay.as_dict()
+            if (relay := hass.data.get(DATA_RELAY)) is not None
+            else None
+        ),
+        "presence": {
+            "seconds_since_heard": (
+                round(monotonic() - coordinator.heard_at, 1)
+                if coordinator.heard_at is not None
+                else None
+            ),
+            "polls_skipped": coordinator.polls_skipped,
+        },
+        "idle_link": {
+            "released": coordinator.link_released,
+            "times_released": coordinator.links_released,
+        },
+        "commands_collapsed": coordinator.commands_collapsed,
+        "probe_target_seeding": coordinator.seed_results,
+        "probe_targets_in_frame": sorted(coordinator.frame_targets),
+        "history_samples": len(coordinator.history),
+        "settle": {
+            "window_seconds": coordinator.settle_window,
+            "confirmed_by_frame": coordinator.settle_confirmed,
+            "fell_back_to_poll": coordinator.settle_fell_back,
+            "learned": coordinator.settle_windows.as_dict(),
+        },
+        "state": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
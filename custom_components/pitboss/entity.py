@@ -26,6 +26,6 @@ class BaseEntity(CoordinatorEntity[PitBossDataUpdateCoordinator]):
         return (
             super().available
             and bool(self.coordinator.api)
-            and self.coordinator.api.is_connected()
+            and self.coordinator.is_connected()
             and bool(self.coordinator.data)
         )
@@ -0,0 +1,300 @@
+"""One grill, reached over whichever of several transports is answering best."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio import AbstractEventLoop
+from dataclasses import dataclass, field
+from time import monotonic
+
+from pytboss.exceptions import NotConnectedError
+from pytboss.transport import (
+    DEFAULT_TIMEOUT,
+    RawStateCallback,
+    RawVDataCallback,
+    RPCResult,
+    Transport,
+)
+
+from .breaker import ReconnectBreaker
+from .const import (
+    FAILOVER_FAILURES,
+    FAILOVER_LATENCY_WEIGHT,
+    FAILOVER_RETRY_SECONDS,
+    LOGGER,
+    RPC_TIMEOUT_CEILING,
+)
+from .gate import PriorityGate, current_priority
+from .metrics import AdaptiveTimeouts
+
+# What a member's reconnects are timed under, among its methods' waits.
+CONNECT = "connect"
+
+
+@dataclass(slots=True)
+class Member:
+    """One of the transports, and how it has been doing."""
+
+    name: str
+    transport: Transport
+    # Whether this transport recovers only by being spoken to -- local HTTP.
+    # See `reconnect_on_poll` on the coordinator.
+    reconnect_on_use: bool = False
+    latency: float | None = None
+    # The share of recent calls it carried, weighted as `latency` is.
+    reliability: float = 1.0
+    failure_streak: int = 0
+    # When it last failed, for how long it stays at the back.
+    failed_at: float | None = None
+    answered: int = 0
+    failed: int = 0
+    # How long to wait for each method over this transport before trying
+    # the next. Learned per member: a wait that suits the relay is far too
+    # short for a Bluetooth proxy, and one learned over Bluetooth far too
+    # long for the grill on the local network.
+    timeouts: AdaptiveTimeouts = field(default_factory=AdaptiveTimeouts)
+    # Where calls over this transport queue, if it takes few at a time --
+    # Bluetooth one, a local board a couple. Only this member's: the relay
+    # takes overlapping calls, and would otherwise wait in line behind a
+    # proxy for no reason. Calls keep the priority the coordinator gave them.
+    gate: PriorityGate = field(default_factory=lambda: PriorityGate(None))
+    # When to try reconnecting it, for a member that is reconnected on use;
+    # see `FailoverTransport._usable`. Held for the attempt.
+    breaker: ReconnectBreaker = field(default_factory=ReconnectBreaker)
+    reconnecting: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def record(self, seconds: float) -> None:
+        self.answered += 1
+        self.failure_streak = 0
+        self.reliability += FAILOVER_LATENCY_WEIGHT * (1.0 - self.reliability)
+        self.latency = (
+            seconds
+            if self.latency is None
+            else self.latency + FAILOVER_LATENCY_WEIGHT * (seconds - self.latency)
+        )
+
+    def record_failure(self) -> None:
+        self.failed += 1
+        self.failure_streak += 1
+        self.failed_at = monotonic()
+        self.reliability -= FAILOVER_LATENCY_WEIGHT * self.reliability
+
+    def demoted(self, now: float) -> bool:
+        """Whether it is at the back, behind every member that has not failed.
+
+        For `FAILOVER_RETRY_SECONDS` from its last failure. Calls stop at
+        the first member that answers, so one kept at the back until it
+        answered again would never be asked again while another worked: two
+        timeouts on the local link would leave the grill on the relay for
+        good. Once the wait is up it is ranked like the rest, and the next
+        call is its chance -- a fast member is tried first again, and
+        either answers and stays there or fails and goes back for another
+        wait.
+        """
+        return (
+            self.failure_streak >= FAILOVER_FAILURES
+            and self.failed_at is not None
+            and now - self.failed_at < FAILOVER_RETRY_SECONDS
+        )
+
+    def cost(self) -> float:
+        """Seconds a call over it is expected to take, failures included.
+
+        Its round trip, stretched by how often a call has not got through:
+        one that fails half the time costs twice its latency. Nothing
+        measured yet counts as free, so each member is tried early on.
+        """
+        return (self.latency or 0.0) / max(self.reliability, 0.01)
+
+    def as_dict(self) -> dict:
+        total = self.answered + self.failed
+        return {
+            "connected": self.transport.is_connected(),
+            "latency_ms": (
+                round(self.latency * 1000, 1) if self.latency is not None else None
+            ),
+            "success_rate": round(self.answered / total, 3) if total else None,
+            "reliability": round(self.reliability, 3),
+            "failure_streak": self.failure_streak,
+            "demoted": self.demoted(monotonic()),
+            "timeouts": self.timeouts.as_dict(),
+            "queue": self.gate.as_dict(),
+            "reconnect": self.breaker.as_dict() if self.reconnect_on_use else None,
+        }
+
+
+class FailoverTransport(Transport):
+    """Several transports to the same grill, used as one.
+
+    An entry used to be bound to one protocol, so a grill was unavailable
+    whenever that one was -- the relay down, or slow, with the grill two
+    metres from a Bluetooth proxy. Here each call goes over the member that
+    is answering best: one that has failed `FAILOVER_FAILURES` times running
+    goes to the back for a while, then the cheapest by recent round trip and
+    share of calls carried (`Member.cost`), then the order the members were
+    given in. A member nothing has been sent over yet counts as fast, so
+    each is measured early on, and a demoted one is tried again once its
+    wait is up, so the grill goes back to its best link when that recovers. A call that the transport
+    fails -- a timeout, a dropped link -- is tried on the next member before
+    it is given up on; one the grill answers with an error is the grill's
+    answer, and is not. The commands this integration sends set a value
+    rather than step one, so one repeated because its reply was lost lands
+    the same.
+
+    Each attempt is bounded on its own, by the wait learned for that method
+    over that member, within whatever `timeout` the caller gave: a deadline
+    around the whole call would run out on the first member's timeout,
+    before the next was ever asked. The coordinator leaves reads over this
+    transport unbounded for that reason.
+
+    The coordinator sees one transport, and one `PitBoss` over it, so the
+    state it holds carries straight across a failover. Frames pushed by any
+    member reach it.
+    """
+
+    def __init__(
+        self, members: list[Member], loop: AbstractEventLoop | None = None
+    ) -> None:
+        super().__init__(loop=loop)
+        self.members = members
+        self.active: str | None = None
+
+    def set_state_callback(self, state_callback: RawStateCallback) -> None:
+        super().set_state_callback(state_callback)
+        for member in self.members:
+            member.transport.set_state_callback(state_callback)
+
+    def set_vdata_callback(self, vdata_callback: RawVDataCallback) -> None:
+        super().set_vdata_callback(vdata_callback)
+        for member in self.members:
+            member.transport.set_vdata_callback(vdata_callback)
+
+    async def connect(self) -> None:
+        """Connect every member. Connected if any of them is."""
+        results = await asyncio.gather(
+            *(member.transport.connect() for member in self.members),
+            return_exceptions=True,
+        )
+        for member, result in zip(self.members, results, strict=True):
+            if isinstance(result, Exception):
+                LOGGER.debug("Could not connect over %s: %s", member.name, result)
+            elif isinstance(result, BaseException):
+                raise result
+        if not self.is_connected():
+            raise NotConnectedError()
+
+    async def disconnect(self) -> None:
+        await asyncio.gather(
+            *(member.transport.disconnect() for member in self.members),
+            return_exceptions=True,
+        )
+
+    def is_connected(self) -> bool:
+        return any(member.transport.is_connected() for member in self.members)
+
+    def ranked(self) -> list[Member]:
+        """The members in the order the next call tries them."""
+        order = {id(member): index for index, member in enumerate(self.members)}
+        now = monotonic()
+        return sorted(
+            self.members,
+            key=lambda member: (
+                member.demoted(now),
+                member.cost(),
+                order[id(member)],
+            ),
+        )
+
+    async def _usable(self, member: Member) -> bool:
+        """Whether a call can go over the member, reconnecting it if need be.
+
+        Only a member that recovers by being spoken to is reconnected here,
+        and only as its breaker allows: a local grill that is unreachable
+        is tried again on the breaker's backoff, not by every call that
+        gets as far as it. The attempt -- for local HTTP, a ping -- waits
+        its turn at the member's gate, and is bounded by the wait learned
+        for connecting over it rather than pytboss's thirty seconds. One at
+        a time: a call that waited on another's attempt takes its outcome.
+        """
+        if member.transport.is_connected():
+            return True
+        if not member.reconnect_on_use or not member.breaker.allow():
+            return False
+        async with member.reconnecting, member.gate.slot(current_priority()):
+            if member.transport.is_connected():
+                return True
+            if not member.breaker.allow():
+                return False
+            started = monotonic()
+            try:
+                async with asyncio.timeout(
+                    member.timeouts.get(CONNECT) or RPC_TIMEOUT_CEILING
+                ):
+                    await member.transport.connect()
+            except Exception as ex:  # noqa: BLE001
+                if isinstance(ex, TimeoutError):
+                    member.timeouts.timed_out(CONNECT)
+                LOGGER.debug("Could not reconnect over %s: %r", member.name, ex)
+                member.breaker.record_failure()
+                member.record_failure()
+                return False
+            member.timeouts.record(CONNECT, monotonic() - started)
+            member.breaker.record_success()
+        return member.transport.is_connected()
+
+    async def send_command(
+        self, method: str, params: dict, *, timeout: float | None = DEFAULT_TIMEOUT
+    ) -> RPCResult:
+        last: Exception = NotConnectedError()
+        for member in self.ranked():
+            if not await self._usable(member):
+                continue
+            bound = member.timeouts.get(method)
+            if timeout is not None:
+                bound = timeout if bound is None else min(bound, timeout)
+            try:
+                async with member.gate.slot(current_priority()):
+                    # Timed, and bounded, once it is this call's turn.
+                    started = monotonic()
+                    result = await member.transport.send_command(
+                        method, params, timeout=bound
+                    )
+            except (TimeoutError, NotConnectedError) as ex:
+                if isinstance(ex, TimeoutError):
+                    member.timeouts.timed_out(method)
+                member.record_failure()
+                LOGGER.debug("%s failed over %s: %r", method, member.name, ex)
+                last = ex
+                continue
+            elapsed = monotonic() - started
+            member.record(elapsed)
+            member.timeouts.record(method, elapsed)
+            if self.active != member.name:
+                LOGGER.debug("Now talking to the grill over %s", member.name)
+                self.active = member.name
+            return result
+        raise last
+
+    async def _send_prepared_command(self, cmd: dict) -> None:
+        """Send a command nothing waits on over the best member that is up.
+
+        What the base class's `send_command_without_answer` comes through,
+        bounded by its timeout. Handed on as a method and its parameters
+        rather than as the prepared command: each member numbers its own
+        commands, and a reply to an id borrowed from here could settle a
+        call of the member's that happened to have the same one.
+        """
+        for member in self.ranked():
+            if await self._usable(member):
+                async with member.gate.slot(current_priority()):
+                    await member.transport.send_command_without_answer(
+                        cmd["method"], cmd["params"]
+                    )
+                return
+        raise NotConnectedError()
+
+    def as_dict(self) -> dict:
+        return {
+            "active": self.active,
+            "members": {member.name: member.as_dict() for member in self.members},
+        }
@@ -0,0 +1,111 @@
+"""Every grill's polls, spread out and bounded, across config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, FLEET_POLL_CONCURRENCY, FLEET_STAGGER_SECONDS
+from .metrics import LatencyHistogram, PollCycle
+
+# Where the fleet lives in `hass.data`. Beside the coordinators rather than
+# among them.
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# Successive multiples of this, modulo one, are about as evenly spread as a
+# sequence can be however many of them are taken, so each grill's phase can
+# be fixed when it joins without moving anyone else's.
+_GOLDEN = 0.6180339887498949
+
+
+class FleetMember:
+    """One entry's place in the fleet: its phase, and its polls' waits."""
+
+    def __init__(self, fleet: PollFleet, entry_id: str, kind: str, offset: float):
+        self._fleet = fleet
+        self.entry_id = entry_id
+        self.kind = kind
+        self.offset = offset
+        self.polls = 0
+        self.lag = LatencyHistogram()
+
+    @asynccontextmanager
+    async def slot(self, cycle: PollCycle) -> AsyncIterator[None]:
+        """Hold one of the transport's poll slots for the length of a poll.
+
+        The wait for it is the cycle's "queue" stage, and the entry's lag.
+        """
+        semaphore = self._fleet.semaphore(self.kind)
+        queued = monotonic()
+        with cycle.stage("queue"):
+            await semaphore.acquire()
+        self.lag.record(monotonic() - queued)
+        self.polls += 1
+        self._fleet.in_flight[self.kind] += 1
+        try:
+            yield
+        finally:
+            self._fleet.in_flight[self.kind] -= 1
+            semaphore.release()
+
+    def as_dict(self) -> dict:
+        return {
+            "transport": self.kind,
+            "phase_offset_seconds": round(self.offset, 1),
+            "lag": self.lag.as_dict(),
+        }
+
+
+class PollFleet:
+    """The integration's view of every grill's polls at once.
+
+    Each entry's coordinator runs a timer of its own, and after a restart
+    every entry is set up in the same second, so their polls fired in
+    lockstep at every interval after -- a burst of requests at the relay,
+    and a scramble for the same proxy's connection slots, then nothing.
+    Here each entry is given a phase when it joins, spread across
+    `FLEET_STAGGER_SECONDS` (the active interval, the shortest any grill
+    polls at), and the polls in flight over each transport are capped at
+    `FLEET_POLL_CONCURRENCY`. How long each poll waited for its slot is its
+    lag, kept per entry for the diagnostics.
+    """
+
+    def __init__(self) -> None:
+        self.members: dict[str, FleetMember] = {}
+        self._joined = 0
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.in_flight: Counter[str] = Counter()
+
+    def join(self, entry_id: str, kind: str) -> FleetMember:
+        offset = (self._joined * _GOLDEN) % 1 * FLEET_STAGGER_SECONDS
+        self._joined += 1
+        member = self.members[entry_id] = FleetMember(self, entry_id, kind, offset)
+        return member
+
+    def leave(self, entry_id: str) -> None:
+        self.members.pop(entry_id, None)
+
+    def semaphore(self, kind: str) -> asyncio.Semaphore:
+        if (semaphore := self._semaphores.get(kind)) is None:
+            semaphore = self._semaphores[kind] = asyncio.Semaphore(
+                FLEET_POLL_CONCURRENCY.get(kind, 1)
+            )
+        return semaphore
+
+    def as_dict(self) -> dict:
+        return {
+            "entries": len(self.members),
+            "in_flight": dict(self.in_flight),
+        }
+
+
+def fleet_for(hass: HomeAssistant) -> PollFleet:
+    """The fleet, created the first time an entry asks for it."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = PollFleet()
+    return fleet
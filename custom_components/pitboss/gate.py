@@ -0,0 +1,118 @@
+"""Who talks to the grill next, on transports that take one call at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from itertools import count
+from time import monotonic
+
+from .metrics import LatencyHistogram
+
+
+class Priority(IntEnum):
+    """Lower goes first."""
+
+    # Something a user is waiting to see happen.
+    COMMAND = 0
+    # The poll, and anything else nobody is watching.
+    BACKGROUND = 1
+
+
+# The priority of the call in flight, for a gate further down the same call
+# to queue it by -- one in front of a single transport, inside the
+# coordinator's. Set for the length of every `slot`.
+_priority: ContextVar[Priority] = ContextVar(
+    "pitboss_priority", default=Priority.BACKGROUND
+)
+
+
+def current_priority() -> Priority:
+    """The priority of the call being made, as its outermost gate gave it."""
+    return _priority.get()
+
+
+class PriorityGate:
+    """At most `limit` calls in flight, commands ahead of background reads.
+
+    A Bluetooth link answers one call at a time, so a command issued halfway
+    through a poll used to queue behind the ping, the sys-info read, the
+    state read and the probe-target read -- four round trips over a proxy
+    before the light came on. Here the waiting calls form a queue ordered by
+    priority, then by arrival: a command goes out as soon as the call in
+    flight answers, and the rest of the poll waits behind it. Nothing in
+    flight is interrupted; a call already sent is answered whatever it was.
+
+    With no limit there is nothing to queue for, and `slot` costs nothing --
+    the relay and local HTTP take overlapping calls.
+
+    How long each priority waited is kept per priority, so the diagnostics
+    show whether commands are in fact going first.
+    """
+
+    def __init__(self, limit: int | None) -> None:
+        self.limit = limit
+        self._active = 0
+        self._waiters: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        self._seq = count()
+        self.waits = {priority: LatencyHistogram() for priority in Priority}
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold one of the `limit` places for the length of the block."""
+        token = _priority.set(priority)
+        try:
+            if self.limit is None:
+                yield
+                return
+            started = monotonic()
+            await self._acquire(priority)
+            self.waits[priority].record(monotonic() - started)
+            try:
+                yield
+            finally:
+                self._release()
+        finally:
+            _priority.reset(token)
+
+    async def _acquire(self, priority: Priority) -> None:
+        assert self.limit is not None
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Handed the place in the same tick as being cancelled: it is
+            # ours to give up, or the gate is one place short for good.
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        # A waiter that gave up left its future cancelled in the queue; it
+        # is dropped here rather than searched for when it gives up.
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._active += 1
+                future.set_result(None)
+                return
+
+    def as_dict(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._active,
+            "waiting": sum(not future.done() for _, _, future in self._waiters),
+            "wait": {
+                priority.name.lower(): histogram.as_dict()
+                for priority, histogram in self.waits.items()
+            },
+        }
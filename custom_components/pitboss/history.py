@@ -0,0 +1,123 @@
+"""The recent run of a grill's temperatures, kept in memory for actions."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+
+from homeassistant.util.unit_conversion import TemperatureConverter
+from pytboss.grills import StateDict
+
+from .const import HISTORY_RESOLUTION_SECONDS, HISTORY_SAMPLES
+
+# The state keys a cook is told by, and the names they are returned under.
+SERIES = {
+    "grillTemp": "grill",
+    "grillSetTemp": "setpoint",
+    "smokerActTemp": "smoker",
+    "p1Temp": "probe_1",
+    "p2Temp": "probe_2",
+    "p3Temp": "probe_3",
+    "p4Temp": "probe_4",
+}
+
+type Point = tuple[float, float]
+
+
+class CookHistory:
+    """Temperatures as the grill reported them, one row per resolution step.
+
+    Getting a cook's curves out of the recorder means a query per entity and
+    a scan of the database for each. The coordinator already sees every
+    reading go past, so it keeps the last `HISTORY_SAMPLES` of them here --
+    at `HISTORY_RESOLUTION_SECONDS` apart that is the whole of a long cook --
+    and an action reads them straight back. A row is a tuple, not a dict, so
+    a full buffer stays well under a megabyte.
+
+    Each row carries the unit it was read in. A grill switched between units
+    mid-cook would otherwise return half its curve in the wrong one; reads
+    convert every row to the unit asked for.
+    """
+
+    def __init__(self, maxlen: int = HISTORY_SAMPLES) -> None:
+        self._rows: deque[tuple[float, str, tuple[float | None, ...]]] = deque(
+            maxlen=maxlen
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def record(self, at: float, state: StateDict, unit: str) -> None:
+        """Keep a reading, unless one was kept less than a step ago.
+
+        Pushes arrive every second or two on some transports; a reading per
+        step is all a curve needs, and keeps the buffer covering hours.
+        """
+        if self._rows and at - self._rows[-1][0] < HISTORY_RESOLUTION_SECONDS:
+            return
+        values = tuple(_number(state.get(key)) for key in SERIES)
+        if any(value is not None for value in values):
+            self._rows.append((at, unit, values))
+
+    def series(self, start: float, end: float, unit: str) -> dict[str, list[Point]]:
+        """Every reading between `start` and `end`, by series, in `unit`.
+
+        A series with no readings in the window -- a probe never plugged in
+        -- is left out rather than returned empty.
+        """
+        points: dict[str, list[Point]] = {name: [] for name in SERIES.values()}
+        for at, row_unit, values in self._rows:
+            if not start <= at <= end:
+                continue
+            for name, value in zip(SERIES.values(), values, strict=True):
+                if value is None:
+                    continue
+                if row_unit != unit:
+                    value = TemperatureConverter.convert(value, row_unit, unit)
+                points[name].append((at, value))
+        return {name: series for name, series in points.items() if series}
+
+
+def _number(value: object) -> float | None:
+    # A reading the board sent as text, or one it could not take (an
+    # unplugged probe reads as null), is not a point on a curve.
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
+
+
+def lttb(points: Sequence[Point], threshold: int) -> list[Point]:
+    """Largest-triangle-three-buckets: `threshold` points that keep the shape.
+
+    Averaging or taking every nth point flattens exactly what a cook is
+    looked at for -- the stall, the spike when the lid opened. This keeps,
+    from each of `threshold - 2` buckets, the point forming the largest
+    triangle with the point kept before it and the average of the bucket
+    after, so peaks and turns survive. The first and last points are always
+    kept.
+    """
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+    sampled = [points[0]]
+    every = (len(points) - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # The next bucket's average is the third corner of the triangle.
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, len(points))
+        next_bucket = points[next_start:next_end]
+        avg_x = sum(x for x, _ in next_bucket) / len(next_bucket)
+        avg_y = sum(y for _, y in next_bucket) / len(next_bucket)
+
+        ax, ay = points[a]
+        best, best_area = -1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            x, y = points[j]
+            # Twice the area; only the comparison matters.
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
@@ -48,14 +48,18 @@ class GrillLight(BaseEntity, LightEntity):
     @property
     def is_on(self) -> bool | None:
         """Returns True if the light is on."""
-        if data := self.coordinator.data:
-            return data.get("lightState")
+        if self.coordinator.data:
+            return self.coordinator.value("lightState")
         return None
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the light."""
-        await self.coordinator.api.turn_light_on()
+        await self.coordinator.async_write(
+            "lightState", True, "turn_light_on", self.coordinator.api.turn_light_on
+        )
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the light."""
-        await self.coordinator.api.turn_light_off()
+        await self.coordinator.async_write(
+            "lightState", False, "turn_light_off", self.coordinator.api.turn_light_off
+        )
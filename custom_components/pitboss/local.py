@@ -0,0 +1,42 @@
+"""The HTTP session a local grill is spoken to over."""
+
+from __future__ import annotations
+
+from aiohttp import ClientSession, TCPConnector
+
+from .const import LOCAL_HTTP_CONNECTIONS, LOCAL_HTTP_KEEPALIVE_SECONDS
+
+
+def create_local_session() -> ClientSession:
+    """A connection pool for one local grill, and no one else.
+
+    Local grills used to share Home Assistant's session, which is tuned for
+    cloud APIs: up to a hundred connections to a host, each kept fifteen
+    seconds after its last request. Against the grill's web server -- a
+    Mongoose event loop on the same microcontroller that runs the fire --
+    that was the wrong way round on both counts. A poll's independent
+    requests opened a connection each when they overlapped, and at the
+    standby interval every poll found its connection gone and paid a TCP
+    handshake over whatever Wi-Fi reaches the grill before it could ask
+    anything. On a weak link that handshake is where the timeouts were.
+
+    This one opens at most `LOCAL_HTTP_CONNECTIONS` to the board, queuing
+    the rest, and keeps each for `LOCAL_HTTP_KEEPALIVE_SECONDS`: longer than
+    the standby interval, so a grill that is off is polled over the same
+    connection every time too. One the board closes sooner is dropped from
+    the pool when it does, and the next request opens another.
+
+    The calls waiting for one of those connections queue in front of the
+    transport rather than in the pool, so that commands go ahead of the
+    poll; see `PriorityGate`. Not made with Home Assistant's
+    `async_create_clientsession`: that always puts the session on the
+    shared pool, whose limits are the ones this is here to replace.
+
+    Ours to close, on unload. pytboss leaves a session it was given alone.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit_per_host=LOCAL_HTTP_CONNECTIONS,
+            keepalive_timeout=LOCAL_HTTP_KEEPALIVE_SECONDS,
+        )
+    )
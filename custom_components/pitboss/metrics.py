@@ -0,0 +1,280 @@
+"""Timings and counters for the coordinator, cheap enough to keep always on."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from math import ceil
+from time import monotonic, time
+
+from .const import (
+    RPC_TIMEOUT_CEILING,
+    RPC_TIMEOUT_FACTOR,
+    RPC_TIMEOUT_FLOOR,
+    RPC_TIMEOUT_MIN_SAMPLES,
+    RPC_TIMEOUT_QUANTILE,
+    RPC_TIMEOUT_WINDOW,
+)
+
+# Upper bounds of the latency buckets, in milliseconds. Fixed rather than
+# learned so a recording is one bisect and one increment, and so histograms
+# from different runs -- or different grills -- line up bucket for bucket.
+# Spaced for what the transports actually do: a local HTTP reply lands in the
+# tens of milliseconds, Bluetooth through a proxy in the hundreds, the cloud
+# relay anywhere up to the transport's own 30-second timeout.
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# How long one generation of the recent window lasts. Percentiles are read
+# over this generation and the one before it, so they cover between one and
+# two of these -- recent enough that a proxy going bad shows within the hour,
+# rather than being averaged into everything since the entry loaded.
+WINDOW_SECONDS = 15 * 60
+
+
+class LatencyHistogram:
+    """Round trips counted into `BUCKETS_MS`, plus the exact maximum."""
+
+    __slots__ = ("counts", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        # One more bucket than there are bounds: the overflow.
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        """A new histogram holding both sets of samples."""
+        merged = LatencyHistogram()
+        merged.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        merged.max_ms = max(self.max_ms, other.max_ms)
+        merged.total_ms = self.total_ms + other.total_ms
+        return merged
+
+    def percentile(self, q: float) -> float | None:
+        """The upper bound of the bucket the `q` quantile falls in.
+
+        An upper bound, so an estimate that errs slow -- the useful direction
+        for a number that is watched for getting worse. Capped at the real
+        maximum, which the bound can overshoot when every sample in the
+        bucket sits at its low end.
+        """
+        if not (count := self.count):
+            return None
+        rank = max(1, ceil(q * count))
+        seen = 0
+        for bound, bucket in zip((*BUCKETS_MS, None), self.counts):
+            seen += bucket
+            if seen >= rank:
+                return self.max_ms if bound is None else min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        count = self.count
+        labels = [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "count": count,
+            "mean_ms": round(self.total_ms / count, 1) if count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1) if count else None,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RpcLatency:
+    """Latency of every call made to one grill, by method.
+
+    Two views of the same samples. Per method since the entry loaded, for the
+    diagnostics download, where what matters is which call is slow. And all
+    methods together over a rolling window, for the sensors, where what
+    matters is whether the link is getting slower.
+
+    Only answered calls are timed. A call that timed out says how long we
+    were willing to wait, not how long the grill took, and a grill that is
+    off behind the cloud relay would otherwise fill the window with the
+    transport's timeout. Those are counted as failures instead.
+    """
+
+    def __init__(self) -> None:
+        self.methods: dict[str, LatencyHistogram] = {}
+        self.failures: Counter[str] = Counter()
+        self._current = LatencyHistogram()
+        self._previous = LatencyHistogram()
+        self._rotated_at = monotonic()
+
+    def record(self, method: str, seconds: float) -> None:
+        if (histogram := self.methods.get(method)) is None:
+            histogram = self.methods[method] = LatencyHistogram()
+        histogram.record(seconds)
+        self._rotate()
+        self._current.record(seconds)
+
+    def record_failure(self, method: str) -> None:
+        self.failures[method] += 1
+
+    def recent(self) -> LatencyHistogram:
+        """Every method's round trips over the last one to two windows."""
+        self._rotate()
+        return self._previous.merge(self._current)
+
+    def _rotate(self) -> None:
+        now = monotonic()
+        elapsed = now - self._rotated_at
+        if elapsed < WINDOW_SECONDS:
+            return
+        # Two windows or more without a rotation means nothing recorded in
+        # the last one either: both generations are stale.
+        self._previous = (
+            self._current if elapsed < 2 * WINDOW_SECONDS else LatencyHistogram()
+        )
+        self._current = LatencyHistogram()
+        self._rotated_at = now
+
+    def as_dict(self) -> dict:
+        return {
+            "recent": self.recent().as_dict(),
+            "methods": {
+                method: histogram.as_dict()
+                for method, histogram in sorted(self.methods.items())
+            },
+            "failures": dict(self.failures),
+        }
+
+
+class PollCycle:
+    """Where one poll spent its time, stage by stage.
+
+    Stages are recorded as they finish, so a cycle that failed partway shows
+    exactly how far it got -- which is most of what a support request about
+    an unavailable grill needs to know.
+    """
+
+    __slots__ = ("_started", "duration_ms", "error", "stages", "started_at")
+
+    def __init__(self) -> None:
+        self.started_at = time()
+        self._started = monotonic()
+        self.stages: dict[str, float] = {}
+        self.duration_ms: float | None = None
+        self.error: str | None = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = monotonic()
+        try:
+            yield
+        finally:
+            self.stages[name] = round((monotonic() - started) * 1000, 1)
+
+    def finish(self, error: Exception | None = None) -> None:
+        self.duration_ms = round((monotonic() - self._started) * 1000, 1)
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def as_dict(self) -> dict:
+        return {
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "stages_ms": dict(self.stages),
+            "error": self.error,
+        }
+
+
+class RateCounter:
+    """How often something happens, over its last `maxlen` occurrences."""
+
+    def __init__(self, maxlen: int = 120) -> None:
+        self.total = 0
+        self._at: deque[float] = deque(maxlen=maxlen)
+
+    def mark(self) -> None:
+        self.total += 1
+        self._at.append(monotonic())
+
+    def per_minute(self) -> float | None:
+        """The recent rate, or `None` with too little to go on.
+
+        Measured from the first remembered occurrence to now rather than to
+        the last one, so a stream that stops reads as slowing down instead of
+        holding its last rate forever.
+        """
+        if len(self._at) < 2:
+            return None
+        return round(len(self._at) * 60 / (monotonic() - self._at[0]), 2)
+
+
+class AdaptiveTimeouts:
+    """How long to wait for each method, from how long it has been taking.
+
+    Fed the same answered round trips as `RpcLatency`, but kept as raw
+    samples over a short window rather than bucketed: a timeout sized from a
+    bucket bound would be up to two and a half times too generous, which is
+    the whole of what this is meant to save.
+
+    A timeout backs the method's next wait off, doubling up to the ceiling.
+    A grill that is slow rather than gone then gets answered on the next
+    attempt instead of failing every one at a wait learned while it was
+    fast; the first answer puts it back to the learned value.
+
+    The bounds default to the RPC ones; the coordinator's settle window is
+    the same problem over a different wait and passes its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        floor: float = RPC_TIMEOUT_FLOOR,
+        ceiling: float = RPC_TIMEOUT_CEILING,
+        factor: float = RPC_TIMEOUT_FACTOR,
+        min_samples: int = RPC_TIMEOUT_MIN_SAMPLES,
+    ) -> None:
+        self._floor = floor
+        self._ceiling = ceiling
+        self._factor = factor
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._backoff: Counter[str] = Counter()
+
+    def record(self, method: str, seconds: float) -> None:
+        if (samples := self._samples.get(method)) is None:
+            samples = self._samples[method] = deque(maxlen=RPC_TIMEOUT_WINDOW)
+        samples.append(seconds)
+        self._backoff.pop(method, None)
+
+    def timed_out(self, method: str) -> None:
+        self._backoff[method] += 1
+
+    def get(self, method: str) -> float | None:
+        """The wait for `method`, or `None` while there is too little to go on."""
+        samples = self._samples.get(method, ())
+        if len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        high = ordered[min(len(ordered) - 1, int(RPC_TIMEOUT_QUANTILE * len(ordered)))]
+        learned = max(self._floor, high * self._factor)
+        # Capped before exponentiating: a grill that stays gone keeps timing
+        # out, and the count has no other bound.
+        backoff = min(self._backoff[method], 8)
+        return min(self._ceiling, learned * 2**backoff)
+
+    def as_dict(self) -> dict:
+        return {
+            method: {
+                "timeout_seconds": self.get(method),
+                "samples": len(samples),
+                "backoff": self._backoff[method],
+            }
+            for method, samples in sorted(self._samples.items())
+        }
@@ -11,19 +11,16 @@ from homeassistant.components.number import (
 from homeassistant.components.number.const import NumberDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import (
     DEFAULT_PROBE_CELSIUS_STEP,
     DEFAULT_PROBE_FAHRENHEIT_STEP,
-    DEFAULT_PROBE_MAX_TEMP,
     DOMAIN,
     GRILL_CELSIUS_STEP,
     GRILL_FAHRENHEIT_STEP,
-    MCU_SETTLE_SECONDS,
     probe_label,
 )
 from .coordinator import PitBossDataUpdateCoordinator
@@ -151,9 +148,6 @@ class TargetProbeTemperature(BaseEntity, RestoreNumber):
         self._attr_unique_id = f"{entity_description.key}_{entry_unique_id}"
         label = probe_label(coordinator.has_mpc, entity_description.probe_number)
         self._attr_name = f"{label} target"
-        self._pending_value: int | None = None
-        self._pending_unit: str | None = None
-        self._cancel_settle: CALLBACK_TYPE | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore the target we last set for this probe.
@@ -161,11 +155,13 @@ class TargetProbeTemperature(BaseEntity, RestoreNumber):
         The grill's own store is wiped when it is switched off, so without
         this a target set on a cold grill would not survive a Home Assistant
         restart. Anything the grill is holding wins over the restored value.
+
+        The coordinator's own store is the record now, loaded before the
+        first refresh. This only carries a target across from an entry that
+        predates it: with the store loaded, the probe is already held and
+        this returns early.
         """
         await super().async_added_to_hass()
-        # Registered once rather than per set: `async_on_remove` only appends,
-        # so re-registering would grow the list for the life of the entity.
-        self.async_on_remove(self._cancel_pending_settle)
         probe_number = self.entity_description.probe_number
         if self.coordinator.probe_target(probe_number) is not None:
             return
@@ -182,12 +178,6 @@ class TargetProbeTemperature(BaseEntity, RestoreNumber):
             )
         self.coordinator.note_restored_target(probe_number, round(value))
 
-    @callback
-    def _cancel_pending_settle(self) -> None:
-        if self._cancel_settle is not None:
-            self._cancel_settle()
-            self._cancel_settle = None
-
     @property
     def native_unit_of_measurement(self) -> str:
         """Return the unit of measurement of the entity."""
@@ -211,52 +201,21 @@ class TargetProbeTemperature(BaseEntity, RestoreNumber):
         puts the board's own `pNTarget` first, and that is still the previous
         value for as long as it takes the board to report the new one, so
         reading it straight back would make the slider snap to the old
-        setting.
+        setting. The held value is the coordinator's rather than this
+        entity's, like every control's; the target-reached sensor reads
+        `probe_target` and follows the grill instead.
         """
-        if self._pending_value is not None:
-            return self._pending_value
+        if (
+            pending := self.coordinator.pending(self.entity_description.key)
+        ) is not None:
+            return pending
         return self.coordinator.probe_target(self.entity_description.probe_number)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        # A unit change invalidates the held number; see the climate entity
-        # for the reasoning. The grill's own target wins either way.
-        if self._pending_value is not None and (
-            self.coordinator.grill_unit != self._pending_unit
-            or self.coordinator.probe_target(self.entity_description.probe_number)
-            == self._pending_value
-        ):
-            self._pending_value = None
-        super()._handle_coordinator_update()
-
     async def async_set_native_value(self, value: float) -> None:
         """Set the target, by whichever route this probe supports."""
-        target = round(value)
         await self.coordinator.async_set_probe_target(
-            self.entity_description.probe_number, target
+            self.entity_description.probe_number, round(value)
         )
-        self._pending_value = target
-        self._pending_unit = self.coordinator.grill_unit
-        # Siblings read the coordinator too -- the target-reached sensor
-        # follows the grill rather than this pending value.
-        self.coordinator.async_update_listeners()
-        # A second set inside the window replaces the timer rather than
-        # queueing another.
-        self._cancel_pending_settle()
-        self._cancel_settle = async_call_later(
-            self.hass, MCU_SETTLE_SECONDS, self._async_confirm
-        )
-
-    async def _async_confirm(self, _now) -> None:
-        self._cancel_settle = None
-        await self.coordinator.async_request_refresh()
-        # One settle window is all the pending value is for. If the refresh
-        # confirmed it, `_handle_coordinator_update` has already cleared it;
-        # if the grill did not take it, follow the grill rather than assert a
-        # value it will never report.
-        if self._pending_value is not None:
-            self._pending_value = None
-            self.async_write_ha_state()
 
     @property
     def native_min_value(self) -> float:
@@ -274,8 +233,4 @@ class TargetProbeTemperature(BaseEntity, RestoreNumber):
     @property
     def native_max_value(self) -> float:
         """Return the maximum value."""
-        return TemperatureConverter.convert(
-            DEFAULT_PROBE_MAX_TEMP,
-            UnitOfTemperature.FAHRENHEIT,
-            self.native_unit_of_measurement,
-        )
+        return self.coordinator.probe_target_ceiling
@@ -0,0 +1,183 @@
+"""Every cloud grill's connection to the relay, managed as one fleet."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from time import monotonic
+
+from aiohttp import ClientConnectionError, ClientSession, ClientWebSocketResponse
+from homeassistant.core import HomeAssistant
+from pytboss import wss
+from pytboss.exceptions import GrillUnavailable
+
+from .breaker import BreakerState, ReconnectBreaker
+from .const import (
+    DOMAIN,
+    RELAY_BACKOFF_BASE_SECONDS,
+    RELAY_BACKOFF_MAX_SECONDS,
+    RELAY_REFUSED_GRILLS,
+)
+
+# Where the relay manager lives in `hass.data`. Beside the coordinators
+# rather than among them.
+DATA_RELAY = f"{DOMAIN}_relay"
+
+
+class RelayManager:
+    """What the cloud grills on this instance know about the relay together.
+
+    The relay takes one websocket per grill -- its endpoint is
+    `/to/<grill id>`, and there is nothing to say which grill a frame on a
+    shared socket was for -- so the sockets themselves cannot be shared.
+    What can be is everything around them. They already share Home
+    Assistant's HTTP session, and with it one DNS cache and one TLS context.
+    This adds the relay's health. Each transport reconnected on its own
+    backoff, so with the relay down, ten grills probed it ten times over
+    every few seconds, and each had to fail on its own before it waited.
+    Here the first failure opens a `ReconnectBreaker` the whole fleet
+    shares: the others wait instead of trying, one probe goes out at a time
+    when the wait is up, and the moment one gets through the rest follow.
+
+    Only a relay that cannot be reached opens it: DNS, TCP or TLS failing,
+    or no answer at all. A relay that answers but turns one grill away --
+    its handshake refused, that grill unknown or offline upstream -- says
+    nothing about the others, which carry on, and that grill backs off on
+    its own as it always has. Once `RELAY_REFUSED_GRILLS` are being turned
+    away together, though, the fault is the relay's, and it opens then.
+
+    A setup does not wait: `connect()` fails at once while the relay is
+    known to be down, as a failed handshake would, and the entry retries
+    later as it always has.
+    """
+
+    def __init__(self) -> None:
+        self.breaker = ReconnectBreaker(
+            base=RELAY_BACKOFF_BASE_SECONDS, ceiling=RELAY_BACKOFF_MAX_SECONDS
+        )
+        self.connections: dict[str, SharedRelayConnection] = {}
+        self.handshakes = 0
+        self.handshakes_held = 0
+        # The connections whose last handshake the relay answered and refused.
+        self._refused: set[SharedRelayConnection] = set()
+        self._probing = False
+        # Set, and replaced, whenever a handshake settles what is known.
+        self._settled = asyncio.Event()
+
+    def add(self, entry_id: str, conn: SharedRelayConnection) -> None:
+        self.connections[entry_id] = conn
+
+    def remove(self, entry_id: str, conn: SharedRelayConnection) -> None:
+        # Not a newer setup's connection, should the two overlap.
+        if self.connections.get(entry_id) is conn:
+            del self.connections[entry_id]
+        self._refused.discard(conn)
+
+    async def _admit(self, wait: bool) -> bool:
+        """Wait for a turn to open a socket. Whether it is a probe."""
+        held = False
+        while (state := self.breaker.state) is not BreakerState.CLOSED:
+            if state is BreakerState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            if not wait:
+                raise GrillUnavailable("The relay is unreachable; not trying yet")
+            if not held:
+                held = True
+                self.handshakes_held += 1
+            # Until the wait is up, or -- with a probe out -- until it lands.
+            remaining = (
+                self.breaker.retry_at - monotonic()
+                if state is BreakerState.OPEN and self.breaker.retry_at is not None
+                else None
+            )
+            with suppress(TimeoutError):
+                async with asyncio.timeout(remaining):
+                    await self._settled.wait()
+        return False
+
+    def _settle(self, probe: bool, reached: bool | None) -> None:
+        if probe:
+            self._probing = False
+        if reached:
+            self.breaker.record_success()
+        elif reached is not None and (
+            probe or self.breaker.state is BreakerState.CLOSED
+        ):
+            # A failure while open was already counted by whoever opened it.
+            self.breaker.record_failure()
+        self._settled.set()
+        self._settled = asyncio.Event()
+
+    async def open_socket(
+        self, conn: SharedRelayConnection, wait: bool
+    ) -> ClientWebSocketResponse:
+        probe = await self._admit(wait)
+        self.handshakes += 1
+        try:
+            sock = await conn.handshake()
+        except GrillUnavailable as ex:
+            self._settle(probe, reached=not self._relay_failed(conn, ex))
+            raise
+        except BaseException:
+            # Cancelled by a disconnect: nothing was learned about the relay,
+            # but a probe that was out is not any longer.
+            self._settle(probe, reached=None)
+            raise
+        self._refused.discard(conn)
+        self._settle(probe, reached=True)
+        return sock
+
+    def _relay_failed(self, conn: SharedRelayConnection, ex: GrillUnavailable) -> bool:
+        """Whether a failed handshake is the relay's fault, not the grill's."""
+        if isinstance(ex.__cause__, (ClientConnectionError, OSError, TimeoutError)):
+            # Never reached it.
+            return True
+        # It answered: reachable, whatever it made of this grill.
+        self._refused.add(conn)
+        return len(self._refused) >= RELAY_REFUSED_GRILLS
+
+    def as_dict(self) -> dict:
+        return {
+            "grills": len(self.connections),
+            "sockets_open": sum(
+                1 for conn in self.connections.values() if conn.is_connected()
+            ),
+            "handshakes": self.handshakes,
+            "handshakes_held": self.handshakes_held,
+            "grills_refused": len(self._refused),
+            "breaker": self.breaker.as_dict(),
+        }
+
+
+class SharedRelayConnection(wss.WebSocketConnection):
+    """pytboss's websocket transport, opening its socket through the manager."""
+
+    def __init__(
+        self, relay: RelayManager, grill_id: str, session: ClientSession, **kwargs
+    ) -> None:
+        super().__init__(grill_id, session=session, **kwargs)
+        self._relay = relay
+        self._connecting = False
+
+    async def connect(self) -> None:
+        self._connecting = True
+        try:
+            await super().connect()
+        finally:
+            self._connecting = False
+
+    async def _ws_connect(self) -> ClientWebSocketResponse:
+        # Every socket pytboss opens -- on `connect()` and in its reconnect
+        # loop -- is opened here.
+        return await self._relay.open_socket(self, wait=not self._connecting)
+
+    async def handshake(self) -> ClientWebSocketResponse:
+        return await super()._ws_connect()
+
+
+def relay_for(hass: HomeAssistant) -> RelayManager:
+    """The relay manager, created the first time an entry asks for it."""
+    if (relay := hass.data.get(DATA_RELAY)) is None:
+        relay = hass.data[DATA_RELAY] = RelayManager()
+    return relay
@@ -0,0 +1,123 @@
+"""One loop timer for every deadline a coordinator keeps."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+from itertools import count
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+class _Deadline:
+    __slots__ = ("cancelled", "job", "when")
+
+    def __init__(self, when: float, job: HassJob[[], Any]) -> None:
+        self.when = when
+        self.job = job
+        self.cancelled = False
+
+
+class DeadlineScheduler:
+    """Deadlines on a heap, behind the single loop timer for the earliest.
+
+    Dragging a slider sends a write per step, and each write used to cancel
+    one `async_call_later` and schedule another -- a loop timer created and
+    torn down per step, and one more thing to find when a test fails on a
+    lingering timer. Here a deadline is a heap entry: scheduling is a push,
+    and cancelling only marks the entry, leaving the loop timer alone unless
+    nothing is left to wait for. Cancelled entries are dropped as they reach
+    the top, and the heap is rebuilt once they outnumber the live ones, so a
+    long drag cannot grow it without bound.
+
+    Deadlines are in loop time, the clock `async_call_later` runs on.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._heap: list[tuple[float, int, _Deadline]] = []
+        self._seq = count()
+        self._live = 0
+        self._unsub: CALLBACK_TYPE | None = None
+        # The deadline the loop timer is set for, so an earlier one can
+        # tell whether it needs the timer moved.
+        self._armed_for: float | None = None
+
+    def __len__(self) -> int:
+        return self._live
+
+    @callback
+    def schedule(self, delay: float, target: Callable[[], Any]) -> CALLBACK_TYPE:
+        """Run `target` in `delay` seconds. Returns the function to cancel it.
+
+        `target` may be a callback or a coroutine function; it is run as a
+        `HassJob`, the way `async_call_later` would run it.
+        """
+        deadline = _Deadline(self._hass.loop.time() + delay, HassJob(target))
+        heapq.heappush(self._heap, (deadline.when, next(self._seq), deadline))
+        self._live += 1
+        if self._armed_for is None or deadline.when < self._armed_for:
+            self._arm(deadline.when)
+
+        @callback
+        def cancel() -> None:
+            if deadline.cancelled:
+                return
+            deadline.cancelled = True
+            self._live -= 1
+            if not self._live:
+                self.shutdown()
+            elif len(self._heap) > 2 * self._live:
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+
+        return cancel
+
+    @callback
+    def shutdown(self) -> None:
+        """Drop every deadline and the loop timer with them."""
+        for _, _, deadline in self._heap:
+            deadline.cancelled = True
+        self._heap.clear()
+        self._live = 0
+        self._disarm()
+
+    @callback
+    def _arm(self, when: float) -> None:
+        self._disarm()
+        self._armed_for = when
+        self._unsub = async_call_later(
+            self._hass, max(0.0, when - self._hass.loop.time()), self._fire
+        )
+
+    @callback
+    def _disarm(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed_for = None
+
+    @callback
+    def _fire(self, _now: Any) -> None:
+        # Due is anything up to the deadline the timer was set for, not up
+        # to the loop clock: a timer can be run a hair early, and Home
+        # Assistant's own tests run it early on purpose when they move time
+        # forward.
+        horizon = max(self._hass.loop.time(), self._armed_for or 0.0)
+        self._unsub = None
+        self._armed_for = None
+        due: list[_Deadline] = []
+        while self._heap and self._heap[0][0] <= horizon:
+            _, _, deadline = heapq.heappop(self._heap)
+            if not deadline.cancelled:
+                deadline.cancelled = True
+                self._live -= 1
+                due.append(deadline)
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if self._heap:
+            self._arm(self._heap[0][0])
+        for deadline in due:
+            self._hass.async_run_hass_job(deadline.job)
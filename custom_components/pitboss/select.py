@@ -5,16 +5,13 @@ from __future__ import annotations
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN, MCU_SETTLE_SECONDS
+from .const import DOMAIN
 from .coordinator import PitBossDataUpdateCoordinator
 from .entity import BaseEntity
 
-# The MCU is polled every couple of seconds; give it time to report back.
-
 UNIT_CELSIUS = UnitOfTemperature.CELSIUS
 UNIT_FAHRENHEIT = UnitOfTemperature.FAHRENHEIT
 
@@ -57,65 +54,25 @@ class GrillTemperatureUnitSelect(BaseEntity, SelectEntity):
         # an instance variable, so a class-level list is both a mutable class
         # attribute and a mypy override error.
         self._attr_options = [UNIT_CELSIUS, UNIT_FAHRENHEIT]
-        self._pending_option: str | None = None
-        self._cancel_settle: CALLBACK_TYPE | None = None
-
-    async def async_added_to_hass(self) -> None:
-        """Register the one removal callback this entity needs."""
-        await super().async_added_to_hass()
-        # Registered once rather than per selection: `async_on_remove` only
-        # appends, so re-registering would grow the list for the life of the
-        # entity. This cancels whichever timer is current.
-        self.async_on_remove(self._cancel_pending_settle)
-
-    @callback
-    def _cancel_pending_settle(self) -> None:
-        if self._cancel_settle is not None:
-            self._cancel_settle()
-            self._cancel_settle = None
-
-    @property
-    def _reported_option(self) -> str | None:
-        if data := self.coordinator.data:
-            return UNIT_FAHRENHEIT if data.get("isFahrenheit", True) else UNIT_CELSIUS
-        return None
 
     @property
     def current_option(self) -> str | None:
-        # Show what we asked for until the grill confirms it: the board wipes
-        # its cached status the moment it forwards a command to the MCU, so
-        # the next poll still carries the old unit and the UI would appear to
-        # snap back.
-        return self._pending_option or self._reported_option
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if self._pending_option and self._reported_option == self._pending_option:
-            self._pending_option = None
-        super()._handle_coordinator_update()
+        # The unit asked for until the grill confirms it, through the
+        # coordinator's pending writes: the board wipes its cached status
+        # the moment it forwards a command to the MCU, so the next poll
+        # still carries the old unit and the UI would appear to snap back.
+        if not self.coordinator.data:
+            return None
+        fahrenheit = self.coordinator.value("isFahrenheit")
+        return UNIT_CELSIUS if fahrenheit is False else UNIT_FAHRENHEIT
 
     async def async_select_option(self, option: str) -> None:
         """Switch the unit the grill works in."""
-        await self.coordinator.api.set_temperature_unit(
-            fahrenheit=option == UNIT_FAHRENHEIT
+        fahrenheit = option == UNIT_FAHRENHEIT
+        await self.coordinator.async_write(
+            "isFahrenheit",
+            fahrenheit,
+            "set_temperature_unit",
+            self.coordinator.api.set_temperature_unit,
+            fahrenheit=fahrenheit,
         )
-        self._pending_option = option
-        self.async_write_ha_state()
-        # The MCU reports back within a couple of seconds; an immediate
-        # refresh would only read the cleared status. A second selection
-        # inside the window replaces the timer rather than queueing another.
-        self._cancel_pending_settle()
-        self._cancel_settle = async_call_later(
-            self.hass, MCU_SETTLE_SECONDS, self._async_confirm
-        )
-
-    async def _async_confirm(self, _now) -> None:
-        self._cancel_settle = None
-        await self.coordinator.async_request_refresh()
-        # One settle window is all the pending value is for. If the refresh
-        # confirmed the change, `_handle_coordinator_update` has already
-        # cleared it; if the grill did not take it, follow the grill rather
-        # than assert a value it will never report.
-        if self._pending_option is not None:
-            self._pending_option = None
-            self.async_write_ha_state()
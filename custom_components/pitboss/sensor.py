@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Literal
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -16,7 +17,9 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
+from .breaker import BreakerState
 from .const import DOMAIN, probe_label
 from .coordinator import PitBossDataUpdateCoordinator
 from .entity import BaseEntity
@@ -98,7 +101,11 @@ async def async_setup_entry(
         entities.append(ProbeSensor(coordinator, entry.unique_id, entity_description))
     for description in SYS_INFO_DESCRIPTIONS:
         entities.append(SysInfoSensor(coordinator, entry.unique_id, description))
+    for round_trip in ROUND_TRIP_DESCRIPTIONS:
+        entities.append(RoundTripSensor(coordinator, entry.unique_id, round_trip))
     entities.append(FirmwareSensor(coordinator, entry.unique_id))
+    if coordinator.reconnects_on_poll:
+        entities.append(ReconnectSensor(coordinator, entry.unique_id))
     entities.append(ChamberTemperature(coordinator, entry.unique_id))
     # Only boards whose routines read it -- 111 of the 137 catalogued
     # models. Asked of the board rather than gated on a list of names,
@@ -373,3 +380,119 @@ class SysInfoSensor(BaseEntity, SensorEntity):
     @property
     def native_value(self):
         return self.coordinator.sys_info.get(self.entity_description.info_key)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RoundTripSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor over the grill's recent round-trip times."""
+
+    # The quantile to report, or `None` for the maximum.
+    quantile: float | None
+    device_class: SensorDeviceClass = SensorDeviceClass.DURATION
+    state_class: SensorStateClass = SensorStateClass.MEASUREMENT
+    native_unit_of_measurement: str = UnitOfTime.MILLISECONDS
+    entity_category: EntityCategory = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+    icon: str = "mdi:timer-sand"
+    suggested_display_precision: int = 0
+
+
+ROUND_TRIP_DESCRIPTIONS = (
+    RoundTripSensorEntityDescription(
+        key="round_trip_p50",
+        name="Round trip median",
+        quantile=0.5,
+    ),
+    RoundTripSensorEntityDescription(
+        key="round_trip_p95",
+        name="Round trip 95th percentile",
+        quantile=0.95,
+    ),
+    RoundTripSensorEntityDescription(
+        key="round_trip_max",
+        name="Round trip maximum",
+        quantile=None,
+    ),
+)
+
+
+class RoundTripSensor(BaseEntity, SensorEntity):
+    """How long the grill has recently taken to answer, across every call.
+
+    Disabled by default: these are for telling a Bluetooth proxy or the cloud
+    relay going bad from a grill that is fine, which is a question asked
+    when something already seems wrong. The window is the coordinator's
+    rolling one rather than everything since the entry loaded, so a link
+    that degrades mid-cook moves the number within the hour.
+    """
+
+    entity_description: RoundTripSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PitBossDataUpdateCoordinator,
+        entry_unique_id: str,
+        entity_description: RoundTripSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry_unique_id)
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{entity_description.key}_{entry_unique_id}"
+
+    @property
+    def available(self) -> bool:
+        # Readable while the grill is away, unlike the sensors above: the
+        # last round trips before it went are the interesting ones.
+        return self.coordinator.rpc_latency.recent().count > 0
+
+    @property
+    def native_value(self) -> float | None:
+        recent = self.coordinator.rpc_latency.recent()
+        if (quantile := self.entity_description.quantile) is None:
+            return recent.max_ms if recent.count else None
+        return recent.percentile(quantile)
+
+
+class ReconnectSensor(BaseEntity, SensorEntity):
+    """Whether reconnects to a local grill are being held off, and for how long.
+
+    Local entries only: the other transports reconnect themselves. See
+    `ReconnectBreaker` for what the states mean. Open is the one to notice --
+    the grill has not answered for a while, and is being left alone between
+    attempts rather than asked every poll.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_icon = "mdi:lan-pending"
+
+    def __init__(
+        self, coordinator: PitBossDataUpdateCoordinator, entry_unique_id: str
+    ) -> None:
+        super().__init__(coordinator, entry_unique_id)
+        self._attr_unique_id = f"reconnect_state_{entry_unique_id}"
+        self._attr_name = "Reconnect state"
+        self._attr_options = [state.value for state in BreakerState]
+
+    @property
+    def available(self) -> bool:
+        # About the grill being away, so it has to be readable while it is.
+        return True
+
+    @property
+    def native_value(self) -> str:
+        return self.coordinator.reconnect_breaker.state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int | str | None]:
+        breaker = self.coordinator.reconnect_breaker.as_dict()
+        # When, rather than how long from now, so it stays right between
+        # updates.
+        retry = breaker["seconds_to_retry"]
+        return {
+            "consecutive_failures": breaker["consecutive_failures"],
+            "next_attempt": (
+                (dt_util.utcnow() + timedelta(seconds=retry)).isoformat()
+                if retry
+                else None
+            ),
+        }
@@ -2,20 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import datetime
+from functools import partial
+from typing import Any
+
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_DEVICE_ID, CONF_PASSWORD
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_STATE,
+    ATTR_TEMPERATURE,
+    CONF_PASSWORD,
+)
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
 from pytboss.exceptions import Unauthorized
 
-from .const import CONF_ENABLE_REMOTE_START, DOMAIN, LOGGER
+from .const import (
+    CONF_ENABLE_REMOTE_START,
+    DOMAIN,
+    HISTORY_DEFAULT_POINTS,
+    HISTORY_MAX_POINTS,
+    HISTORY_MIN_POINTS,
+    LOGGER,
+    SERVICE_CONCURRENCY,
+)
 from .coordinator import PitBossDataUpdateCoordinator
+from .history import lttb
 
 SERVICE_SET_GRILL_PASSWORD = "set_grill_password"
 SERVICE_START_GRILL = "start_grill"
+SERVICE_TURN_OFF_GRILL = "turn_off_grill"
+SERVICE_SET_GRILL_TEMPERATURE = "set_grill_temperature"
+SERVICE_SET_PROBE_TARGET = "set_probe_target"
+SERVICE_SET_LIGHT = "set_light"
+SERVICE_GET_COOK_HISTORY = "get_cook_history"
+
+ATTR_PROBE = "probe"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_POINTS = "points"
 
 # Conditions that make lighting the grill a bad idea. The board would likely
 # refuse or fail anyway, but failing here says why.
@@ -28,7 +66,50 @@ BLOCKING_ERRORS = {
     "hotErr": "the grill reports an igniter error",
 }
 
-START_GRILL_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
+# Where the device index lives in `hass.data`. Beside the coordinators rather
+# than among them, so nothing that walks those has to step around it.
+DATA_DEVICE_INDEX = f"{DOMAIN}_device_index"
+
+# The actions that control a grill take a list of them, so an automation
+# driving several sends one call rather than looping over them. A single id
+# is still accepted, as a list of one.
+_GRILLS = vol.All(cv.ensure_list, [cv.string], vol.Length(min=1))
+
+START_GRILL_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): _GRILLS})
+
+TURN_OFF_GRILL_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): _GRILLS})
+
+SET_GRILL_TEMPERATURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): _GRILLS,
+        # In each grill's own unit, and snapped to the setpoints it accepts.
+        vol.Required(ATTR_TEMPERATURE): vol.Coerce(float),
+    }
+)
+
+SET_PROBE_TARGET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): _GRILLS,
+        vol.Required(ATTR_PROBE): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+        vol.Required(ATTR_TEMPERATURE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+SET_LIGHT_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_DEVICE_ID): _GRILLS, vol.Required(ATTR_STATE): cv.boolean}
+)
+
+GET_COOK_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_POINTS, default=HISTORY_DEFAULT_POINTS): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=HISTORY_MIN_POINTS, max=HISTORY_MAX_POINTS),
+        ),
+    }
+)
 
 SET_GRILL_PASSWORD_SCHEMA = vol.Schema(
     {
@@ -39,6 +120,85 @@ SET_GRILL_PASSWORD_SCHEMA = vol.Schema(
 )
 
 
+class DeviceIndex:
+    """Which config entry each of our devices belongs to.
+
+    An action names a device; what it needs is that device's coordinator.
+    Resolving one walked the device registry and every config entry the
+    device was attached to, per call -- fine for one grill, and the wrong
+    shape for an action aimed at a whole list of them. Here the answer is
+    one dictionary lookup, filled in when an entry is set up and on the
+    first call that needs it, and dropped when the entry unloads or the
+    device registry changes the device. The registry walk stays as the miss
+    path, so a stale index can only ever cost a lookup, never give a wrong
+    answer.
+
+    Maps to the entry's id rather than to its coordinator: a reload replaces
+    the coordinator, and `hass.data` is where the current one is.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, str] = {}
+
+    @callback
+    def add_entry(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        for device in dr.async_entries_for_config_entry(
+            dr.async_get(hass), entry.entry_id
+        ):
+            self._entries[device.id] = entry.entry_id
+
+    @callback
+    def remove_entry(self, entry: ConfigEntry) -> None:
+        for device_id in [
+            device_id
+            for device_id, entry_id in self._entries.items()
+            if entry_id == entry.entry_id
+        ]:
+            del self._entries[device_id]
+
+    @callback
+    def device_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        # Any change may have moved the device between entries; the next
+        # call that needs it walks the registry again.
+        self._entries.pop(event.data["device_id"], None)
+
+    @callback
+    def resolve(
+        self, hass: HomeAssistant, device_id: str
+    ) -> tuple[PitBossDataUpdateCoordinator, ConfigEntry]:
+        if (entry_id := self._entries.get(device_id)) is not None and (
+            entry := hass.config_entries.async_get_entry(entry_id)
+        ) is not None:
+            if (coordinator := hass.data.get(DOMAIN, {}).get(entry_id)) is not None:
+                return coordinator, entry
+            raise _not_loaded()
+        coordinator, entry = _walk_registry(hass, device_id)
+        self._entries[device_id] = entry.entry_id
+        return coordinator, entry
+
+
+@callback
+def async_index_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Put a set-up entry's devices in the index."""
+    hass.data[DATA_DEVICE_INDEX].add_entry(hass, entry)
+
+
+@callback
+def async_unindex_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Take an unloaded entry's devices out of the index."""
+    hass.data[DATA_DEVICE_INDEX].remove_entry(entry)
+
+
+def _not_loaded() -> HomeAssistantError:
+    # The right target in the wrong state, which is not the caller's fault
+    # -- an entry mid-retry because the grill is off, or disabled. "Not a
+    # PitBoss grill" here sent people debugging their automation instead of
+    # their grill.
+    return HomeAssistantError(
+        "The grill is not loaded yet; it may be off or still connecting."
+    )
+
+
 def _coordinator_for_device(
     hass: HomeAssistant, device_id: str
 ) -> tuple[PitBossDataUpdateCoordinator, ConfigEntry]:
@@ -47,6 +207,12 @@ def _coordinator_for_device(
     Returns the entry itself rather than its id so the caller cannot end up
     holding one without the other.
     """
+    return hass.data[DATA_DEVICE_INDEX].resolve(hass, device_id)
+
+
+def _walk_registry(
+    hass: HomeAssistant, device_id: str
+) -> tuple[PitBossDataUpdateCoordinator, ConfigEntry]:
     device = dr.async_get(hass).async_get(device_id)
     if device is None:
         raise ServiceValidationError(f"Unknown device: {device_id}")
@@ -60,14 +226,86 @@ def _coordinator_for_device(
         if coordinator is not None:
             return coordinator, entry
     if ours:
-        # The right target in the wrong state, which is not the caller's
-        # fault -- an entry mid-retry because the grill is off, or disabled.
-        # "Not a PitBoss grill" here sent people debugging their automation
-        # instead of their grill.
+        raise _not_loaded()
+    raise ServiceValidationError(f"Device {device_id} is not a PitBoss grill")
+
+
+async def _async_command(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    what: str,
+    send: Callable[[], Awaitable[Any]],
+) -> None:
+    """Send a command, turning what the grill says back into an answer."""
+    try:
+        await send()
+    except Unauthorized as ex:
+        # The password Home Assistant holds is not the grill's. That is the
+        # same condition the coordinator opens a reauth flow for, retrying
+        # cannot fix it, and the reauth flow is the only thing that can.
+        entry.async_start_reauth(hass)
         raise HomeAssistantError(
-            "The grill is not loaded yet; it may be off or still connecting."
+            "The grill rejected the password Home Assistant holds. "
+            "Enter the current one and try again."
+        ) from ex
+    except HomeAssistantError:
+        raise
+    except Exception as ex:
+        raise HomeAssistantError(f"Could not {what}: {ex}") from ex
+
+
+async def _async_for_each_grill(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    action: Callable[
+        [PitBossDataUpdateCoordinator, ConfigEntry], Coroutine[Any, Any, None]
+    ],
+) -> ServiceResponse:
+    """Run `action` on every grill the call names, `SERVICE_CONCURRENCY` at once.
+
+    Each grill succeeds or fails on its own: one that is off or out of range
+    does not stop the rest. How that is reported depends on the caller. One
+    that asks for the response gets a result per grill, in the order they
+    were named. One that does not gets an error if anything failed -- the
+    grill's own error when it named just one, which is every call written
+    before actions took a list, so those behave exactly as they did.
+    """
+    device_ids: list[str] = list(dict.fromkeys(call.data[ATTR_DEVICE_ID]))
+    limit = asyncio.Semaphore(SERVICE_CONCURRENCY)
+
+    async def run(device_id: str) -> None:
+        async with limit:
+            await action(*_coordinator_for_device(hass, device_id))
+
+    results = await asyncio.gather(
+        *(run(device_id) for device_id in device_ids), return_exceptions=True
+    )
+    errors: dict[str, Exception] = {}
+    for device_id, result in zip(device_ids, results, strict=True):
+        if isinstance(result, Exception):
+            errors[device_id] = result
+        elif isinstance(result, BaseException):
+            raise result
+
+    if call.return_response:
+        return {
+            "grills": {
+                device_id: (
+                    {"success": False, "error": str(errors[device_id])}
+                    if device_id in errors
+                    else {"success": True}
+                )
+                for device_id in device_ids
+            }
+        }
+    if len(device_ids) == 1 and errors:
+        raise next(iter(errors.values()))
+    if errors:
+        raise HomeAssistantError(
+            f"Failed on {len(errors)} of {len(device_ids)} grills: "
+            + "; ".join(f"{device_id}: {ex}" for device_id, ex in errors.items())
         )
-    raise ServiceValidationError(f"Device {device_id} is not a PitBoss grill")
+    return None
 
 
 async def _async_set_grill_password(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -75,25 +313,24 @@ async def _async_set_grill_password(hass: HomeAssistant, call: ServiceCall) -> N
     coordinator, entry = _coordinator_for_device(hass, call.data[ATTR_DEVICE_ID])
     new_password: str = call.data[CONF_PASSWORD]
 
-    if not coordinator.api.is_connected():
+    if not coordinator.is_connected():
         raise HomeAssistantError(
             "The grill is not connected; turn it on and try again."
         )
 
-    try:
-        await coordinator.api.set_grill_password(new_password)
-    except Unauthorized as ex:
-        # Changing the password is authenticated with the current one, so
-        # this means the one Home Assistant holds is not the grill's. That is
-        # the same condition the coordinator opens a reauth flow for, and it
-        # is the only thing that lets the user fix it.
-        entry.async_start_reauth(hass)
-        raise HomeAssistantError(
-            "The grill rejected the password Home Assistant holds. "
-            "Enter the current one and try again."
-        ) from ex
-    except Exception as ex:
-        raise HomeAssistantError(f"Could not set the grill password: {ex}") from ex
+    # Changing the password is authenticated with the current one, so a
+    # rejection means the one Home Assistant holds is not the grill's.
+    await _async_command(
+        hass,
+        entry,
+        "set the grill password",
+        partial(
+            coordinator.async_rpc,
+            "set_grill_password",
+            coordinator.api.set_grill_password,
+            new_password,
+        ),
+    )
 
     # Keep the config entry in sync, otherwise Home Assistant would reconnect
     # with the old password after a restart and every command would be
@@ -104,10 +341,10 @@ async def _async_set_grill_password(hass: HomeAssistant, call: ServiceCall) -> N
     LOGGER.info("Grill password %s", "removed" if not new_password else "updated")
 
 
-async def _async_start_grill(hass: HomeAssistant, call: ServiceCall) -> None:
+async def _async_start_grill(
+    hass: HomeAssistant, coordinator: PitBossDataUpdateCoordinator, entry: ConfigEntry
+) -> None:
     """Light the grill, if the user has deliberately allowed it."""
-    coordinator, entry = _coordinator_for_device(hass, call.data[ATTR_DEVICE_ID])
-
     if not entry.options.get(CONF_ENABLE_REMOTE_START, False):
         raise ServiceValidationError(
             "Remote start is disabled. Enable it in the integration options "
@@ -115,7 +352,7 @@ async def _async_start_grill(hass: HomeAssistant, call: ServiceCall) -> None:
             "standing next to it."
         )
 
-    if not coordinator.api.is_connected():
+    if not coordinator.is_connected():
         raise HomeAssistantError("The grill is not connected.")
 
     data = coordinator.data or {}
@@ -129,31 +366,234 @@ async def _async_start_grill(hass: HomeAssistant, call: ServiceCall) -> None:
         "Lighting the grill remotely. Make sure the lid is open and the burn "
         "pot is clear of unburned pellets."
     )
-    try:
-        await coordinator.api.turn_grill_on()
-    except Unauthorized as ex:
-        # The same condition and the same answer as set_grill_password: the
-        # password Home Assistant holds is not the grill's, retrying cannot
-        # fix it, and the reauth flow is the only thing that can.
-        entry.async_start_reauth(hass)
-        raise HomeAssistantError(
-            "The grill rejected the password Home Assistant holds. "
-            "Enter the current one and try again."
-        ) from ex
-    except Exception as ex:
-        raise HomeAssistantError(f"Could not start the grill: {ex}") from ex
+    await _async_command(
+        hass,
+        entry,
+        "start the grill",
+        partial(coordinator.async_rpc, "turn_grill_on", coordinator.api.turn_grill_on),
+    )
     await coordinator.async_request_refresh()
 
 
+async def _async_turn_off_grill(
+    hass: HomeAssistant, coordinator: PitBossDataUpdateCoordinator, entry: ConfigEntry
+) -> None:
+    """Turn the grill off, as the power switch does."""
+    await _async_command(
+        hass,
+        entry,
+        "turn the grill off",
+        partial(
+            coordinator.async_write,
+            "moduleIsOn",
+            False,
+            "turn_grill_off",
+            coordinator.api.turn_grill_off,
+        ),
+    )
+
+
+async def _async_set_grill_temperature(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    entry: ConfigEntry,
+    temperature: float,
+) -> None:
+    """Set the grill setpoint, in the grill's own unit."""
+    await _async_command(
+        hass,
+        entry,
+        "set the grill temperature",
+        partial(coordinator.async_set_grill_setpoint, temperature),
+    )
+
+
+async def _async_set_probe_target(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    entry: ConfigEntry,
+    probe: int,
+    temperature: int,
+) -> None:
+    """Set a probe's target, in the grill's own unit."""
+    # The schema allows any probe some grill has; this one may have fewer.
+    if probe > (coordinator.api.spec.meat_probes or 0):
+        raise ServiceValidationError(f"The grill has no probe {probe}.")
+    # Nor is the range one for every grill: it is in each grill's own unit.
+    # The bounds are the probe number's, so the action accepts what the
+    # dial offers and nothing else -- the placeholder below it included,
+    # which the grill would read back as no target at all.
+    floor = coordinator.probe_target_floor + 1
+    ceiling = coordinator.probe_target_ceiling
+    if not floor <= temperature <= ceiling:
+        raise ServiceValidationError(
+            f"A probe target on this grill is from {floor} to {ceiling:g} "
+            f"{coordinator.grill_unit}, not {temperature}."
+        )
+    await _async_command(
+        hass,
+        entry,
+        "set the probe target",
+        partial(coordinator.async_set_probe_target, probe, temperature),
+    )
+
+
+async def _async_set_light(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    entry: ConfigEntry,
+    state: bool,
+) -> None:
+    """Turn the grill's light on or off, as the light entity does."""
+    if not coordinator.api.spec.has_lights:
+        raise ServiceValidationError("The grill has no light.")
+    api = coordinator.api
+    await _async_command(
+        hass,
+        entry,
+        f"turn the light {'on' if state else 'off'}",
+        partial(
+            coordinator.async_write,
+            "lightState",
+            state,
+            "turn_light_on" if state else "turn_light_off",
+            api.turn_light_on if state else api.turn_light_off,
+        ),
+    )
+
+
+def _timestamp(value: datetime | None, default: float) -> float:
+    if value is None:
+        return default
+    # A datetime picked in the UI comes without a zone, and means local time.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value.timestamp()
+
+
+@callback
+def _async_get_cook_history(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """The grill's recent temperatures, downsampled to `points` per series.
+
+    Points are `[unix time, temperature]` pairs, in the grill's current unit:
+    compact, and what a chart or a dataframe takes as it is.
+    """
+    coordinator, _ = _coordinator_for_device(hass, call.data[ATTR_DEVICE_ID])
+    start = _timestamp(call.data.get(ATTR_START), 0.0)
+    end = _timestamp(call.data.get(ATTR_END), dt_util.utcnow().timestamp())
+    if start > end:
+        raise ServiceValidationError("The start of the window is after its end.")
+    unit = coordinator.grill_unit
+    return {
+        "unit": unit,
+        "series": {
+            name: [
+                [round(at), round(value, 1)]
+                for at, value in lttb(points, call.data[ATTR_POINTS])
+            ]
+            for name, points in coordinator.history.series(start, end, unit).items()
+        },
+    }
+
+
 @callback
 def async_register_services(hass: HomeAssistant) -> None:
     """Register PitBoss services."""
+    hass.data[DATA_DEVICE_INDEX] = index = DeviceIndex()
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, index.device_updated)
+
+    async def handle_start_grill(call: ServiceCall) -> ServiceResponse:
+        return await _async_for_each_grill(
+            hass, call, partial(_async_start_grill, hass)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_GRILL,
+        handle_start_grill,
+        schema=START_GRILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_turn_off_grill(call: ServiceCall) -> ServiceResponse:
+        return await _async_for_each_grill(
+            hass, call, partial(_async_turn_off_grill, hass)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TURN_OFF_GRILL,
+        handle_turn_off_grill,
+        schema=TURN_OFF_GRILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_grill_temperature(call: ServiceCall) -> ServiceResponse:
+        async def action(
+            coordinator: PitBossDataUpdateCoordinator, entry: ConfigEntry
+        ) -> None:
+            await _async_set_grill_temperature(
+                hass, coordinator, entry, call.data[ATTR_TEMPERATURE]
+            )
+
+        return await _async_for_each_grill(hass, call, action)
 
-    async def handle_start_grill(call: ServiceCall) -> None:
-        await _async_start_grill(hass, call)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_GRILL_TEMPERATURE,
+        handle_set_grill_temperature,
+        schema=SET_GRILL_TEMPERATURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_probe_target(call: ServiceCall) -> ServiceResponse:
+        async def action(
+            coordinator: PitBossDataUpdateCoordinator, entry: ConfigEntry
+        ) -> None:
+            await _async_set_probe_target(
+                hass,
+                coordinator,
+                entry,
+                call.data[ATTR_PROBE],
+                call.data[ATTR_TEMPERATURE],
+            )
+
+        return await _async_for_each_grill(hass, call, action)
 
     hass.services.async_register(
-        DOMAIN, SERVICE_START_GRILL, handle_start_grill, schema=START_GRILL_SCHEMA
+        DOMAIN,
+        SERVICE_SET_PROBE_TARGET,
+        handle_set_probe_target,
+        schema=SET_PROBE_TARGET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_light(call: ServiceCall) -> ServiceResponse:
+        async def action(
+            coordinator: PitBossDataUpdateCoordinator, entry: ConfigEntry
+        ) -> None:
+            await _async_set_light(hass, coordinator, entry, call.data[ATTR_STATE])
+
+        return await _async_for_each_grill(hass, call, action)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_LIGHT,
+        handle_set_light,
+        schema=SET_LIGHT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    @callback
+    def handle_get_cook_history(call: ServiceCall) -> ServiceResponse:
+        return _async_get_cook_history(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_COOK_HISTORY,
+        handle_get_cook_history,
+        schema=GET_COOK_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
 
     async def handle_set_grill_password(call: ServiceCall) -> None:
@@ -41,8 +41,11 @@ class BaseSwitchEntity(BaseEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        if data := self.coordinator.data:
-            return bool(data.get(self.entity_description.key, False))
+        # Through the coordinator's pending writes, so a switch flipped here
+        # reads as flipped straight away rather than snapping back until the
+        # grill reports it.
+        if self.coordinator.data:
+            return bool(self.coordinator.value(self.entity_description.key))
         return None
 
     @property
@@ -76,7 +79,9 @@ class PowerSwitch(BaseSwitchEntity):
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the switch."""
         # See GrillClimate.async_turn_off: the setpoint is left alone.
-        await self.coordinator.api.turn_grill_off()
+        await self.coordinator.async_write(
+            "moduleIsOn", False, "turn_grill_off", self.coordinator.api.turn_grill_off
+        )
 
 
 class PrimerSwitch(BaseSwitchEntity):
@@ -90,8 +95,18 @@ class PrimerSwitch(BaseSwitchEntity):
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the primer motor."""
-        await self.coordinator.api.turn_primer_motor_on()
+        await self.coordinator.async_write(
+            "primeState",
+            True,
+            "turn_primer_motor_on",
+            self.coordinator.api.turn_primer_motor_on,
+        )
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the primer motor."""
-        await self.coordinator.api.turn_primer_motor_off()
+        await self.coordinator.async_write(
+            "primeState",
+            False,
+            "turn_primer_motor_off",
+            self.coordinator.api.turn_primer_motor_off,
+        )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Measure what a local grill's poll costs in connections, and in time.
+
+Drives the real `PitBossDataUpdateCoordinator`, on a bare Home Assistant,
+through pytboss's HTTP transport against `scripts.local_standin`, once per
+session under comparison:
+
+* `default` -- an aiohttp session as Home Assistant's shared one is set up:
+  no useful cap on connections to one host, and each kept fifteen seconds.
+* `dedicated` -- `create_local_session`, which local entries now use.
+
+Each runs the same number of poll cycles the same distance apart, with the
+stand-in charging `--handshake` seconds for every new connection -- the
+cost localhost does not have and a grill's Wi-Fi does. Reported per
+session: cycle time (mean and worst), connections opened, and requests
+carried per connection. Spacing the cycles wider than fifteen seconds is
+what shows the keep-alive; the default is the standby interval:
+
+    python3 -m scripts.bench_local --cycles 5 --handshake 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+from statistics import fmean
+from time import monotonic
+
+from aiohttp import ClientSession
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from pytboss import PitBoss, grills
+from pytboss.http import HttpConnection
+
+from custom_components.pitboss.const import STANDBY_SCAN_INTERVAL
+from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.local import create_local_session
+
+from .local_standin import LocalStandIn
+from .relay_standin import GrillStandIn
+
+
+async def _run_one(
+    hass: HomeAssistant,
+    model: str,
+    session: ClientSession,
+    cycles: int,
+    interval: float,
+    handshake: float,
+) -> dict[str, float]:
+    grill = LocalStandIn(GrillStandIn(grills.get_grill(model)))
+    grill.handshake_delay = handshake
+    address = await grill.start()
+    api = PitBoss(HttpConnection(address, session=session), model)
+    coordinator = PitBossDataUpdateCoordinator(
+        hass, DeviceInfo(), api, reconnect_on_poll=True
+    )
+    # Known already, so the first read does not go looking for a device
+    # registry this bare instance never loaded.
+    coordinator.firmware_version = grill.grill.firmware_version
+    timings: list[float] = []
+    try:
+        for cycle in range(cycles):
+            if cycle:
+                await asyncio.sleep(interval)
+            started = monotonic()
+            await coordinator.async_refresh()
+            timings.append(monotonic() - started)
+    finally:
+        await coordinator.async_shutdown()
+        await api.stop()
+        await session.close()
+        await grill.stop()
+    requests = sum(grill.rpcs.values())
+    return {
+        # The first cycle starts the API, and is not a poll like the others.
+        "mean": fmean(timings[1:] or timings),
+        "worst": max(timings[1:] or timings),
+        "connections": grill.connections_opened,
+        "per_connection": requests / max(grill.connections_opened, 1),
+    }
+
+
+async def _run(model: str, cycles: int, interval: float, handshake: float) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results = {
+            "default": await _run_one(
+                hass, model, ClientSession(), cycles, interval, handshake
+            ),
+            "dedicated": await _run_one(
+                hass, model, create_local_session(), cycles, interval, handshake
+            ),
+        }
+
+    print(f"model {model}, {cycles} cycles {interval:.0f}s apart")
+    print(f"{'':24}{'default':>10}{'dedicated':>10}")
+    for label, key, fmt in (
+        ("mean cycle (s)", "mean", "10.3f"),
+        ("worst cycle (s)", "worst", "10.3f"),
+        ("connections opened", "connections", "10.0f"),
+        ("requests per connection", "per_connection", "10.1f"),
+    ):
+        row = "".join(format(results[name][key], fmt) for name in results)
+        print(f"{label:24}{row}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="PBV4PS2")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument(
+        "--interval", type=float, default=STANDBY_SCAN_INTERVAL.total_seconds()
+    )
+    parser.add_argument("--handshake", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(_run(args.model, args.cycles, args.interval, args.handshake))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Measure how the coordinator rides out a relay whose grill has gone.
+
+Drives the real `PitBossDataUpdateCoordinator`, on a bare Home Assistant,
+through pytboss's websocket transport against `scripts.relay_standin`. The
+grill is healthy and lit, then goes silent behind an open socket -- the
+relay's failure mode, not a dropped connection -- then comes back. Reported:
+
+* time to detect offline: from the grill going silent to the first failed
+  cycle (`last_update_success` false).
+* time to back off: from the grill going silent to the poll interval
+  reaching standby, which `FAILURES_BEFORE_BACKOFF` decides.
+* time to recover: from the grill answering again to the next good cycle.
+* RPCs per hour while offline: commands sent that nothing answered,
+  extrapolated from the outage, which is what the backoff is buying down.
+
+Runs in real time, on the coordinator's own scheduler, so the numbers include
+the transport's timeouts and Home Assistant's stagger. Each phase is at least
+one standby interval long by default, so every run reaches backoff:
+
+    python3 -m scripts.bench_reconnect --outage 120 --recovery 90
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from pytboss import PitBoss, grills
+from pytboss.wss import WebSocketConnection
+
+from custom_components.pitboss.const import STANDBY_SCAN_INTERVAL
+from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+
+from .relay_standin import GrillStandIn, RelayStandIn
+
+
+class Timeline:
+    """When the coordinator's view of the grill changed, in run time."""
+
+    def __init__(self, coordinator: PitBossDataUpdateCoordinator) -> None:
+        self._coordinator = coordinator
+        self._start = monotonic()
+        self.failed_at: float | None = None
+        self.backed_off_at: float | None = None
+        self.recovered_at: float | None = None
+        self.mark = 0.0
+
+    def now(self) -> float:
+        return monotonic() - self._start
+
+    def reset(self) -> None:
+        """Start watching for the next transition from here."""
+        self.mark = self.now()
+        self.failed_at = self.backed_off_at = self.recovered_at = None
+
+    def observe(self) -> None:
+        """Coordinator listener: note the first of each transition."""
+        now = self.now()
+        coordinator = self._coordinator
+        if not coordinator.last_update_success:
+            if self.failed_at is None:
+                self.failed_at = now
+            if (
+                self.backed_off_at is None
+                and coordinator.update_interval == STANDBY_SCAN_INTERVAL
+            ):
+                self.backed_off_at = now
+        elif self.failed_at is not None and self.recovered_at is None:
+            self.recovered_at = now
+
+
+def _since(mark: float, at: float | None) -> str:
+    return "never" if at is None else f"{at - mark:6.1f}s"
+
+
+async def _run(model: str, healthy: float, outage: float, recovery: float) -> None:
+    relay = RelayStandIn(GrillStandIn(grills.get_grill(model)))
+    base_url = await relay.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        conn = WebSocketConnection("bench", base_url=base_url)
+        api = PitBoss(conn, model)
+        coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), api)
+        # Known already, so the first read does not go looking for a device
+        # registry this bare instance never loaded.
+        coordinator.firmware_version = relay.grill.firmware_version
+        timeline = Timeline(coordinator)
+        unsub = coordinator.async_add_listener(timeline.observe)
+        try:
+            await coordinator.async_refresh()
+            await asyncio.sleep(healthy)
+
+            relay.silent = True
+            timeline.reset()
+            sent_before = sum(relay.rpcs.values())
+            await asyncio.sleep(outage)
+            wasted = sum(relay.rpcs.values()) - sent_before
+            detected = _since(timeline.mark, timeline.failed_at)
+            backed_off = _since(timeline.mark, timeline.backed_off_at)
+
+            relay.silent = False
+            recovery_mark = timeline.now()
+            await asyncio.sleep(recovery)
+            recovered = _since(recovery_mark, timeline.recovered_at)
+        finally:
+            unsub()
+            await coordinator.async_shutdown()
+            await api.stop()
+            await relay.stop()
+
+    print(f"model                     {model}")
+    print(f"time to detect offline    {detected}")
+    print(f"time to back off          {backed_off}")
+    print(f"time to recover           {recovered}")
+    print(f"RPCs per hour offline     {wasted * 3600 / outage:6.0f}")
+    print(f"sockets opened            {relay.sockets_opened:6d}")
+
+
+def main() -> None:
+    standby = STANDBY_SCAN_INTERVAL.total_seconds()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="PBV4PS2")
+    parser.add_argument("--healthy", type=float, default=15.0)
+    parser.add_argument("--outage", type=float, default=2 * standby)
+    parser.add_argument("--recovery", type=float, default=1.5 * standby)
+    args = parser.parse_args()
+    asyncio.run(_run(args.model, args.healthy, args.outage, args.recovery))
+
+
+if __name__ == "__main__":
+    main()
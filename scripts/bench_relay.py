@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Measure what many cloud grills cost, on the relay and on this machine.
+
+Connects `--grills` websocket transports, on one aiohttp session as Home
+Assistant's shared one is, to `scripts.relay_standin`, once per way of
+connecting them:
+
+* `independent` -- pytboss's `WebSocketConnection`, each reconnecting on its
+  own backoff, as every cloud grill did.
+* `shared` -- `SharedRelayConnection`, all through one `RelayManager`.
+
+Each runs three phases. Steady: every socket open, a status frame pushed to
+each every second. Outage: every socket dropped and every handshake
+refused, as an unreachable relay does. Recovery: the relay back, timed until
+every grill has its socket again. Reported: sockets open while steady,
+handshakes the relay turned away during the outage, time to recover, and
+CPU per grill in each phase. The relay cannot carry more than one grill on
+a socket, so the steady numbers should match; the outage is where they part.
+The stand-in runs in the same process, and its CPU is counted with the
+clients':
+
+    python3 -m scripts.bench_relay --grills 20 --steady 10 --outage 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from time import monotonic, process_time
+
+from aiohttp import ClientSession
+from pytboss import grills
+from pytboss.wss import WebSocketConnection
+
+from custom_components.pitboss.relay import RelayManager, SharedRelayConnection
+
+from .relay_standin import GrillStandIn, RelayStandIn
+
+
+async def _pushing(relay: RelayStandIn, seconds: float) -> None:
+    deadline = monotonic() + seconds
+    while monotonic() < deadline:
+        await relay.push()
+        await asyncio.sleep(1.0)
+
+
+async def _run_one(
+    model: str, shared: bool, count: int, steady: float, outage: float
+) -> dict[str, float]:
+    relay = RelayStandIn(GrillStandIn(grills.get_grill(model)))
+    base_url = await relay.start()
+    session = ClientSession()
+    manager = RelayManager()
+    transports: list[WebSocketConnection] = []
+    for index in range(count):
+        grill_id = f"PBL-{index:06X}"
+        if shared:
+            conn = SharedRelayConnection(
+                manager, grill_id, session=session, base_url=base_url
+            )
+            manager.add(grill_id, conn)
+        else:
+            conn = WebSocketConnection(grill_id, session=session, base_url=base_url)
+        transports.append(conn)
+    try:
+        await asyncio.gather(*(conn.connect() for conn in transports))
+
+        started = process_time()
+        await _pushing(relay, steady)
+        steady_cpu = process_time() - started
+        sockets = relay.sockets_open
+
+        relay.refuse = True
+        await relay.drop_connections()
+        started = process_time()
+        await asyncio.sleep(outage)
+        outage_cpu = process_time() - started
+        refused = relay.handshakes_refused
+
+        relay.refuse = False
+        back_at = monotonic()
+        while relay.sockets_open < count:
+            await asyncio.sleep(0.1)
+        recovery = monotonic() - back_at
+    finally:
+        await asyncio.gather(*(conn.disconnect() for conn in transports))
+        await session.close()
+        await relay.stop()
+    return {
+        "sockets": sockets,
+        "refused": refused / count,
+        "recovery": recovery,
+        # Milliseconds of CPU per grill per minute.
+        "steady_cpu": steady_cpu * 1000 / count * 60 / steady,
+        "outage_cpu": outage_cpu * 1000 / count * 60 / outage,
+    }
+
+
+async def _run(model: str, count: int, steady: float, outage: float) -> None:
+    results = {
+        "independent": await _run_one(model, False, count, steady, outage),
+        "shared": await _run_one(model, True, count, steady, outage),
+    }
+
+    print(f"model {model}, {count} grills, {steady:.0f}s steady, {outage:.0f}s down")
+    print(f"{'':32}{'independent':>12}{'shared':>12}")
+    for label, key, fmt in (
+        ("sockets open (steady)", "sockets", "12.0f"),
+        ("handshakes refused per grill", "refused", "12.1f"),
+        ("time to recover (s)", "recovery", "12.1f"),
+        ("CPU ms/grill/min (steady)", "steady_cpu", "12.1f"),
+        ("CPU ms/grill/min (outage)", "outage_cpu", "12.1f"),
+    ):
+        row = "".join(format(results[name][key], fmt) for name in results)
+        print(f"{label:32}{row}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="PBV4PS2")
+    parser.add_argument("--grills", type=int, default=20)
+    parser.add_argument("--steady", type=float, default=10.0)
+    parser.add_argument("--outage", type=float, default=60.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args.model, args.grills, args.steady, args.outage))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""A local stand-in for a grill's own HTTP RPC endpoint.
+
+What the local transport costs is mostly not the requests but the
+connections under them: the board's web server runs on the microcontroller
+that runs the grill, over Wi-Fi that is often weak where grills stand, and a
+TCP handshake there can cost more than the call it precedes. On localhost a
+handshake is free, so it would not show up in a benchmark at all.
+
+This serves `POST /rpc` on localhost, answering from the same
+`GrillStandIn` as `scripts.relay_standin`, and counts what clients cost it:
+the connections they open and the requests they send over them. Faults:
+
+* `handshake_delay` -- the first request on every new connection is held
+  back this many seconds, standing in for connection setup over a weak link.
+* `reply_delay` -- every answer is held back this many seconds.
+* `keepalive` -- how long the server keeps an idle connection open, as the
+  board's own idle timeout would.
+
+Run on its own to point a development Home Assistant at it:
+
+    python3 -m scripts.local_standin --model PBV4PS2
+
+It is also what `scripts.bench_local` measures against.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from contextlib import suppress
+from typing import Any
+
+from aiohttp import web
+from pytboss import grills
+
+from .relay_standin import GrillStandIn
+
+
+class LocalStandIn:
+    """A grill's `/rpc` endpoint, counting connections as well as calls."""
+
+    def __init__(
+        self, grill: GrillStandIn, host: str = "127.0.0.1", keepalive: float = 75.0
+    ) -> None:
+        self.grill = grill
+        self.host = host
+        self.keepalive = keepalive
+        self.handshake_delay = 0.0
+        self.reply_delay = 0.0
+        self.rpcs: Counter[str] = Counter()
+        # Each connection is told apart by the client's end of it.
+        self._peers: set[Any] = set()
+        self._runner: web.AppRunner | None = None
+        self.address = ""
+
+    @property
+    def connections_opened(self) -> int:
+        return len(self._peers)
+
+    async def start(self) -> str:
+        """Start serving on a free port, and return the `host:port` to use."""
+        app = web.Application()
+        app.router.add_post("/rpc", self._handle)
+        self._runner = web.AppRunner(app, keepalive_timeout=self.keepalive)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.address = f"{self.host}:{port}"
+        return self.address
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        assert request.transport is not None
+        peer = request.transport.get_extra_info("peername")
+        if peer not in self._peers:
+            self._peers.add(peer)
+            if self.handshake_delay:
+                await asyncio.sleep(self.handshake_delay)
+        cmd = await request.json()
+        self.rpcs[cmd.get("method", "")] += 1
+        if self.reply_delay:
+            await asyncio.sleep(self.reply_delay)
+        return web.json_response(
+            {"id": cmd["id"], **self.grill.answer(cmd["method"], cmd["params"])}
+        )
+
+
+async def _serve(model: str) -> None:
+    grill = LocalStandIn(GrillStandIn(grills.get_grill(model)))
+    print(f"Serving {model} at http://{await grill.start()}/rpc")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await grill.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="PBV4PS2")
+    args = parser.parse_args()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args.model))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""A local stand-in for the Dansons websocket relay, with a grill behind it.
+
+The cloud transport's worst case is not a relay that is down -- pytboss
+reconnects from that by itself -- but a relay that accepts the socket while
+the grill behind it has gone. Nothing answers, the socket stays open, and the
+coordinator learns about it only by timing out. That is what drives
+`FAILURES_BEFORE_BACKOFF` and the poll interval, and it cannot be measured
+against the real relay without unplugging a grill.
+
+This serves the relay's `/to/<grill id>` endpoint on localhost and answers
+RPCs the way a grill does, from a state it holds. Frames are built with
+`pytboss.testing`, so what a client parses is what the board's own routine
+would produce. Faults are switched on and off while clients are connected:
+
+* `silent` -- sockets are accepted and held, commands are swallowed.
+* `refuse` -- handshakes are turned away, as an unreachable relay would.
+* `reply_delay` -- every answer is held back this many seconds.
+* `drop_connections()` -- every open socket is closed from the relay's side.
+* `push()` / `replay()` -- status frames are pushed unprompted.
+
+Run on its own to point a development Home Assistant at it:
+
+    python3 -m scripts.relay_standin --model PBV4PS2
+
+It is also what `scripts.bench_reconnect` and `scripts.bench_relay` measure
+against.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import suppress
+from time import monotonic
+from typing import Any
+
+from aiohttp import WSMsgType, web
+from pytboss import grills, testing
+from pytboss.grills import Grill
+
+# Method names the stand-in answers as a Mongoose grill would. Anything else
+# gets the firmware's own "no handler" reply.
+METHOD_NOT_FOUND = 404
+
+
+def _fields_of(builder: Any, grill: Grill, candidates: Iterable[str]) -> frozenset[str]:
+    """The fields a frame builder accepts, found by asking it."""
+    accepted = set()
+    for field in candidates:
+        try:
+            builder(grill, **{field: False if field.endswith("State") else 0})
+        except ValueError:
+            continue
+        except TypeError:
+            # Accepted as a field, refused as a value -- still one of its own.
+            pass
+        accepted.add(field)
+    return frozenset(accepted)
+
+
+class GrillStandIn:
+    """The grill behind the relay: answers RPCs from the state it holds."""
+
+    def __init__(self, grill: Grill, **state: Any) -> None:
+        self.grill = grill
+        self.state: dict[str, Any] = {
+            "moduleIsOn": True,
+            "isFahrenheit": True,
+            "grillTemp": 225,
+            "grillSetTemp": 225,
+            **state,
+        }
+        self.firmware_version = "0.5.7"
+        self._booted_at = monotonic()
+        self.virtual_data: dict[str, Any] = {}
+        every = set(self.state) | {
+            "p1Target",
+            "p2Target",
+            "p1Temp",
+            "p2Temp",
+            "p3Temp",
+            "p4Temp",
+            "smokerActTemp",
+            "lightState",
+            "primeState",
+            "fanState",
+            "hotState",
+            "motorState",
+        }
+        self._status_fields = _fields_of(testing.status_frame, grill, every)
+        self._temperature_fields = _fields_of(testing.temperatures_frame, grill, every)
+
+    def frames(self) -> list[str]:
+        """The status and temperatures frames for the current state."""
+        return [
+            testing.status_frame(
+                self.grill,
+                **{k: v for k, v in self.state.items() if k in self._status_fields},
+            ),
+            testing.temperatures_frame(
+                self.grill,
+                **{
+                    k: v for k, v in self.state.items() if k in self._temperature_fields
+                },
+            ),
+        ]
+
+    def answer(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """The reply body for one RPC: `result` or `error`, as mg_rpc sends it."""
+        if method == "RPC.Ping":
+            return {"result": None}
+        if method == "PB.GetTime":
+            return {"result": {"time": monotonic() - self._booted_at}}
+        if method == "PB.GetState":
+            status, temperatures = self.frames()
+            return {"result": {"sc_11": status, "sc_12": temperatures}}
+        if method == "PB.GetFirmwareVersion":
+            return {"result": {"firmwareVersion": self.firmware_version}}
+        if method == "Sys.GetInfo":
+            return {
+                "result": {
+                    "uptime": monotonic() - self._booted_at,
+                    "ram_free": 40960,
+                }
+            }
+        if method == "PB.GetVirtualData":
+            return {"result": dict(self.virtual_data)}
+        if method == "PB.SetVirtualData":
+            self.virtual_data = {k: v for k, v in params.items() if k != "psw"}
+            return {"result": None}
+        if method in ("PB.SendMCUCommand", "PB.WiFiAwakeWDT"):
+            return {"result": None}
+        return {
+            "error": {"code": METHOD_NOT_FOUND, "message": f"No handler for {method}"}
+        }
+
+
+class RelayStandIn:
+    """The relay's websocket endpoint, serving one grill, with faults on tap."""
+
+    def __init__(self, grill: GrillStandIn, host: str = "127.0.0.1") -> None:
+        self.grill = grill
+        self.host = host
+        self.silent = False
+        self.refuse = False
+        self.reply_delay = 0.0
+        # What clients cost the relay: the numbers the benchmark reports.
+        self.rpcs: Counter[str] = Counter()
+        self.rpcs_unanswered = 0
+        self.sockets_opened = 0
+        self.handshakes_refused = 0
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._runner: web.AppRunner | None = None
+        self._pending: set[asyncio.Task] = set()
+        self.base_url = ""
+
+    @property
+    def sockets_open(self) -> int:
+        return len(self._sockets)
+
+    async def start(self) -> str:
+        """Start serving on a free port, and return the base URL to use."""
+        app = web.Application()
+        app.router.add_get("/to/{grill_id}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.base_url = f"ws://{self.host}:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        await self.drop_connections()
+        for task in list(self._pending):
+            task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def drop_connections(self) -> None:
+        """Close every socket from the relay's side."""
+        for ws in list(self._sockets):
+            await ws.close()
+
+    async def push(self, **state: Any) -> None:
+        """Update the grill's state and push it, as the grill does unprompted."""
+        self.grill.state.update(state)
+        await self._broadcast({"status": self.grill.frames()})
+
+    async def replay(self, frames: Iterable[list[str]], interval: float = 0.0) -> None:
+        """Push captured or synthesized status arrays, in order."""
+        for status in frames:
+            await self._broadcast({"status": status})
+            if interval:
+                await asyncio.sleep(interval)
+
+    async def _broadcast(self, payload: dict[str, Any]) -> None:
+        if self.silent:
+            return
+        for ws in list(self._sockets):
+            with suppress(ConnectionError):
+                await ws.send_json(payload)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if self.refuse:
+            self.handshakes_refused += 1
+            raise web.HTTPServiceUnavailable
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets_opened += 1
+        self._sockets.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type is not WSMsgType.TEXT:
+                    continue
+                cmd = json.loads(msg.data)
+                self.rpcs[cmd.get("method", "")] += 1
+                if self.silent:
+                    # The relay took it; nothing behind it will ever answer.
+                    self.rpcs_unanswered += 1
+                    continue
+                # Answered from a task so a delayed reply does not hold up
+                # the next command, as it would not on the real relay.
+                task = asyncio.create_task(self._reply(ws, cmd))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    async def _reply(self, ws: web.WebSocketResponse, cmd: dict[str, Any]) -> None:
+        if self.reply_delay:
+            await asyncio.sleep(self.reply_delay)
+        if self.silent or ws.closed:
+            self.rpcs_unanswered += 1
+            return
+        reply = {"id": cmd["id"], **self.grill.answer(cmd["method"], cmd["params"])}
+        if "app_id" in cmd:
+            reply["app_id"] = cmd["app_id"]
+        with suppress(ConnectionError):
+            await ws.send_json(reply)
+
+
+async def _serve(model: str) -> None:
+    relay = RelayStandIn(GrillStandIn(grills.get_grill(model)))
+    print(f"Serving {model} at {await relay.start()}/to/<grill id>")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await relay.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="PBV4PS2")
+    args = parser.parse_args()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args.model))
+
+
+if __name__ == "__main__":
+    main()
@@ -159,7 +159,10 @@ def mock_conn() -> Generator[Mock]:
 
 @pytest.fixture
 def mock_wss_conn() -> Generator[Mock]:
-    with patch("pytboss.wss.WebSocketConnection", autospec=True) as mock_conn_cls:
+    # pytboss's transport, as the relay manager subclasses it.
+    with patch(
+        "custom_components.pitboss.SharedRelayConnection", autospec=True
+    ) as mock_conn_cls:
         yield mock_conn_cls.return_value
 
 
@@ -0,0 +1,117 @@
+from unittest.mock import Mock, patch
+
+from custom_components.pitboss.advertisement import AdvertisementTracker
+from custom_components.pitboss.const import RECONNECT_DEBOUNCE_SECONDS
+
+
+def _advertisement(source: str, rssi: int) -> Mock:
+    return Mock(source=source, rssi=rssi, manufacturer_data={}, service_data={})
+
+
+def test_signal_strength_is_tracked_per_source() -> None:
+    tracker = AdvertisementTracker()
+    tracker.record(_advertisement("proxy-a", -60))
+    tracker.record(_advertisement("proxy-a", -70))
+    tracker.record(_advertisement("proxy-b", -90))
+
+    report = tracker.as_dict()
+
+    assert report["advertisements_total"] == 3
+    assert report["sources"]["proxy-a"]["rssi"] == -70
+    assert report["sources"]["proxy-a"]["rssi_mean"] == -65
+    assert report["sources"]["proxy-b"]["advertisements"] == 1
+
+
+def test_one_reconnect_at_a_time() -> None:
+    """A burst of advertisements while disconnected starts one reconnect."""
+    tracker = AdvertisementTracker()
+    assert tracker.claim_reconnect()
+    assert not tracker.claim_reconnect()
+    tracker.reconnect_done("proxy-a", connected=False)
+    assert tracker.reconnects == 1
+
+
+def test_reconnects_are_spaced_out() -> None:
+    with patch("custom_components.pitboss.advertisement.monotonic", return_value=100.0):
+        tracker = AdvertisementTracker()
+        assert tracker.claim_reconnect()
+        tracker.reconnect_done("proxy-a", connected=False)
+        # Finished, but too soon after the last one began.
+        assert not tracker.claim_reconnect()
+    with patch(
+        "custom_components.pitboss.advertisement.monotonic",
+        return_value=100.0 + RECONNECT_DEBOUNCE_SECONDS,
+    ):
+        assert tracker.claim_reconnect()
+    assert tracker.reconnects == 2
+
+
+def _candidate(source: str, rssi: int, free: int | None) -> Mock:
+    candidate = Mock()
+    candidate.scanner.source = source
+    candidate.scanner.get_allocations.return_value = (
+        None if free is None else Mock(free=free)
+    )
+    candidate.advertisement.rssi = rssi
+    candidate.ble_device = Mock(name=f"device via {source}")
+    return candidate
+
+
+def _heard_by(tracker: AdvertisementTracker, **rssi: int) -> None:
+    for source, value in rssi.items():
+        advertisement = _advertisement(source, value)
+        advertisement.address = "AA:BB"
+        tracker.record(advertisement)
+
+
+def test_the_strongest_source_with_a_free_slot_is_chosen() -> None:
+    tracker = AdvertisementTracker()
+    _heard_by(tracker, near=-50, far=-90, full=-40)
+    candidates = [
+        _candidate("far", -90, free=3),
+        _candidate("near", -50, free=1),
+        _candidate("full", -40, free=0),
+    ]
+
+    with patch(
+        "custom_components.pitboss.advertisement.bluetooth"
+        ".async_scanner_devices_by_address",
+        return_value=candidates,
+    ):
+        choice = tracker.choose(Mock(), connected=False)
+
+    assert choice == ("near", candidates[1].ble_device)
+
+
+def test_a_healthy_link_is_left_where_it_is() -> None:
+    tracker = AdvertisementTracker()
+    _heard_by(tracker, near=-50, far=-90)
+    tracker.reconnect_done("far", connected=True)
+    assert tracker.choose(Mock(), connected=True) is None
+
+
+def test_a_degraded_link_moves_only_to_a_clearly_stronger_source() -> None:
+    tracker = AdvertisementTracker()
+    _heard_by(tracker, near=-50, far=-90, close=-87)
+    tracker.reconnect_done("far", connected=True)
+    tracker.degraded = True
+
+    with patch(
+        "custom_components.pitboss.advertisement.bluetooth"
+        ".async_scanner_devices_by_address",
+        return_value=[_candidate("far", -90, None), _candidate("close", -87, None)],
+    ):
+        assert tracker.choose(Mock(), connected=True) is None
+
+    near = _candidate("near", -50, None)
+    with patch(
+        "custom_components.pitboss.advertisement.bluetooth"
+        ".async_scanner_devices_by_address",
+        return_value=[_candidate("far", -90, None), near],
+    ):
+        assert tracker.choose(Mock(), connected=True) == ("near", near.ble_device)
+
+    tracker.reconnect_done("near", connected=True)
+    assert tracker.migrations == 1
+    assert not tracker.degraded
+    assert tracker.as_dict()["sources"]["near"]["connect_success_rate"] == 1.0
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from custom_components.pitboss.breaker import BreakerState, ReconnectBreaker
+from custom_components.pitboss.const import (
+    RECONNECT_BACKOFF_BASE_SECONDS,
+    RECONNECT_BACKOFF_MAX_SECONDS,
+    RECONNECT_RETRY_FLOOR_SECONDS,
+)
+
+MONOTONIC = "custom_components.pitboss.breaker.monotonic"
+
+
+def test_starts_closed() -> None:
+    breaker = ReconnectBreaker()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow()
+
+
+def test_each_failure_waits_longer() -> None:
+    breaker = ReconnectBreaker(jitter=lambda: 1.0)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+        assert breaker.retry_at == 100.0 + RECONNECT_BACKOFF_BASE_SECONDS
+        breaker.record_failure()
+        assert breaker.retry_at == 100.0 + 2 * RECONNECT_BACKOFF_BASE_SECONDS
+        for _ in range(20):
+            breaker.record_failure()
+        assert breaker.retry_at == 100.0 + RECONNECT_BACKOFF_MAX_SECONDS
+
+
+def test_waits_are_jittered_within_their_upper_half() -> None:
+    breaker = ReconnectBreaker(jitter=lambda: 0.0)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+    assert breaker.retry_at == 100.0 + RECONNECT_BACKOFF_BASE_SECONDS / 2
+
+
+def test_open_then_half_open_then_closed() -> None:
+    breaker = ReconnectBreaker(jitter=lambda: 1.0)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+        assert breaker.state is BreakerState.OPEN
+        assert not breaker.allow()
+    with patch(MONOTONIC, return_value=100.0 + RECONNECT_BACKOFF_BASE_SECONDS):
+        assert breaker.state is BreakerState.HALF_OPEN
+        assert breaker.allow()
+        breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_retry_now_ends_the_wait_but_not_too_soon() -> None:
+    breaker = ReconnectBreaker(jitter=lambda: 1.0)
+    with patch(MONOTONIC, return_value=100.0):
+        breaker.record_failure()
+        assert not breaker.retry_now()
+    with patch(MONOTONIC, return_value=100.0 + RECONNECT_RETRY_FLOOR_SECONDS):
+        assert breaker.retry_now()
+        assert breaker.allow()
+        # Nothing left to end.
+        assert not breaker.retry_now()
+    assert breaker.early_retries == 1
@@ -1,9 +1,13 @@
-from unittest.mock import Mock
+import asyncio
+from datetime import timedelta
+from time import monotonic
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 from pytboss.exceptions import (
     GrillUnavailable,
     NotConnectedError,
@@ -11,12 +15,33 @@ from pytboss.exceptions import (
     Unauthorized,
 )
 from pytboss.grills import StateDict
+from pytboss.transport import Transport
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
+from custom_components.pitboss.advertisement import AdvertisementTracker
+from custom_components.pitboss.breaker import BreakerState
 from custom_components.pitboss.const import (
     ACTIVE_SCAN_INTERVAL,
+    CONF_RELEASE_IDLE_LINK,
+    DOMAIN,
+    IDLE_RELEASE_SECONDS,
+    MCU_SETTLE_FLOOR,
+    MCU_SETTLE_MIN_SAMPLES,
+    MCU_SETTLE_SECONDS,
+    PRESENCE_SILENCE_SECONDS,
+    PROBE_SEED_RETRY_SECONDS,
+    PROTOCOL_WSS,
+    RPC_TIMEOUT_FLOOR,
+    RPC_TIMEOUT_MIN_SAMPLES,
     STANDBY_SCAN_INTERVAL,
 )
 from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.failover import FailoverTransport
+from custom_components.pitboss.fleet import PollFleet
+from custom_components.pitboss.metrics import PollCycle
 
 pytestmark = pytest.mark.parametrize("model", ["PBV4PS2"])
 
@@ -214,6 +239,76 @@ async def test_a_failed_reconnect_is_a_failed_cycle_not_a_crash(
         await coordinator._async_update_data()
 
 
+async def test_a_failed_reconnect_is_not_retried_until_the_wait_is_up(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """An unreachable local grill is not asked again every poll."""
+    coordinator = PitBossDataUpdateCoordinator(
+        hass, DeviceInfo(), mock_pitboss, reconnect_on_poll=True
+    )
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = False
+    mock_pitboss.start.side_effect = NotConnectedError("still nothing there")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    mock_pitboss.start.assert_awaited_once()
+    assert coordinator.reconnect_breaker.state is BreakerState.OPEN
+
+    # Until someone wants the grill.
+    coordinator.reconnect_breaker._attempted_at = None
+    mock_pitboss.start.side_effect = lambda: setattr(
+        mock_pitboss.is_connected, "return_value", True
+    )
+    await coordinator.async_rpc("turn_light_on", mock_pitboss.turn_light_on)
+    await hass.async_block_till_done()
+
+    assert mock_pitboss.start.await_count == 2
+    assert coordinator.reconnect_breaker.state is BreakerState.CLOSED
+
+
+async def test_a_command_fails_fast_while_the_grill_was_just_tried(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """Rather than going out over a link known to be down."""
+    coordinator = PitBossDataUpdateCoordinator(
+        hass, DeviceInfo(), mock_pitboss, reconnect_on_poll=True
+    )
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = False
+    mock_pitboss.start.side_effect = NotConnectedError("still nothing there")
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    with pytest.raises(GrillUnavailable):
+        await coordinator.async_rpc("turn_light_on", mock_pitboss.turn_light_on)
+
+    mock_pitboss.start.assert_awaited_once()
+    mock_pitboss.turn_light_on.assert_not_awaited()
+
+
+async def test_a_command_waits_for_the_reconnect_it_asks_for(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    coordinator = PitBossDataUpdateCoordinator(
+        hass, DeviceInfo(), mock_pitboss, reconnect_on_poll=True
+    )
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = False
+    sent: list[str] = []
+    mock_pitboss.start.side_effect = lambda: sent.append("start")
+    mock_pitboss.turn_light_on.side_effect = lambda: sent.append("turn_light_on")
+
+    await coordinator.async_rpc("turn_light_on", mock_pitboss.turn_light_on)
+
+    assert sent == ["start", "turn_light_on"]
+    await hass.async_block_till_done()
+    await coordinator.async_shutdown()
+
+
 async def test_transports_that_reconnect_themselves_still_fail_fast(
     coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
 ) -> None:
@@ -304,7 +399,9 @@ async def test_a_success_resets_the_failure_pattern(
 
 
 async def test_a_restored_target_is_seeded_in_the_grills_current_unit(
-    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
 ) -> None:
     """Captured as 74 while the grill spoke Celsius, seeded after a flip.
 
@@ -322,6 +419,7 @@ async def test_a_restored_target_is_seeded_in_the_grills_current_unit(
     mock_pitboss.is_connected.return_value = True
     mock_pitboss.get_state.return_value = StateDict(moduleIsOn=True, isFahrenheit=True)
     await coordinator._async_update_data()
+    await hass.async_block_till_done()
     mock_pitboss.set_probe_target.assert_awaited_once_with(2, 165)
 
 
@@ -367,7 +465,9 @@ async def test_the_minimum_is_dropped_from_every_source(
 
 
 async def test_a_restored_minimum_is_not_seeded_to_the_grill(
-    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
 ) -> None:
     """Seeding one would write the board's own placeholder back to it."""
     coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
@@ -378,6 +478,7 @@ async def test_a_restored_minimum_is_not_seeded_to_the_grill(
     mock_pitboss.is_connected.return_value = True
     mock_pitboss.get_state.return_value = StateDict(moduleIsOn=True, isFahrenheit=True)
     await coordinator._async_update_data()
+    await hass.async_block_till_done()
 
     mock_pitboss.set_probe_target.assert_awaited_once_with(3, 165)
 
@@ -423,3 +524,423 @@ async def test_a_unit_flip_arriving_by_poll(
     await coordinator.async_refresh()
 
     assert coordinator.probe_target(3) == 74
+
+
+async def test_a_frame_confirming_a_write_ends_the_wait(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """No fallback poll once a frame has already reported the new value."""
+    coordinator.async_set_updated_data({"lightState": False})
+    await coordinator.async_write(
+        "lightState", True, "turn_light_on", mock_pitboss.turn_light_on
+    )
+    assert coordinator.pending("lightState") is True
+
+    await coordinator._on_state_update({"lightState": True})
+
+    assert "lightState" not in coordinator._pending
+    assert coordinator.settle_confirmed == 1
+    assert coordinator.settle_fell_back == 0
+
+
+async def test_the_settle_window_is_learned_from_confirmations(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """A board that confirms at once is held for the floor, not six seconds."""
+    assert coordinator.settle_window == MCU_SETTLE_SECONDS
+    lit = False
+    for _ in range(MCU_SETTLE_MIN_SAMPLES):
+        lit = not lit
+        await coordinator.async_write(
+            "lightState", lit, "turn_light_on", mock_pitboss.turn_light_on
+        )
+        await coordinator._on_state_update({"lightState": lit})
+    assert coordinator.settle_window == MCU_SETTLE_FLOOR
+
+
+async def test_a_write_the_grill_already_reports_teaches_nothing(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """Turning on a light that is on confirms at once, and says nothing."""
+    coordinator.async_set_updated_data({"lightState": True})
+    await coordinator.async_write(
+        "lightState", True, "turn_light_on", mock_pitboss.turn_light_on
+    )
+    assert coordinator.pending("lightState") is None
+    assert coordinator.settle_confirmed == 0
+
+
+async def test_a_burst_of_targets_is_sent_as_the_first_and_the_latest(
+    coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A slider dragged over a slow link sends two writes, not ten."""
+    monkeypatch.setattr(
+        "custom_components.pitboss.coordinator.COMMAND_COALESCE_SECONDS", 0
+    )
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    on_the_wire = asyncio.Event()
+    answered = asyncio.Event()
+
+    async def slow_set(probe_number: int, temp: int) -> None:
+        on_the_wire.set()
+        await answered.wait()
+
+    mock_pitboss.set_probe_target.side_effect = slow_set
+    first = asyncio.create_task(coordinator.async_set_probe_target(1, 150))
+    await on_the_wire.wait()
+    rest = [
+        asyncio.create_task(coordinator.async_set_probe_target(1, temp))
+        for temp in range(151, 160)
+    ]
+    await asyncio.sleep(0)
+    answered.set()
+    await asyncio.gather(first, *rest)
+
+    assert [c.args for c in mock_pitboss.set_probe_target.await_args_list] == [
+        (1, 150),
+        (1, 159),
+    ]
+    assert coordinator.commands_collapsed == 8
+    assert coordinator.pending("p1Target") == 159
+    coordinator.scheduler.shutdown()
+
+
+async def test_settings_are_coalesced_separately(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """A write to one probe never replaces a write to another."""
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    await asyncio.gather(
+        coordinator.async_set_probe_target(1, 150),
+        coordinator.async_set_probe_target(2, 160),
+    )
+    assert mock_pitboss.set_probe_target.await_count == 2
+    assert coordinator.commands_collapsed == 0
+    coordinator.scheduler.shutdown()
+
+
+async def test_seeding_does_not_hold_up_the_poll(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
+) -> None:
+    """The first lit cycle returns before the held targets are written."""
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    for probe in (1, 2, 3, 4):
+        coordinator.note_restored_target(probe, 160 + probe)
+    answered = asyncio.Event()
+
+    async def slow_set(probe_number: int, temp: int) -> None:
+        await answered.wait()
+
+    mock_pitboss.set_probe_target.side_effect = slow_set
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = True
+    mock_pitboss.get_state.return_value = StateDict(moduleIsOn=True, isFahrenheit=True)
+    await coordinator._async_update_data()
+    assert coordinator.probe_targets == {}
+
+    answered.set()
+    await hass.async_block_till_done()
+    assert coordinator.probe_targets == {1: 161, 2: 162, 3: 163, 4: 164}
+    assert set(coordinator.seed_results.values()) == {"seeded"}
+
+
+async def test_a_failed_seed_is_tried_again(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
+) -> None:
+    """Only the probe that failed, and without waiting for a power cycle."""
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    coordinator.note_restored_target(1, 161)
+    coordinator.note_restored_target(2, 162)
+
+    async def flaky_set(probe_number: int, temp: int) -> None:
+        if probe_number == 2:
+            raise TimeoutError
+
+    mock_pitboss.set_probe_target.side_effect = flaky_set
+    mock_pitboss.get_probe_targets.return_value = {}
+    await coordinator._async_refresh_probe_targets(StateDict(moduleIsOn=True))
+    await hass.async_block_till_done()
+    assert coordinator.seed_results == {1: "seeded", 2: "TimeoutError: "}
+
+    mock_pitboss.set_probe_target.reset_mock(side_effect=True)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=PROBE_SEED_RETRY_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+    mock_pitboss.set_probe_target.assert_awaited_once_with(2, 162)
+    assert coordinator.seed_results[2] == "seeded"
+
+
+async def test_targets_in_the_frame_are_not_read_again(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """A board reporting every `pNTarget` saves a round trip per poll."""
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    state = StateDict(moduleIsOn=True, isFahrenheit=True, p1Target=165, p2Target=50)
+    await coordinator._async_refresh_probe_targets(state)
+
+    mock_pitboss.get_probe_targets.assert_not_awaited()
+    assert coordinator.frame_targets == {1, 2}
+    # The board's "no target" placeholder is not a target it holds.
+    assert coordinator.probe_targets == {1: 165}
+
+
+async def test_targets_kept_out_of_the_frame_are_read_on_a_slower_cadence(
+    coordinator: PitBossDataUpdateCoordinator, mock_pitboss: Mock
+) -> None:
+    """Read at power-on, then again only once something may have changed."""
+    coordinator.async_set_updated_data(StateDict(isFahrenheit=True))
+    state = StateDict(moduleIsOn=True, isFahrenheit=True)
+    await coordinator._async_refresh_probe_targets(state)
+    await coordinator._async_refresh_probe_targets(state)
+    assert mock_pitboss.get_probe_targets.await_count == 1
+
+    # A set from here means the grill's store has changed.
+    await coordinator.async_set_probe_target(1, 165)
+    await coordinator._async_refresh_probe_targets(state)
+    assert mock_pitboss.get_probe_targets.await_count == 2
+
+    # So does a unit flip.
+    await coordinator._async_refresh_probe_targets(
+        StateDict(moduleIsOn=True, isFahrenheit=False)
+    )
+    assert mock_pitboss.get_probe_targets.await_count == 3
+    coordinator.scheduler.shutdown()
+
+
+@pytest.fixture
+def idle_link() -> AsyncMock:
+    return AsyncMock(spec=Transport)
+
+
+@pytest.fixture
+def releasing_coordinator(
+    hass: HomeAssistant, mock_pitboss: Mock, idle_link: AsyncMock
+) -> PitBossDataUpdateCoordinator:
+    coordinator = PitBossDataUpdateCoordinator(
+        hass,
+        DeviceInfo(),
+        mock_pitboss,
+        call_limit=1,
+        advertisements=AdvertisementTracker(),
+        idle_link=idle_link,
+    )
+    coordinator.config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_RELEASE_IDLE_LINK: True}
+    )
+    return coordinator
+
+
+async def _idle(hass: HomeAssistant, coordinator: PitBossDataUpdateCoordinator) -> None:
+    coordinator.async_set_updated_data({"moduleIsOn": False})
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=IDLE_RELEASE_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+
+async def test_an_idle_grill_releases_its_link(
+    hass: HomeAssistant,
+    releasing_coordinator: PitBossDataUpdateCoordinator,
+    mock_pitboss: Mock,
+    idle_link: AsyncMock,
+) -> None:
+    """And stays usable: a released link is one reconnect from a command."""
+    mock_pitboss.is_connected.return_value = False
+
+    await _idle(hass, releasing_coordinator)
+
+    idle_link.disconnect.assert_awaited_once()
+    assert releasing_coordinator.link_released
+    assert releasing_coordinator.is_connected()
+    # The poll does not reconnect to ask a grill in standby anything.
+    assert await releasing_coordinator._async_poll(PollCycle()) == {"moduleIsOn": False}
+    idle_link.connect.assert_not_awaited()
+
+    await releasing_coordinator.async_rpc("turn_light_on", mock_pitboss.turn_light_on)
+
+    idle_link.connect.assert_awaited_once()
+    assert not releasing_coordinator.link_released
+    assert releasing_coordinator.rpc_latency.methods["connect"].count == 1
+    await releasing_coordinator.async_shutdown()
+
+
+async def test_a_released_link_polls_over_the_fallbacks(
+    hass: HomeAssistant, mock_pitboss: Mock, idle_link: AsyncMock
+) -> None:
+    """Rather than reporting the state it was released in."""
+    transports = Mock(spec=FailoverTransport)
+    transports.is_connected.return_value = True
+    coordinator = PitBossDataUpdateCoordinator(
+        hass,
+        DeviceInfo(),
+        mock_pitboss,
+        idle_link=idle_link,
+        transports=transports,
+    )
+    coordinator.config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_RELEASE_IDLE_LINK: True}
+    )
+    await _idle(hass, coordinator)
+    assert coordinator.link_released
+    mock_pitboss.get_state.return_value = StateDict(moduleIsOn=True)
+
+    assert (await coordinator._async_poll(PollCycle()))["moduleIsOn"] is True
+    mock_pitboss.ping.assert_awaited()
+    idle_link.connect.assert_not_awaited()
+    await coordinator.async_shutdown()
+
+
+async def test_a_lit_grill_keeps_its_link(
+    hass: HomeAssistant,
+    releasing_coordinator: PitBossDataUpdateCoordinator,
+    idle_link: AsyncMock,
+) -> None:
+    releasing_coordinator.async_set_updated_data({"moduleIsOn": True})
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=IDLE_RELEASE_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+    idle_link.disconnect.assert_not_awaited()
+    await releasing_coordinator.async_shutdown()
+
+
+async def test_the_link_is_kept_unless_asked(
+    hass: HomeAssistant,
+    releasing_coordinator: PitBossDataUpdateCoordinator,
+    idle_link: AsyncMock,
+) -> None:
+    releasing_coordinator.config_entry = MockConfigEntry(domain=DOMAIN)
+
+    await _idle(hass, releasing_coordinator)
+
+    idle_link.disconnect.assert_not_awaited()
+    await releasing_coordinator.async_shutdown()
+
+
+async def test_an_unheard_grill_that_is_off_is_not_polled(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """Until it is heard again, which polls it at once."""
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator.async_set_updated_data({"moduleIsOn": False})
+    coordinator.heard_at = monotonic() - PRESENCE_SILENCE_SECONDS - 1
+
+    assert await coordinator._async_update_data() == {"moduleIsOn": False}
+    assert coordinator.polls_skipped == 1
+    mock_pitboss.ping.assert_not_awaited()
+
+    coordinator.heard_nearby()
+    await hass.async_block_till_done()
+
+    mock_pitboss.ping.assert_awaited()
+    await coordinator.async_shutdown()
+
+
+async def test_an_unheard_grill_that_is_lit_is_still_polled(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """Out of range of the proxy is not the same as off."""
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator.async_set_updated_data({"moduleIsOn": True})
+    coordinator.heard_at = monotonic() - PRESENCE_SILENCE_SECONDS - 1
+
+    await coordinator._async_update_data()
+
+    assert coordinator.polls_skipped == 0
+    mock_pitboss.ping.assert_awaited()
+    await coordinator.async_shutdown()
+
+
+async def test_a_grill_never_heard_is_polled(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator.async_set_updated_data({"moduleIsOn": False})
+
+    await coordinator._async_update_data()
+
+    assert coordinator.polls_skipped == 0
+    await coordinator.async_shutdown()
+
+
+def _refreshes_at(
+    hass: HomeAssistant,
+    coordinator: PitBossDataUpdateCoordinator,
+    first_ended: float,
+    durations: list[float],
+) -> list[float]:
+    """When each timed refresh fires, each poll taking the next duration."""
+    times: list[float] = []
+    ended = first_ended
+    for duration in [0.0, *durations]:
+        with patch.object(hass.loop, "time", return_value=ended + duration):
+            coordinator._schedule_refresh()
+        times.append(coordinator._unsub_refresh.__self__.when())
+        ended = times[-1]
+    coordinator._async_unsub_refresh()
+    return times
+
+
+async def test_fleet_phases_place_the_first_refresh_only(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """Each entry starts on its own phase, then polls every interval."""
+    fleet = PollFleet()
+    first, second = (
+        PitBossDataUpdateCoordinator(
+            hass, DeviceInfo(), mock_pitboss, fleet=fleet.join(entry_id, PROTOCOL_WSS)
+        )
+        for entry_id in ("a", "b")
+    )
+    interval = ACTIVE_SCAN_INTERVAL.total_seconds()
+    first.update_interval = second.update_interval = ACTIVE_SCAN_INTERVAL
+
+    fired = {}
+    for coordinator in (first, second):
+        # A quick poll, then one that runs past half the interval.
+        fired[coordinator] = _refreshes_at(hass, coordinator, 1000.3, [0.5, 6.0])
+        # Still the base class's fraction of a second.
+        assert 0 <= coordinator._microsecond < 1
+        start, quick, slow = fired[coordinator]
+        assert start == pytest.approx(
+            1000 + interval + coordinator.fleet.offset + coordinator._microsecond
+        )
+        # An interval after each poll ends, never a whole interval more.
+        # (Give or take the second the base class rounds to.)
+        assert interval - 1 < quick - start < interval + 1.5
+        assert interval + 5 < slow - quick < interval + 7
+
+    assert fired[second][0] - fired[first][0] == pytest.approx(
+        second.fleet.offset
+        - first.fleet.offset
+        + second._microsecond
+        - first._microsecond
+    )
+    await first.async_shutdown()
+    await second.async_shutdown()
+
+
+async def test_reads_over_several_transports_are_left_to_the_failover(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """A deadline around them all would leave every member but one untried."""
+    coordinator = PitBossDataUpdateCoordinator(
+        hass, DeviceInfo(), mock_pitboss, transports=Mock(spec=FailoverTransport)
+    )
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        coordinator.rpc_timeouts.record("get_state", 0.01)
+
+    async def slow() -> StateDict:
+        await asyncio.sleep(RPC_TIMEOUT_FLOOR * 2)
+        return StateDict()
+
+    assert await coordinator._async_read("get_state", slow) == {}
+    await coordinator.async_shutdown()
@@ -0,0 +1,126 @@
+from collections.abc import Awaitable, Callable
+from typing import cast
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.const import CONF_DEVICE_ID, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytboss.grills import StateDict
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pitboss.const import DOMAIN, POLL_CYCLE_HISTORY
+from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.diagnostics import async_get_config_entry_diagnostics
+
+pytestmark = pytest.mark.parametrize("model", ["PBV4PS2"])
+
+
+async def test_diagnostics_redact_the_credentials(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    entry = await mock_add_config_entry()
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_PASSWORD] == "**REDACTED**"
+    assert diagnostics["entry"]["data"][CONF_DEVICE_ID] == "**REDACTED**"
+    assert diagnostics["spec"]["name"] == "PBV4PS2"
+    assert diagnostics["spec"]["meat_probes"] == 2
+
+
+async def test_diagnostics_break_each_poll_down_by_stage(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    mock_pitboss.is_connected.return_value = True
+    mock_pitboss.get_state.return_value = {"moduleIsOn": True, "grillTemp": 225}
+
+    await coordinator.async_refresh()
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    cycle = diagnostics["polling"]["cycles"][-1]
+    assert cycle["error"] is None
+    assert {"ping", "sys_info", "firmware", "get_state", "probe_targets"} <= set(
+        cycle["stages_ms"]
+    )
+    # Attributed after the base class hands the result to the entities.
+    assert "dispatch" in cycle["stages_ms"]
+    assert diagnostics["state"]["grillTemp"] == 225
+    assert diagnostics["polling"]["interval_seconds"] == 10
+    assert diagnostics["fleet"]["transport"] == "wss"
+    assert diagnostics["fleet"]["lag"]["count"] >= 1
+    assert diagnostics["relay"]["grills"] == 1
+
+
+async def test_a_failed_cycle_shows_how_far_it_got(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    mock_pitboss.is_connected.return_value = True
+    mock_pitboss.get_state.side_effect = TimeoutError()
+    failed_before = coordinator.polls_failed
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    cycle = diagnostics["polling"]["cycles"][-1]
+    assert "UpdateFailed" in cycle["error"]
+    assert "ping" in cycle["stages_ms"]
+    assert "probe_targets" not in cycle["stages_ms"]
+    assert diagnostics["polling"]["polls_failed"] == failed_before + 1
+    assert diagnostics["polling"]["consecutive_failures"] == 1
+
+
+async def test_only_the_recent_cycles_are_kept(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    mock_pitboss.is_connected.return_value = True
+
+    for _ in range(POLL_CYCLE_HISTORY + 5):
+        await coordinator._async_update_data()
+
+    assert len(coordinator.poll_cycles) == POLL_CYCLE_HISTORY
+
+
+async def test_push_frames_are_counted(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    for temp in (200, 205, 210):
+        await coordinator._on_state_update(cast(StateDict, {"grillTemp": temp}))
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["push"]["frames_total"] == 3
+    assert diagnostics["push"]["frames_per_minute"] is not None
+
+
+async def test_connected_is_what_the_entities_show(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    """A released link counts as connected there, so it does here."""
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    mock_pitboss.is_connected.return_value = False
+    coordinator.link_released = True
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["connected"] is True
+    coordinator.link_released = False
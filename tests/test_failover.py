@@ -0,0 +1,274 @@
+import asyncio
+from time import monotonic
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytboss.exceptions import NotConnectedError, RPCError
+from pytboss.transport import Transport
+
+from custom_components.pitboss.const import (
+    FAILOVER_FAILURES,
+    FAILOVER_RETRY_SECONDS,
+    RPC_TIMEOUT_FLOOR,
+    RPC_TIMEOUT_MIN_SAMPLES,
+)
+from custom_components.pitboss.failover import CONNECT, FailoverTransport, Member
+from custom_components.pitboss.gate import PriorityGate
+
+
+def _transport(connected: bool = True) -> Mock:
+    transport = Mock(spec=Transport)
+    transport.is_connected.return_value = connected
+    transport.connect = AsyncMock()
+    transport.disconnect = AsyncMock()
+    transport.send_command = AsyncMock(return_value={"ok": True})
+    transport.send_command_without_answer = AsyncMock()
+    return transport
+
+
+async def test_first_member_is_used_first() -> None:
+    ble, wss = _transport(), _transport()
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    assert await failover.send_command("ping", {}) == {"ok": True}
+
+    ble.send_command.assert_awaited_once()
+    wss.send_command.assert_not_awaited()
+    assert failover.active == "ble"
+
+
+async def test_timeout_fails_over_to_the_next_member() -> None:
+    ble, wss = _transport(), _transport()
+    ble.send_command.side_effect = TimeoutError
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    assert await failover.send_command("ping", {}) == {"ok": True}
+
+    wss.send_command.assert_awaited_once()
+    assert failover.active == "wss"
+    assert failover.as_dict()["members"]["ble"]["failure_streak"] == 1
+
+
+async def test_grill_errors_are_not_retried() -> None:
+    """An error the grill answered with would be its answer on any transport."""
+    ble, wss = _transport(), _transport()
+    ble.send_command.side_effect = RPCError("no")
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    with pytest.raises(RPCError):
+        await failover.send_command("ping", {})
+
+    wss.send_command.assert_not_awaited()
+
+
+async def test_disconnected_members_are_skipped() -> None:
+    ble, wss = _transport(connected=False), _transport()
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    await failover.send_command("ping", {})
+
+    ble.send_command.assert_not_awaited()
+    wss.send_command.assert_awaited_once()
+
+
+async def test_local_member_is_reconnected_on_use() -> None:
+    local = _transport(connected=False)
+
+    async def connect() -> None:
+        local.is_connected.return_value = True
+
+    local.connect.side_effect = connect
+    failover = FailoverTransport([Member("local", local, reconnect_on_use=True)])
+
+    await failover.send_command("ping", {})
+
+    local.connect.assert_awaited_once()
+    local.send_command.assert_awaited_once()
+
+
+async def test_an_unreachable_local_member_waits_out_its_breaker() -> None:
+    """Not asked again by every call that gets as far as it."""
+    local, wss = _transport(connected=False), _transport()
+    local.connect.side_effect = OSError("no route to host")
+    members = [Member("local", local, reconnect_on_use=True), Member("wss", wss)]
+    failover = FailoverTransport(members)
+
+    await failover.send_command("ping", {})
+    await failover.send_command("ping", {})
+
+    local.connect.assert_awaited_once()
+    assert wss.send_command.await_count == 2
+    assert failover.as_dict()["members"]["local"]["reconnect"]["state"] == "open"
+
+
+async def test_a_reconnect_is_bounded_by_its_learned_wait() -> None:
+    local, wss = _transport(connected=False), _transport()
+    local.connect.side_effect = asyncio.Event().wait
+    members = [Member("local", local, reconnect_on_use=True), Member("wss", wss)]
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        members[0].timeouts.record(CONNECT, 0.01)
+    failover = FailoverTransport(members)
+
+    async with asyncio.timeout(RPC_TIMEOUT_FLOOR * 4):
+        assert await failover.send_command("ping", {}) == {"ok": True}
+
+    assert members[0].timeouts.as_dict()[CONNECT]["backoff"] == 1
+
+
+async def test_failing_member_goes_to_the_back() -> None:
+    ble, wss = _transport(), _transport()
+    members = [Member("ble", ble), Member("wss", wss)]
+    failover = FailoverTransport(members)
+    members[0].latency = 0.1
+    members[1].latency = 0.5
+    assert failover.ranked()[0].name == "ble"
+
+    for _ in range(FAILOVER_FAILURES):
+        members[0].record_failure()
+
+    assert failover.ranked()[0].name == "wss"
+
+
+async def test_a_demoted_member_is_tried_again_once_its_wait_is_up() -> None:
+    """And the grill goes back to it, rather than staying on the fallback."""
+    local, wss = _transport(), _transport()
+    members = [Member("local", local), Member("wss", wss)]
+    failover = FailoverTransport(members)
+    members[0].record(0.05)
+    members[1].record(0.5)
+    local.send_command.side_effect = TimeoutError
+    for _ in range(FAILOVER_FAILURES):
+        await failover.send_command("ping", {})
+    local.send_command.side_effect = None
+    local.send_command.reset_mock()
+
+    await failover.send_command("ping", {})
+    local.send_command.assert_not_awaited()
+
+    members[0].failed_at = monotonic() - FAILOVER_RETRY_SECONDS
+    await failover.send_command("ping", {})
+    local.send_command.assert_awaited_once()
+    assert failover.active == "local"
+    assert not members[0].demoted(monotonic())
+
+
+async def test_a_member_that_often_fails_costs_more() -> None:
+    ble, wss = _transport(), _transport()
+    members = [Member("ble", ble), Member("wss", wss)]
+    failover = FailoverTransport(members)
+    members[0].record(0.2)
+    members[1].record(0.3)
+    assert failover.ranked()[0].name == "ble"
+
+    # Failing every other call, never twice running.
+    for _ in range(3):
+        members[0].record_failure()
+        members[0].record(0.2)
+        members[0].record_failure()
+        members[0].record(0.2)
+
+    # Still the faster round trip, but no longer the cheaper call.
+    assert members[0].latency < members[1].latency
+    assert failover.ranked()[0].name == "wss"
+
+
+async def test_faster_member_is_preferred() -> None:
+    ble, wss = _transport(), _transport()
+    members = [Member("ble", ble), Member("wss", wss)]
+    failover = FailoverTransport(members)
+    members[0].record(0.9)
+    members[1].record(0.2)
+
+    await failover.send_command("ping", {})
+
+    wss.send_command.assert_awaited_once()
+
+
+async def test_nothing_connected_raises() -> None:
+    failover = FailoverTransport([Member("ble", _transport(connected=False))])
+
+    with pytest.raises(NotConnectedError):
+        await failover.send_command("ping", {})
+    with pytest.raises(NotConnectedError):
+        await failover.connect()
+
+
+async def test_connect_succeeds_if_any_member_connects() -> None:
+    ble, wss = _transport(connected=False), _transport()
+    ble.connect.side_effect = OSError("out of range")
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    await failover.connect()
+
+    wss.connect.assert_awaited_once()
+    assert failover.is_connected()
+
+
+async def test_callbacks_reach_every_member() -> None:
+    ble, wss = _transport(), _transport()
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+    callback = AsyncMock()
+
+    failover.set_state_callback(callback)
+
+    ble.set_state_callback.assert_called_once_with(callback)
+    wss.set_state_callback.assert_called_once_with(callback)
+
+
+async def test_commands_without_answer_go_to_the_first_member_up() -> None:
+    ble, wss = _transport(connected=False), _transport()
+    failover = FailoverTransport([Member("ble", ble), Member("wss", wss)])
+
+    await failover.send_command_without_answer("ping", {"a": 1})
+
+    ble.send_command_without_answer.assert_not_awaited()
+    wss.send_command_without_answer.assert_awaited_once_with("ping", {"a": 1})
+
+
+async def test_each_member_is_bounded_by_its_own_learned_wait() -> None:
+    """A slow first member is given up on in time for the next to answer."""
+    ble, wss = _transport(), _transport()
+    members = [Member("ble", ble), Member("wss", wss)]
+    failover = FailoverTransport(members)
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        members[0].timeouts.record("ping", 0.05)
+    bound = members[0].timeouts.get("ping")
+
+    await failover.send_command("ping", {}, timeout=30)
+
+    assert ble.send_command.await_args.kwargs["timeout"] == bound
+    # Nothing learned over the relay yet, so it gets the caller's wait.
+    members[1].latency = 1.0
+    ble.send_command.side_effect = TimeoutError
+    await failover.send_command("ping", {}, timeout=30)
+    assert wss.send_command.await_args.kwargs["timeout"] == 30
+    assert members[0].timeouts.as_dict()["ping"]["backoff"] == 1
+
+
+async def test_only_the_serialized_member_queues() -> None:
+    """The relay takes overlapping calls while Bluetooth takes one at a time."""
+    most: dict[str, int] = {}
+
+    def holding(name: str) -> Mock:
+        transport = _transport()
+        in_flight = 0
+
+        async def held(*args: object, **kwargs: object) -> dict:
+            nonlocal in_flight
+            in_flight += 1
+            most[name] = max(most.get(name, 0), in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        transport.send_command.side_effect = held
+        return transport
+
+    for member in (
+        Member("ble", holding("ble"), gate=PriorityGate(1)),
+        Member("wss", holding("wss")),
+    ):
+        failover = FailoverTransport([member])
+        await asyncio.gather(*(failover.send_command("ping", {}) for _ in range(3)))
+
+    assert most == {"ble": 1, "wss": 3}
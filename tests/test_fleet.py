@@ -0,0 +1,70 @@
+import asyncio
+from itertools import pairwise
+
+from custom_components.pitboss.const import (
+    ALL_PROTOCOLS,
+    FLEET_POLL_CONCURRENCY,
+    FLEET_STAGGER_SECONDS,
+    PROTOCOL_BLE,
+    PROTOCOL_LOCAL,
+    PROTOCOL_WSS,
+)
+from custom_components.pitboss.fleet import PollFleet
+from custom_components.pitboss.metrics import PollCycle
+
+
+def test_every_protocol_has_its_own_limit() -> None:
+    """A protocol missing here would quietly be held to one poll at a time."""
+    assert set(FLEET_POLL_CONCURRENCY) == set(ALL_PROTOCOLS)
+
+
+def test_phases_are_spread_across_the_stagger() -> None:
+    fleet = PollFleet()
+    offsets = [fleet.join(f"entry{i}", PROTOCOL_WSS).offset for i in range(8)]
+
+    assert offsets[0] == 0
+    assert all(0 <= offset < FLEET_STAGGER_SECONDS for offset in offsets)
+    # No two grills closer than a second apart, which is all the base class
+    # would have given them.
+    ordered = sorted(offsets)
+    assert min(b - a for a, b in pairwise(ordered)) >= 0.9
+
+
+def test_leaving_does_not_move_anyone_else() -> None:
+    fleet = PollFleet()
+    first = fleet.join("a", PROTOCOL_WSS)
+    second = fleet.join("b", PROTOCOL_WSS)
+    fleet.leave("a")
+
+    third = fleet.join("c", PROTOCOL_WSS)
+
+    assert second.offset != third.offset != first.offset
+    assert set(fleet.members) == {"b", "c"}
+
+
+async def test_polls_in_flight_are_capped_per_transport() -> None:
+    fleet = PollFleet()
+    limit = FLEET_POLL_CONCURRENCY[PROTOCOL_BLE]
+    members = [fleet.join(f"ble{i}", PROTOCOL_BLE) for i in range(limit + 1)]
+    local = fleet.join("local", PROTOCOL_LOCAL)
+    release = asyncio.Event()
+    peak = 0
+
+    async def poll(member) -> None:
+        nonlocal peak
+        async with member.slot(PollCycle()):
+            peak = max(peak, fleet.in_flight[PROTOCOL_BLE])
+            await release.wait()
+
+    tasks = [asyncio.create_task(poll(member)) for member in members]
+    await asyncio.sleep(0)
+    # Another transport's polls are not held up behind them.
+    async with local.slot(PollCycle()):
+        pass
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == limit
+    assert fleet.in_flight[PROTOCOL_BLE] == 0
+    assert sum(member.lag.count for member in members) == limit + 1
+    assert members[-1].lag.max_ms > 0
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from custom_components.pitboss.gate import Priority, PriorityGate
+
+
+async def test_commands_go_ahead_of_queued_reads() -> None:
+    """A command asked for mid-poll is next on the wire, not last."""
+    gate = PriorityGate(1)
+    order: list[str] = []
+    in_flight = asyncio.Event()
+    answered = asyncio.Event()
+
+    async def call(name: str, priority: Priority) -> None:
+        async with gate.slot(priority):
+            order.append(name)
+            if name == "ping":
+                in_flight.set()
+                await answered.wait()
+
+    ping = asyncio.create_task(call("ping", Priority.BACKGROUND))
+    await in_flight.wait()
+    reads = [
+        asyncio.create_task(call(name, Priority.BACKGROUND))
+        for name in ("get_info", "get_state")
+    ]
+    await asyncio.sleep(0)
+    command = asyncio.create_task(call("turn_light_on", Priority.COMMAND))
+    await asyncio.sleep(0)
+    answered.set()
+    await asyncio.gather(ping, command, *reads)
+
+    assert order == ["ping", "turn_light_on", "get_info", "get_state"]
+    assert gate.waits[Priority.COMMAND].count == 1
+    assert gate.waits[Priority.BACKGROUND].count == 3
+
+
+async def test_a_waiter_that_gives_up_does_not_hold_its_place() -> None:
+    gate = PriorityGate(1)
+    answered = asyncio.Event()
+
+    async def hold() -> None:
+        async with gate.slot(Priority.BACKGROUND):
+            await answered.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    answered.set()
+    await holder
+
+    # The place is free again: this would hang otherwise.
+    async with asyncio.timeout(1), gate.slot(Priority.COMMAND):
+        pass
+    assert gate.as_dict()["in_flight"] == 0
+
+
+async def test_without_a_limit_nothing_waits() -> None:
+    gate = PriorityGate(None)
+    async with gate.slot(Priority.BACKGROUND), gate.slot(Priority.COMMAND):
+        pass
+    assert gate.waits[Priority.COMMAND].count == 0
@@ -0,0 +1,23 @@
+"""The contract between this integration and Home Assistant's internals.
+
+Home Assistant's public helpers are covered by its own deprecation policy;
+what this integration borrows beyond them is not. These pin each private
+piece it leans on, so that a release renaming one fails here rather than
+quietly changing how the grills are polled.
+"""
+
+from inspect import getsource
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+
+def test_the_coordinator_still_places_refreshes_by_its_microsecond() -> None:
+    """`PitBossDataUpdateCoordinator._schedule_refresh` phases by `_microsecond`.
+
+    The fleet's phase is added to it for the first timed refresh and taken
+    off again. If the base class stopped reading it, every grill set up
+    together would go back to polling in the same second.
+    """
+    source = getsource(DataUpdateCoordinator._schedule_refresh)
+    assert "self._microsecond" in source
+    assert "self._microsecond =" in getsource(DataUpdateCoordinator.__init__)
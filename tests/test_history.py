@@ -0,0 +1,114 @@
+from collections.abc import Awaitable, Callable
+from time import monotonic
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pitboss.const import (
+    DOMAIN,
+    HISTORY_RESOLUTION_SECONDS,
+    PRESENCE_SILENCE_SECONDS,
+)
+from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.history import CookHistory, lttb
+
+
+def test_lttb_keeps_the_ends_and_the_peak() -> None:
+    """What averaging would flatten is what a cook is looked at for."""
+    points = [(float(x), 0.0) for x in range(100)]
+    points[57] = (57.0, 50.0)
+
+    sampled = lttb(points, 10)
+
+    assert len(sampled) == 10
+    assert sampled[0] == points[0]
+    assert sampled[-1] == points[-1]
+    assert (57.0, 50.0) in sampled
+
+
+def test_lttb_returns_short_series_whole() -> None:
+    points = [(0.0, 1.0), (1.0, 2.0), (2.0, 3.0)]
+    assert lttb(points, 10) == points
+
+
+def test_readings_faster_than_the_resolution_are_dropped() -> None:
+    history = CookHistory()
+    history.record(0.0, {"grillTemp": 200}, UnitOfTemperature.FAHRENHEIT)
+    history.record(1.0, {"grillTemp": 201}, UnitOfTemperature.FAHRENHEIT)
+    history.record(
+        HISTORY_RESOLUTION_SECONDS, {"grillTemp": 202}, UnitOfTemperature.FAHRENHEIT
+    )
+    assert history.series(0, 100, UnitOfTemperature.FAHRENHEIT) == {
+        "grill": [(0.0, 200.0), (HISTORY_RESOLUTION_SECONDS, 202.0)]
+    }
+
+
+def test_readings_are_returned_in_the_unit_asked_for() -> None:
+    """A grill switched unit mid-cook keeps one curve, not two."""
+    history = CookHistory()
+    history.record(0.0, {"p1Temp": 212, "p2Temp": None}, UnitOfTemperature.FAHRENHEIT)
+    history.record(60.0, {"p1Temp": 100}, UnitOfTemperature.CELSIUS)
+    assert history.series(0, 100, UnitOfTemperature.CELSIUS) == {
+        "probe_1": [(0.0, pytest.approx(100.0)), (60.0, 100.0)]
+    }
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_get_cook_history(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    started = dt_util.utcnow()
+    for temp in range(200, 210):
+        freezer.tick(HISTORY_RESOLUTION_SECONDS)
+        await coordinator._on_state_update({"grillTemp": temp, "p1Temp": 100})
+    device = dr.async_get(hass).async_get_device({(DOMAIN, "mygrill")})
+    assert device is not None
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_cook_history",
+        {"device_id": device.id, "start": started, "points": 5},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response is not None
+    assert response["unit"] == UnitOfTemperature.FAHRENHEIT
+    grill = response["series"]["grill"]
+    assert len(grill) == 5
+    assert grill[0][1] == 200
+    assert grill[-1][1] == 209
+    assert len(response["series"]["probe_1"]) == 5
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_a_poll_that_reads_nothing_records_nothing(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A dispatch of the last state again is not a reading of it."""
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator._on_state_update({"grillTemp": 200, "moduleIsOn": False})
+    coordinator.heard_at = monotonic() - PRESENCE_SILENCE_SECONDS - 1
+
+    for _ in range(3):
+        freezer.tick(HISTORY_RESOLUTION_SECONDS)
+        await coordinator.async_refresh()
+
+    assert coordinator.polls_skipped == 3
+    now = dt_util.utcnow().timestamp()
+    assert (
+        len(coordinator.history.series(0, now, UnitOfTemperature.FAHRENHEIT)["grill"])
+        == 1
+    )
@@ -12,19 +12,24 @@ from homeassistant.const import (
     CONF_PROTOCOL,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from pytboss.exceptions import GrillUnavailable, RPCError, Unauthorized
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.pitboss.const import (
     ACTIVE_SCAN_INTERVAL,
     CONF_ENABLE_REMOTE_START,
+    CONF_FALLBACK_PROTOCOLS,
     DOMAIN,
+    LOCAL_HTTP_CONNECTIONS,
+    LOCAL_HTTP_KEEPALIVE_SECONDS,
     PROTOCOL_BLE,
     PROTOCOL_LOCAL,
     PROTOCOL_WSS,
     STANDBY_SCAN_INTERVAL,
 )
 from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.failover import FailoverTransport
 
 pytestmark = pytest.mark.parametrize("model", ["PBV4PS2"])
 
@@ -150,7 +155,7 @@ async def test_setup_entry_ble_connects_and_forwards_platforms(
 async def test_setup_entry_local_connects_and_forwards_platforms(
     hass: HomeAssistant, mock_pitboss: Mock
 ) -> None:
-    """The local protocol builds an HttpConnection on the shared session."""
+    """The local protocol builds an HttpConnection on a session of its own."""
     with patch("pytboss.http.HttpConnection", autospec=True) as mock_http_cls:
         mock_pitboss.get_state.return_value = {}
 
@@ -172,8 +177,18 @@ async def test_setup_entry_local_connects_and_forwards_platforms(
 
     assert entry.state is ConfigEntryState.LOADED
     assert mock_http_cls.call_args.args == ("192.168.1.50",)
-    # The shared Home Assistant session, so disconnect() must not close it.
-    assert mock_http_cls.call_args.kwargs["session"] is not None
+    session = mock_http_cls.call_args.kwargs["session"]
+    assert session is not async_get_clientsession(hass)
+    assert session.connector.limit_per_host == LOCAL_HTTP_CONNECTIONS
+    assert session.connector._keepalive_timeout == LOCAL_HTTP_KEEPALIVE_SECONDS
+    assert LOCAL_HTTP_KEEPALIVE_SECONDS > STANDBY_SCAN_INTERVAL.total_seconds()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.gate.limit == LOCAL_HTTP_CONNECTIONS
+
+    # pytboss leaves a session it was given open; unloading closes it.
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert session.closed
 
 
 async def test_connect_ble_timeout_raises_not_ready(
@@ -229,6 +244,58 @@ async def test_changing_a_live_option_does_not_reload_the_entry(
     assert hass.data[DOMAIN][entry.entry_id] is coordinator_before
 
 
+async def test_fallback_protocols_build_one_transport_over_all(
+    hass: HomeAssistant, mock_wss_conn: Mock, mock_pitboss_cls: Mock
+) -> None:
+    mock_pitboss_cls.return_value.get_state.return_value = {}
+    with patch("pytboss.http.HttpConnection", autospec=True) as mock_http_cls:
+        entry = MockConfigEntry(
+            title="title",
+            domain=DOMAIN,
+            data={
+                CONF_DEVICE_ID: "mygrill",
+                CONF_MODEL: "PBV4PS2",
+                CONF_PASSWORD: "asdfasdf",
+                CONF_PROTOCOL: PROTOCOL_WSS,
+            },
+            options={
+                CONF_FALLBACK_PROTOCOLS: [PROTOCOL_LOCAL],
+                CONF_HOST: "192.168.1.50",
+            },
+            unique_id="mygrillid",
+        )
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert mock_http_cls.call_args.args == ("192.168.1.50",)
+    conn = mock_pitboss_cls.call_args.args[0]
+    assert isinstance(conn, FailoverTransport)
+    assert [member.name for member in conn.members] == [PROTOCOL_WSS, PROTOCOL_LOCAL]
+    assert hass.data[DOMAIN][entry.entry_id].transports is conn
+
+
+async def test_changing_fallback_protocols_reloads_the_entry(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    """The transports are built at setup, so choosing others needs a reload."""
+    entry = await mock_add_config_entry()
+    coordinator_before = hass.data[DOMAIN][entry.entry_id]
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            CONF_FALLBACK_PROTOCOLS: [PROTOCOL_LOCAL],
+            CONF_HOST: "192.168.1.50",
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id] is not coordinator_before
+
+
 async def test_unload_entry_stops_api(
     hass: HomeAssistant, mock_wss_conn: Mock, mock_pitboss: Mock
 ) -> None:
@@ -405,3 +472,89 @@ async def test_setup_fails_permanently_for_a_model_not_in_the_catalogue(
     await hass.async_block_till_done()
 
     assert entry.state is ConfigEntryState.SETUP_ERROR
+
+
+async def test_a_sleeping_grill_is_set_up_as_soon_as_it_advertises(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """Not at the end of a retry backoff that has grown to minutes."""
+    with (
+        patch("pytboss.ble.BleConnection", autospec=True) as mock_ble_cls,
+        patch(
+            "custom_components.pitboss.timeout",
+            side_effect=lambda _seconds: asyncio.timeout(0),
+        ),
+        patch(
+            "homeassistant.components.bluetooth.async_register_callback"
+        ) as mock_register,
+    ):
+        mock_ble_cls.return_value.is_connected.return_value = False
+        entry = MockConfigEntry(
+            title="title",
+            domain=DOMAIN,
+            data={
+                CONF_DEVICE_ID: "mygrill",
+                CONF_MODEL: "PBV4PS2",
+                CONF_PASSWORD: "asdfasdf",
+                CONF_PROTOCOL: PROTOCOL_BLE,
+            },
+            unique_id="mygrillid",
+        )
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    # The callback `_connect_ble` registered, then the wake watcher.
+    assert mock_register.call_count == 2
+    woke = mock_register.call_args.args[1]
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        woke(Mock(), Mock())
+        woke(Mock(), Mock())
+
+    mock_reload.assert_called_once_with(entry.entry_id)
+    mock_register.return_value.assert_called()
+
+
+async def test_the_wake_watcher_goes_with_the_entry(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """An entry unloaded while it waited must not be set up by its grill."""
+    with (
+        patch("pytboss.ble.BleConnection", autospec=True) as mock_ble_cls,
+        patch(
+            "custom_components.pitboss.timeout",
+            side_effect=lambda _seconds: asyncio.timeout(0),
+        ),
+        patch(
+            "homeassistant.components.bluetooth.async_register_callback"
+        ) as mock_register,
+    ):
+        mock_ble_cls.return_value.is_connected.return_value = False
+        entry = MockConfigEntry(
+            title="title",
+            domain=DOMAIN,
+            data={
+                CONF_DEVICE_ID: "mygrill",
+                CONF_MODEL: "PBV4PS2",
+                CONF_PASSWORD: "asdfasdf",
+                CONF_PROTOCOL: PROTOCOL_BLE,
+            },
+            unique_id="mygrillid",
+        )
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    unsub_wake = mock_register.return_value
+    unsub_wake.reset_mock()
+    woke = mock_register.call_args.args[1]
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    unsub_wake.assert_called_once()
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        woke(Mock(), Mock())
+    mock_reload.assert_not_called()
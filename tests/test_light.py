@@ -1,12 +1,17 @@
 from collections.abc import Awaitable, Callable
+from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
 from conftest import get_entity
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.pitboss.const import DOMAIN
+from custom_components.pitboss.const import DOMAIN, MCU_SETTLE_SECONDS
 from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
 from custom_components.pitboss.light import GrillLight
 
@@ -106,3 +111,39 @@ async def test_unavailable_when_disconnected(
     state = hass.states.get(ENTITY_ID)
     assert state is not None
     assert state.state == "unavailable"
+
+
+@pytest.mark.parametrize("model", ["PB2180LK"])
+async def test_turning_on_holds_until_the_grill_reports_it(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    """The light reads on straight away, and the grill wins after the window.
+
+    The poll straight after a command still carries the cleared status, so
+    the old value arriving inside the window must not flip the light back.
+    """
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_set_updated_data({"lightState": False})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "light", "turn_on", {"entity_id": ENTITY_ID}, blocking=True
+    )
+    coordinator.async_set_updated_data({"lightState": False})
+    await hass.async_block_till_done()
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == "on"
+
+    # The grill never took it: follow the grill once the window is up.
+    mock_pitboss.get_state.return_value = {"lightState": False}
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=MCU_SETTLE_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == "off"
@@ -0,0 +1,237 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import enable_entity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pitboss.const import (
+    DOMAIN,
+    RPC_TIMEOUT_CEILING,
+    RPC_TIMEOUT_FLOOR,
+    RPC_TIMEOUT_MIN_SAMPLES,
+)
+from custom_components.pitboss.coordinator import PitBossDataUpdateCoordinator
+from custom_components.pitboss.metrics import (
+    WINDOW_SECONDS,
+    AdaptiveTimeouts,
+    LatencyHistogram,
+    RpcLatency,
+)
+
+
+def test_an_empty_histogram_has_no_percentiles() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.percentile(0.5) is None
+    assert histogram.as_dict()["max_ms"] is None
+
+
+def test_percentiles_are_bucket_upper_bounds() -> None:
+    histogram = LatencyHistogram()
+    for seconds in (0.02,) * 19 + (0.4,):
+        histogram.record(seconds)
+    assert histogram.count == 20
+    assert histogram.percentile(0.5) == 25
+    assert histogram.percentile(0.95) == 25
+    assert histogram.percentile(1.0) == 400
+
+
+def test_a_percentile_never_exceeds_the_maximum() -> None:
+    """The bucket bound overshoots a sample that sits at its low end."""
+    histogram = LatencyHistogram()
+    histogram.record(0.011)
+    assert histogram.percentile(0.5) == pytest.approx(11)
+
+
+def test_the_overflow_bucket_reports_the_maximum() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(45.0)
+    assert histogram.percentile(0.5) == pytest.approx(45000)
+    assert histogram.as_dict()["buckets"][">30000"] == 1
+
+
+def test_merge_keeps_both_sets_of_samples() -> None:
+    a, b = LatencyHistogram(), LatencyHistogram()
+    a.record(0.005)
+    b.record(0.2)
+    merged = a.merge(b)
+    assert merged.count == 2
+    assert merged.max_ms == pytest.approx(200)
+    assert a.count == b.count == 1
+
+
+def test_the_recent_window_forgets_old_samples() -> None:
+    with patch("custom_components.pitboss.metrics.monotonic", return_value=0.0):
+        latency = RpcLatency()
+        latency.record("ping", 5.0)
+    # One window on, the old generation is still read.
+    with patch(
+        "custom_components.pitboss.metrics.monotonic", return_value=WINDOW_SECONDS
+    ):
+        latency.record("ping", 0.05)
+        assert latency.recent().max_ms == pytest.approx(5000)
+    # Two on, it is gone -- but the per-method view keeps everything.
+    with patch(
+        "custom_components.pitboss.metrics.monotonic", return_value=2 * WINDOW_SECONDS
+    ):
+        assert latency.recent().max_ms == pytest.approx(50)
+        assert latency.methods["ping"].count == 2
+
+
+def test_a_long_silence_leaves_no_recent_samples() -> None:
+    with patch("custom_components.pitboss.metrics.monotonic", return_value=0.0):
+        latency = RpcLatency()
+        latency.record("ping", 0.05)
+    with patch(
+        "custom_components.pitboss.metrics.monotonic",
+        return_value=3 * WINDOW_SECONDS,
+    ):
+        assert latency.recent().count == 0
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_every_poll_call_is_timed_by_method(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = True
+    mock_pitboss.get_state.return_value = {"moduleIsOn": True}
+    mock_pitboss.get_firmware_version.return_value = {"firmwareVersion": "0.5.7"}
+
+    await coordinator._async_update_data()
+
+    assert set(coordinator.rpc_latency.methods) == {
+        "ping",
+        "get_info",
+        "get_firmware_version",
+        "get_state",
+        "get_probe_targets",
+    }
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_a_failed_call_is_counted_not_timed(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    """A timeout measures our patience, not the grill."""
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = True
+    mock_pitboss.ping.side_effect = TimeoutError()
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert "ping" not in coordinator.rpc_latency.methods
+    assert coordinator.rpc_latency.failures["ping"] == 1
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_round_trip_sensors(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    entry = await mock_add_config_entry()
+    # Shipped disabled.
+    assert hass.states.get("sensor.mygrill_round_trip_median") is None
+
+    entity_id = await enable_entity(hass, entry, "sensor", "round_trip_max_mygrillid")
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.rpc_latency.record("get_state", 0.3)
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert float(state.state) == pytest.approx(300)
+
+
+def test_no_timeout_is_learned_from_too_few_samples() -> None:
+    timeouts = AdaptiveTimeouts()
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES - 1):
+        timeouts.record("get_state", 0.05)
+    assert timeouts.get("get_state") is None
+    assert timeouts.get("ping") is None
+
+
+def test_a_fast_link_gets_the_floor() -> None:
+    """A LAN grill answering in milliseconds is declared gone in under one."""
+    timeouts = AdaptiveTimeouts()
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        timeouts.record("ping", 0.02)
+    assert timeouts.get("ping") == RPC_TIMEOUT_FLOOR
+
+
+def test_a_slow_link_is_given_room_up_to_the_ceiling() -> None:
+    timeouts = AdaptiveTimeouts()
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        timeouts.record("ping", 0.5)
+    assert timeouts.get("ping") == pytest.approx(2.0)
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        timeouts.record("get_state", 4.0)
+    assert timeouts.get("get_state") == RPC_TIMEOUT_CEILING
+
+
+def test_a_timeout_backs_the_next_wait_off_until_an_answer() -> None:
+    timeouts = AdaptiveTimeouts()
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        timeouts.record("ping", 0.25)
+    assert timeouts.get("ping") == pytest.approx(1.0)
+    timeouts.timed_out("ping")
+    assert timeouts.get("ping") == pytest.approx(2.0)
+    for _ in range(20):
+        timeouts.timed_out("ping")
+    assert timeouts.get("ping") == RPC_TIMEOUT_CEILING
+    timeouts.record("ping", 0.25)
+    assert timeouts.get("ping") == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_the_ping_waits_as_long_as_the_grill_has_been_taking(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = True
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        coordinator.rpc_timeouts.record("ping", 0.01)
+
+    await coordinator._async_update_data()
+
+    mock_pitboss.ping.assert_awaited_once_with(timeout=RPC_TIMEOUT_FLOOR)
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_a_read_that_outlives_its_wait_fails_the_cycle(
+    hass: HomeAssistant, mock_pitboss: Mock
+) -> None:
+    coordinator = PitBossDataUpdateCoordinator(hass, DeviceInfo(), mock_pitboss)
+    coordinator._api_started = True
+    mock_pitboss.is_connected.return_value = True
+    for _ in range(RPC_TIMEOUT_MIN_SAMPLES):
+        coordinator.rpc_timeouts.record("get_state", 0.01)
+
+    async def hang() -> None:
+        await asyncio.sleep(RPC_TIMEOUT_FLOOR * 4)
+
+    mock_pitboss.get_state.side_effect = hang
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.rpc_timeouts.get("get_state") == 2 * RPC_TIMEOUT_FLOOR
+
+
+def test_the_bounds_can_be_set_per_use() -> None:
+    """The settle window uses the same arithmetic over its own bounds."""
+    windows = AdaptiveTimeouts(floor=1.5, ceiling=6.0, factor=2.0, min_samples=2)
+    windows.record("mcu", 0.1)
+    windows.record("mcu", 0.1)
+    assert windows.get("mcu") == 1.5
+    windows.record("mcu", 5.0)
+    assert windows.get("mcu") == 6.0
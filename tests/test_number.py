@@ -1,5 +1,6 @@
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -197,6 +198,8 @@ async def test_a_target_set_while_off_is_written_at_power_on(
     mock_pitboss.set_probe_target.side_effect = None
     mock_pitboss.get_probe_targets.return_value = {}
     await coordinator._async_refresh_probe_targets({"moduleIsOn": True})
+    # Seeding runs beside the poll rather than in it.
+    await hass.async_block_till_done()
 
     mock_pitboss.set_probe_target.assert_awaited_with(2, 165)
 
@@ -218,11 +221,13 @@ async def test_targets_are_seeded_only_once_per_power_cycle(
 
     for _ in range(3):
         await coordinator._async_refresh_probe_targets({"moduleIsOn": True})
+        await hass.async_block_till_done()
     assert mock_pitboss.set_probe_target.await_count == 1
 
     # Power cycle: the grill's store is wiped, so it has to be seeded again.
     await coordinator._async_refresh_probe_targets({"moduleIsOn": False})
     await coordinator._async_refresh_probe_targets({"moduleIsOn": True})
+    await hass.async_block_till_done()
     assert mock_pitboss.set_probe_target.await_count == 2
 
 
@@ -270,6 +275,7 @@ async def test_a_target_restored_after_a_power_cycle_still_reaches_the_grill(
     # The entity now restores what we were holding before the restart.
     coordinator.note_restored_target(2, 165)
     await coordinator._async_refresh_probe_targets({"moduleIsOn": True})
+    await hass.async_block_till_done()
 
     mock_pitboss.set_probe_target.assert_awaited_once_with(2, 165)
 
@@ -356,10 +362,7 @@ async def test_the_grill_wins_once_it_confirms(
     coordinator.async_set_updated_data({"p1Target": 180, "isFahrenheit": True})
     await hass.async_block_till_done()
 
-    entity = get_entity(
-        hass, "number", "number.mygrill_mpc_target", TargetProbeTemperature
-    )
-    assert entity._pending_value is None
+    assert coordinator.pending("p1Target") is None
     state = hass.states.get("number.mygrill_mpc_target")
     assert state is not None
     assert state.state == "180"
@@ -598,10 +601,7 @@ async def test_a_second_set_replaces_the_window_rather_than_queueing(
         blocking=True,
     )
 
-    entity = get_entity(
-        hass, "number", "number.mygrill_mpc_target", TargetProbeTemperature
-    )
-    assert entity._pending_value == 200
+    assert coordinator.pending("p1Target") == 200
 
     # Past when the first window would have expired, inside the second.
     freezer.tick(timedelta(seconds=2))
@@ -617,7 +617,7 @@ async def test_a_second_set_replaces_the_window_rather_than_queueing(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
 
-    assert entity._cancel_settle is None
+    assert "p1Target" not in coordinator._pending
     state = hass.states.get("number.mygrill_mpc_target")
     assert state is not None
     assert state.state == "165"
@@ -785,12 +785,12 @@ async def test_the_settle_timer_does_not_outlive_the_entry(
         {"entity_id": "climate.mygrill_grill_temperature", "temperature": 300},
         blocking=True,
     )
-    assert coordinator._cancel_setpoint_settle is not None
+    assert "grillSetTemp" in coordinator._pending
 
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
-    assert coordinator._cancel_setpoint_settle is None
+    assert not coordinator._pending
 
 
 @pytest.mark.parametrize("model", ["PBV4PS2"])
@@ -819,3 +819,59 @@ async def test_the_dial_does_not_offer_the_no_target_placeholder(
     # And the minimum it does offer survives being set.
     coordinator.probe_targets[1] = int(minimum)
     assert coordinator.probe_target(1) == int(minimum)
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_held_targets_are_seeded_in_the_first_lit_cycle(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    """Loaded before the first refresh, not restored by the entity after it."""
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}.held_targets"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}.held_targets",
+        "data": {"targets": {"2": 165}},
+    }
+    mock_pitboss.get_state.side_effect = lambda: {
+        "moduleIsOn": True,
+        "isFahrenheit": True,
+    }
+
+    entry = await mock_add_config_entry()
+    await hass.async_block_till_done()
+
+    mock_pitboss.set_probe_target.assert_awaited_once_with(2, 165)
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.restored_targets == {2: 165}
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_a_target_set_here_is_kept_for_the_next_run(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_set_updated_data({"moduleIsOn": True, "isFahrenheit": True})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": "number.mygrill_p2_target", "value": 165},
+        blocking=True,
+    )
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    key = f"{DOMAIN}.{entry.entry_id}.held_targets"
+    assert hass_storage[key]["data"] == {"targets": {"2": 165}}
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
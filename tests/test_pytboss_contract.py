@@ -12,10 +12,11 @@ the transports -- that needs a grill -- but they hold the two things most
 likely to drift apart between releases of two repos that ship separately.
 """
 
+from inspect import iscoroutinefunction
 from typing import get_type_hints
 
 import pytest
-from pytboss import grills
+from pytboss import grills, wss
 from pytboss.grills import StateDict
 
 from custom_components.pitboss.binary_sensor import (
@@ -145,3 +146,15 @@ def test_every_probe_the_grill_declares_can_actually_be_reported(
             f"{description.probe_number} ships enabled, but board "
             f"{board.name} never reports {description.key}"
         )
+
+
+def test_the_relay_transport_still_opens_its_sockets_where_we_hook_in() -> None:
+    """`SharedRelayConnection` overrides a private method of pytboss's.
+
+    Every socket the transport opens -- on connect and in its reconnect
+    loop -- goes through `_ws_connect`, which is what lets the relay manager
+    hold them back while the relay is down. Renamed, the override would
+    silently stop being called, and every grill would go back to probing the
+    relay on its own.
+    """
+    assert iscoroutinefunction(wss.WebSocketConnection._ws_connect)
@@ -0,0 +1,178 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from aiohttp import WSServerHandshakeError
+from pytboss import wss
+from pytboss.exceptions import GrillUnavailable
+
+from custom_components.pitboss.breaker import BreakerState, ReconnectBreaker
+from custom_components.pitboss.const import RELAY_REFUSED_GRILLS
+from custom_components.pitboss.relay import RelayManager, SharedRelayConnection
+
+
+def _relay() -> RelayManager:
+    relay = RelayManager()
+    # Waits short enough to sit out, and the same every time.
+    relay.breaker = ReconnectBreaker(jitter=lambda: 1.0, base=0.05, ceiling=0.1)
+    return relay
+
+
+def _unreachable() -> GrillUnavailable:
+    ex = GrillUnavailable("Cannot connect to host")
+    ex.__cause__ = OSError("Network is unreachable")
+    return ex
+
+
+def _refused() -> GrillUnavailable:
+    ex = GrillUnavailable("502, message='Invalid response status'")
+    ex.__cause__ = WSServerHandshakeError(Mock(), (), status=502)
+    return ex
+
+
+def _conn(handshake: AsyncMock | None = None) -> Mock:
+    conn = Mock(spec=SharedRelayConnection)
+    conn.handshake = handshake or AsyncMock(return_value=Mock())
+    return conn
+
+
+async def test_a_failure_holds_back_every_grill() -> None:
+    relay = _relay()
+    down = _conn(AsyncMock(side_effect=_unreachable()))
+    other = _conn()
+
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(down, wait=True)
+    assert relay.breaker.state is BreakerState.OPEN
+
+    # Not tried until the wait is up, then let through as the probe.
+    await relay.open_socket(other, wait=True)
+    other.handshake.assert_awaited_once()
+    assert relay.handshakes_held == 1
+    assert relay.breaker.state is BreakerState.CLOSED
+
+
+async def test_one_grill_turned_away_holds_back_no_one() -> None:
+    """The relay answered, so it is up; only that grill is in trouble."""
+    relay = _relay()
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(_conn(AsyncMock(side_effect=_refused())), wait=False)
+
+    assert relay.breaker.state is BreakerState.CLOSED
+    assert relay.as_dict()["grills_refused"] == 1
+    other = _conn()
+    await relay.open_socket(other, wait=False)
+    other.handshake.assert_awaited_once()
+
+
+async def test_several_grills_turned_away_hold_back_every_grill() -> None:
+    relay = _relay()
+    for _ in range(RELAY_REFUSED_GRILLS):
+        with pytest.raises(GrillUnavailable):
+            await relay.open_socket(
+                _conn(AsyncMock(side_effect=_refused())), wait=False
+            )
+
+    assert relay.breaker.state is BreakerState.OPEN
+
+
+async def test_connect_fails_fast_while_the_relay_is_down() -> None:
+    relay = _relay()
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(_conn(AsyncMock(side_effect=_unreachable())), wait=True)
+
+    conn = _conn()
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(conn, wait=False)
+
+    conn.handshake.assert_not_awaited()
+
+
+async def test_one_probe_at_a_time_then_everyone_follows() -> None:
+    relay = _relay()
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(_conn(AsyncMock(side_effect=_unreachable())), wait=True)
+    release = asyncio.Event()
+    in_flight = 0
+    most = 0
+
+    async def handshake() -> Mock:
+        nonlocal in_flight, most
+        in_flight += 1
+        most = max(most, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return Mock()
+
+    conns = [_conn(AsyncMock(side_effect=handshake)) for _ in range(4)]
+    tasks = [asyncio.create_task(relay.open_socket(c, wait=True)) for c in conns]
+    while not in_flight:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    assert in_flight == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert relay.breaker.state is BreakerState.CLOSED
+    assert relay.handshakes == 5
+
+
+async def test_a_failed_probe_waits_longer() -> None:
+    relay = _relay()
+    down = _conn(AsyncMock(side_effect=_unreachable()))
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(down, wait=True)
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(down, wait=True)
+
+    assert relay.breaker.failures == 2
+
+
+async def test_a_cancelled_probe_frees_the_turn() -> None:
+    relay = _relay()
+    with pytest.raises(GrillUnavailable):
+        await relay.open_socket(_conn(AsyncMock(side_effect=_unreachable())), wait=True)
+    stalled = asyncio.create_task(
+        relay.open_socket(_conn(AsyncMock(side_effect=asyncio.Event().wait)), True)
+    )
+    await asyncio.sleep(0.15)
+    stalled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stalled
+
+    # Nothing was learned, so the next one is the probe.
+    await relay.open_socket(_conn(), wait=True)
+    assert relay.breaker.state is BreakerState.CLOSED
+
+
+async def test_connection_waits_only_outside_connect() -> None:
+    relay = _relay()
+    relay.open_socket = AsyncMock()
+    conn = SharedRelayConnection(relay, "PBL-AABBCC", session=Mock(closed=False))
+
+    await conn._ws_connect()
+    relay.open_socket.assert_awaited_with(conn, wait=True)
+
+    with patch.object(
+        wss.WebSocketConnection, "connect", new=lambda self: self._ws_connect()
+    ):
+        await conn.connect()
+    relay.open_socket.assert_awaited_with(conn, wait=False)
+
+
+def test_connections_are_counted_until_removed() -> None:
+    relay = _relay()
+    first, second = _conn(), _conn()
+    first.is_connected.return_value = True
+    second.is_connected.return_value = False
+    relay.add("a", first)
+    relay.add("b", second)
+
+    assert relay.as_dict()["grills"] == 2
+    assert relay.as_dict()["sockets_open"] == 1
+
+    # An older setup's connection does not take a newer one with it.
+    relay.remove("a", second)
+    relay.remove("b", second)
+    assert relay.as_dict()["grills"] == 1
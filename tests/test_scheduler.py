@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.pitboss.scheduler import DeadlineScheduler
+
+
+async def test_deadlines_run_in_order_on_one_timer(hass: HomeAssistant) -> None:
+    scheduler = DeadlineScheduler(hass)
+    ran: list[str] = []
+    scheduler.schedule(2, lambda: ran.append("second"))
+    scheduler.schedule(1, lambda: ran.append("first"))
+    assert len(scheduler) == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1.5))
+    await hass.async_block_till_done()
+    assert ran == ["first"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+    assert ran == ["first", "second"]
+    assert len(scheduler) == 0
+
+
+async def test_a_cancelled_deadline_does_not_run(hass: HomeAssistant) -> None:
+    scheduler = DeadlineScheduler(hass)
+    ran: list[int] = []
+    cancel = scheduler.schedule(1, lambda: ran.append(1))
+    scheduler.schedule(2, lambda: ran.append(2))
+    cancel()
+    cancel()  # Idempotent, as `async_call_later`'s own is.
+    assert len(scheduler) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+    assert ran == [2]
+
+
+async def test_a_long_drag_does_not_grow_the_heap(hass: HomeAssistant) -> None:
+    """Scheduling and cancelling per step keeps the heap near the live count."""
+    scheduler = DeadlineScheduler(hass)
+    scheduler.schedule(60, lambda: None)
+    for _ in range(100):
+        scheduler.schedule(6, lambda: None)()
+    assert len(scheduler) == 1
+    assert len(scheduler._heap) <= 3
+    scheduler.shutdown()
+
+
+async def test_coroutines_are_run_too(hass: HomeAssistant) -> None:
+    scheduler = DeadlineScheduler(hass)
+    ran: list[bool] = []
+
+    async def job() -> None:
+        ran.append(True)
+
+    scheduler.schedule(1, job)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert ran == [True]
+
+
+async def test_shutdown_leaves_no_timer(hass: HomeAssistant) -> None:
+    scheduler = DeadlineScheduler(hass)
+    ran: list[int] = []
+    scheduler.schedule(1, lambda: ran.append(1))
+    scheduler.shutdown()
+    assert scheduler._unsub is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert ran == []
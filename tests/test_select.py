@@ -3,7 +3,6 @@ from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
-from conftest import get_entity
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import (
@@ -11,11 +10,7 @@ from pytest_homeassistant_custom_component.common import (
     async_fire_time_changed,
 )
 
-from custom_components.pitboss.const import DOMAIN
-from custom_components.pitboss.select import (
-    MCU_SETTLE_SECONDS,
-    GrillTemperatureUnitSelect,
-)
+from custom_components.pitboss.const import DOMAIN, MCU_SETTLE_SECONDS
 
 pytestmark = pytest.mark.parametrize("model", ["PBV4PS2"])
 
@@ -178,29 +173,22 @@ async def test_selections_do_not_pile_up_timers(
 ) -> None:
     """Each selection replaces the settle timer rather than adding one.
 
-    `async_on_remove` only appends, so registering per selection would grow
-    the entity's removal list for its lifetime, and every window would fire
-    once per selection made inside it.
+    Otherwise every window would fire once per selection made inside it,
+    and an early one would drop the latest selection before its own window
+    was up.
     """
     entry = await mock_add_config_entry()
     coordinator = hass.data[DOMAIN][entry.entry_id]
     coordinator.async_set_updated_data({"isFahrenheit": True})
     await hass.async_block_till_done()
-    entity = get_entity(
-        hass,
-        "select",
-        "select.mygrill_grill_temperature_unit",
-        GrillTemperatureUnitSelect,
-    )
-    removals = len(entity._on_remove or ())
     confirms = []
-    original = entity._async_confirm
+    original = coordinator._async_settle
 
-    async def counting_confirm(now):
-        confirms.append(now)
-        await original(now)
+    async def counting_settle(key):
+        confirms.append(key)
+        await original(key)
 
-    entity._async_confirm = counting_confirm  # type: ignore[method-assign]
+    coordinator._async_settle = counting_settle  # type: ignore[method-assign]
 
     for option in ("°C", "°F", "°C"):
         await hass.services.async_call(
@@ -210,7 +198,7 @@ async def test_selections_do_not_pile_up_timers(
             blocking=True,
         )
 
-    assert len(entity._on_remove or ()) == removals
+    assert list(coordinator._pending) == ["isFahrenheit"]
 
     async_fire_time_changed(
         hass, dt_util.utcnow() + timedelta(seconds=MCU_SETTLE_SECONDS + 1)
@@ -1,5 +1,6 @@
+import asyncio
 from collections.abc import Awaitable, Callable
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from homeassistant.const import CONF_PASSWORD
@@ -10,6 +11,7 @@ from pytboss.exceptions import Unauthorized
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.pitboss.const import CONF_ENABLE_REMOTE_START, DOMAIN
+from custom_components.pitboss.services import DATA_DEVICE_INDEX
 
 pytestmark = pytest.mark.parametrize("model", ["PBV4PS2"])
 
@@ -302,3 +304,190 @@ async def test_start_grill_refuses_when_already_on(
         )
 
     mock_pitboss.turn_grill_on.assert_not_awaited()
+
+
+async def test_a_set_up_grill_is_found_without_walking_the_registry(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    entry = await mock_add_config_entry()
+    device_id = _device_id(hass)
+    assert hass.data[DATA_DEVICE_INDEX]._entries == {device_id: entry.entry_id}
+    mock_pitboss.is_connected.return_value = True
+
+    with patch(
+        "custom_components.pitboss.services._walk_registry",
+        side_effect=AssertionError("walked the registry"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_grill_password",
+            {"device_id": device_id, CONF_PASSWORD: "x"},
+            blocking=True,
+        )
+
+    mock_pitboss.set_grill_password.assert_awaited_once_with("x")
+
+
+async def test_an_unloaded_grill_leaves_the_index(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    entry = await mock_add_config_entry()
+    device_id = _device_id(hass)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert device_id not in hass.data[DATA_DEVICE_INDEX]._entries
+    with pytest.raises(HomeAssistantError, match="not loaded"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_grill_password",
+            {"device_id": device_id, CONF_PASSWORD: "x"},
+            blocking=True,
+        )
+
+
+async def test_a_removed_device_is_forgotten(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    """A stale index entry must not outlive the device it names."""
+    await mock_add_config_entry()
+    device_id = _device_id(hass)
+
+    dr.async_get(hass).async_remove_device(device_id)
+    await hass.async_block_till_done()
+
+    assert device_id not in hass.data[DATA_DEVICE_INDEX]._entries
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_grill_password",
+            {"device_id": device_id, CONF_PASSWORD: "x"},
+            blocking=True,
+        )
+
+
+async def test_a_list_of_grills_is_answered_per_grill(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    """One grill that cannot do it does not stop the rest."""
+    await mock_add_config_entry()
+    device_id = _device_id(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "turn_off_grill",
+        {"device_id": [device_id, "not-a-device"]},
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_pitboss.turn_grill_off.assert_awaited_once_with()
+    assert response == {
+        "grills": {
+            device_id: {"success": True},
+            "not-a-device": {
+                "success": False,
+                "error": "Device not-a-device is not a PitBoss grill",
+            },
+        }
+    }
+
+
+async def test_a_failure_fails_the_call_without_a_response(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    await mock_add_config_entry()
+
+    with pytest.raises(HomeAssistantError, match="Failed on 1 of 2 grills"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_light",
+            {"device_id": [_device_id(hass), "not-a-device"], "state": True},
+            blocking=True,
+        )
+
+    mock_pitboss.turn_light_on.assert_awaited_once_with()
+
+
+async def test_grills_are_sent_to_side_by_side(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    """Each grill is started before any has answered."""
+    entry = await mock_add_config_entry()
+    second = MockConfigEntry(domain=DOMAIN, unique_id="other")
+    second.add_to_hass(hass)
+    other = dr.async_get(hass).async_get_or_create(
+        config_entry_id=second.entry_id, identifiers={(DOMAIN, "other")}
+    )
+    hass.data[DOMAIN][second.entry_id] = hass.data[DOMAIN][entry.entry_id]
+
+    started = 0
+    both = asyncio.Event()
+
+    async def turn_off() -> None:
+        nonlocal started
+        started += 1
+        if started == 2:
+            both.set()
+        await asyncio.wait_for(both.wait(), 1)
+
+    mock_pitboss.turn_grill_off.side_effect = turn_off
+
+    await hass.services.async_call(
+        DOMAIN,
+        "turn_off_grill",
+        {"device_id": [_device_id(hass), other.id]},
+        blocking=True,
+    )
+
+    assert started == 2
+
+
+async def test_a_probe_the_grill_lacks_is_refused(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+) -> None:
+    await mock_add_config_entry()
+
+    with pytest.raises(ServiceValidationError, match="no probe 4"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_probe_target",
+            {"device_id": _device_id(hass), "probe": 4, "temperature": 165},
+            blocking=True,
+        )
+
+    mock_pitboss.set_probe_target.assert_not_awaited()
+
+
+@pytest.mark.parametrize("temperature", [0, 50, 251])
+async def test_a_probe_target_out_of_range_is_refused(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+    mock_pitboss: Mock,
+    temperature: int,
+) -> None:
+    """The same range the probe number offers; 50 F is the board's "none"."""
+    await mock_add_config_entry()
+
+    with pytest.raises(ServiceValidationError, match="from 51 to 250"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_probe_target",
+            {"device_id": _device_id(hass), "probe": 1, "temperature": temperature},
+            blocking=True,
+        )
+
+    mock_pitboss.set_probe_target.assert_not_awaited()
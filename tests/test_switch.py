@@ -178,3 +178,37 @@ async def test_switches_still_go_unavailable_when_disconnected(
     state = hass.states.get("switch.mygrill_module_power")
     assert state is not None
     assert state.state == "unavailable"
+
+
+@pytest.mark.parametrize("model", ["PBV4PS2"])
+async def test_the_primer_holds_until_the_grill_reports_it(
+    hass: HomeAssistant,
+    mock_add_config_entry: Callable[[], Awaitable[MockConfigEntry]],
+) -> None:
+    """The primer reads on straight away, then follows the grill's report."""
+    entry = await mock_add_config_entry()
+    coordinator: PitBossDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_set_updated_data({"moduleIsOn": True, "primeState": False})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": "switch.mygrill_prime"}, blocking=True
+    )
+    # The cleared status the board reports straight after a command.
+    coordinator.async_set_updated_data({"moduleIsOn": True, "primeState": False})
+    await hass.async_block_till_done()
+    state = hass.states.get("switch.mygrill_prime")
+    assert state is not None
+    assert state.state == "on"
+
+    # The grill confirming it lets go of the held value...
+    coordinator.async_set_updated_data({"moduleIsOn": True, "primeState": True})
+    await hass.async_block_till_done()
+    assert coordinator.pending("primeState") is None
+
+    # ...so the primer finishing at the grill shows at once.
+    coordinator.async_set_updated_data({"moduleIsOn": True, "primeState": False})
+    await hass.async_block_till_done()
+    state = hass.states.get("switch.mygrill_prime")
+    assert state is not None
+    assert state.state == "off"